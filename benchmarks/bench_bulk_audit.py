@@ -0,0 +1,65 @@
+"""Whole-ledger audit: a conflicts_with double loop vs bulk_audit's backends.
+
+    python benchmarks/bench_bulk_audit.py [--public 2000] [--secret 2000]
+
+The NumPy row is skipped when NumPy is not installed (pip install .[audit]).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.models import Contract  # noqa: E402
+from orison.models.bulk_audit import _numpy, bulk_audit  # noqa: E402
+
+_CLAUSES = (
+    "Keep canals clear",
+    "Pay tithes",
+    "Dump ballast",
+    "Discharge blackwater",
+    "Report to the harbour",
+)
+
+
+def _ledger(rng: random.Random, public: int, secret: int) -> list[Contract]:
+    contracts = [Contract(f"P-{i}", "oath", rng.sample(_CLAUSES, 2)) for i in range(public)]
+    contracts += [
+        Contract(f"S-{i}", "waiver", rng.sample(_CLAUSES, 2), is_public=False)
+        for i in range(secret)
+    ]
+    return contracts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--public", type=int, default=2000)
+    parser.add_argument("--secret", type=int, default=2000)
+    args = parser.parse_args()
+
+    contracts = _ledger(random.Random(11), args.public, args.secret)
+    public = [c for c in contracts if c.is_public]
+    secret = [c for c in contracts if not c.is_public]
+
+    start = time.perf_counter()
+    loop = [(p.id, s.id) for p in public for s in secret if p.conflicts_with(s)]
+    print(f"double loop: {time.perf_counter() - start:8.3f} s  {len(loop)} conflicts")
+
+    backends = ["python"] + (["numpy"] if _numpy() is not None else [])
+    for backend in backends:
+        start = time.perf_counter()
+        result = bulk_audit(contracts, backend=backend)
+        elapsed = time.perf_counter() - start
+        assert result.pairs == loop, f"{backend} backend disagrees with conflicts_with"
+        print(f"{backend:>11}: {elapsed:8.3f} s  {len(result.pairs)} conflicts")
+    if "numpy" not in backends:
+        print("      numpy: skipped (not installed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Contract conflict checks: the per-call substring scans vs precomputed tags.
+
+    python benchmarks/bench_clause_matcher.py [--clauses 10000] [--contracts 20]
+
+Builds public and secret contracts of ``--clauses`` clauses each (the
+telling phrase, if any, near the end), checks every public/secret pair
+both ways, and verifies both rules agree.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.models import Contract  # noqa: E402
+
+_FILLER = ("Pay tithes to the lamplighters", "Report to the harbour master", "Keep the ledger open")
+_PUBLIC = ("Keep canals clear", "keep canal clear at dawn")
+_SECRET = ("Discharge blackwater at night", "dump ballast", "Store BLACKWATER casks")
+
+
+def legacy_conflicts(x: Contract, y: Contract) -> bool:
+    a = " ".join(x.clauses).lower()
+    b = " ".join(y.clauses).lower()
+
+    def mentions_clear(s: str) -> bool:
+        return "keep canals clear" in s or "keep canal clear" in s
+
+    def mentions_dump(s: str) -> bool:
+        return "dump" in s or "discharge" in s or "blackwater" in s
+
+    return (x.is_public and not y.is_public and mentions_clear(a) and mentions_dump(b)) or (
+        y.is_public and not x.is_public and mentions_clear(b) and mentions_dump(a)
+    )
+
+
+def _clauses(rng: random.Random, n: int, telling: tuple[str, ...]) -> list[str]:
+    clauses = [f"{rng.choice(_FILLER)} {i}" for i in range(n)]
+    if rng.random() < 0.7:
+        clauses[-rng.randint(1, 5)] = rng.choice(telling)
+    return clauses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clauses", type=int, default=10_000)
+    parser.add_argument("--contracts", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    start = time.perf_counter()
+    public = [
+        Contract(f"P-{i}", "oath", _clauses(rng, args.clauses, _PUBLIC))
+        for i in range(args.contracts)
+    ]
+    secret = [
+        Contract(f"S-{i}", "waiver", _clauses(rng, args.clauses, _SECRET), is_public=False)
+        for i in range(args.contracts)
+    ]
+    build = time.perf_counter() - start
+    pairs = [(p, s) for p in public for s in secret] + [(s, p) for p in public for s in secret]
+
+    start = time.perf_counter()
+    old = [legacy_conflicts(x, y) for x, y in pairs]
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    new = [x.conflicts_with(y) for x, y in pairs]
+    new_time = time.perf_counter() - start
+    assert old == new, "precomputed tags disagree with the substring rule"
+
+    n = len(pairs)
+    print(
+        f"{2 * args.contracts} contracts x {args.clauses} clauses, "
+        f"{n} checks, {sum(new)} conflicts"
+    )
+    print(f"  build (normalize + scan once): {build / (2 * args.contracts) * 1e3:8.2f} ms/contract")
+    print(f"  legacy scans:                  {old_time / n * 1e6:8.1f} us/check")
+    print(f"  precomputed tags:              {new_time / n * 1e6:8.3f} us/check")
+
+
+if __name__ == "__main__":
+    main()
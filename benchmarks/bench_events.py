@@ -0,0 +1,67 @@
+"""Mutation throughput with no subscribers, with handlers, and with a batch.
+
+    python benchmarks/bench_events.py [--turns 200000]
+
+Each turn is a goto, a flag, a reputation bump and a mark add/remove, made
+through the GameState methods that publish events.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.engine import GameState  # noqa: E402
+from orison.engine.events import EventBatch, FlagSet, SceneChanged  # noqa: E402
+from orison.models import Mark  # noqa: E402
+
+_SCENES = ("intro", "audit", "arbiter", "decision", "ritual")
+_MARK = Mark.of("T-1", "token")
+
+
+def _run(state: GameState, turns: int) -> float:
+    start = time.perf_counter()
+    for n in range(turns):
+        state.goto(_SCENES[n % 5])
+        state.set_flag("canals_black", n % 2 == 0)
+        state.adjust_rep("scribes", 1)
+        state.add_mark(_MARK)
+        state.remove_mark("T-1")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200_000)
+    args = parser.parse_args()
+
+    def none(state: GameState) -> None:
+        pass
+
+    def typed(state: GameState) -> None:
+        count = [0]
+        state.events.subscribe(lambda e: count.__setitem__(0, count[0] + 1), SceneChanged, FlagSet)
+
+    def every(state: GameState) -> None:
+        state.events.subscribe(lambda e: None)
+
+    def batch(state: GameState) -> None:
+        state.events.subscribe(EventBatch(max_pending=1024))
+
+    mutations = args.turns * 5
+    for name, setup in (("none", none), ("typed", typed), ("every", every), ("batch", batch)):
+        state = GameState(player_name="bench")
+        setup(state)
+        elapsed = _run(state, args.turns)
+        print(
+            f"{name:>6}: {mutations / elapsed / 1e6:6.2f} M mutations/s  "
+            f"{elapsed / mutations * 1e9:7.0f} ns each"
+        )
+
+
+if __name__ == "__main__":
+    main()
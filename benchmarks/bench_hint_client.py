@@ -0,0 +1,74 @@
+"""Load test: many concurrent hint requests through AsyncArbiterClient.
+
+    python benchmarks/bench_hint_client.py [--requests 5000] [--distinct 50]
+        [--delay 0.02] [--deadline 0.25]
+
+Starts the stand-in HintServer in-process (with ``--delay`` per reply) and
+fires ``--requests`` concurrent hints drawn from ``--distinct`` memories.
+Reports backend calls saved by coalescing, timeouts and latency percentiles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.server.hints import AsyncArbiterClient, HintServer, SocketHintBackend  # noqa: E402
+
+
+async def _run(args: argparse.Namespace) -> None:
+    server = HintServer(delay=args.delay)
+    await server.start()
+    backend = SocketHintBackend("127.0.0.1", server.port)
+    client = AsyncArbiterClient(backend, deadline=args.deadline)
+    rng = random.Random(3)
+    memories = [
+        f"memory {rng.randrange(args.distinct)} by the {rng.choice(['canal', 'dock', 'bell'])}"
+        for _ in range(args.requests)
+    ]
+    latencies: list[float] = []
+
+    async def one(memory: str) -> None:
+        await asyncio.sleep(rng.random() * args.spread)  # arrivals spread over a window
+        start = time.perf_counter()
+        await client.hint(memory)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(m) for m in memories))
+    finally:
+        await backend.close()
+        await server.close()
+    elapsed = time.perf_counter() - start
+
+    stats = client.stats()
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1e3  # noqa: E731
+    print(f"{stats.requests} requests in {elapsed:.2f} s ({stats.requests / elapsed:,.0f}/s)")
+    print(f"  backend calls {stats.backend_calls}  coalesced {stats.coalesced}  "
+          f"timeouts {stats.timeouts}  errors {stats.errors}")
+    print(f"  latency p50 {pct(0.5):.1f} ms  p99 {pct(0.99):.1f} ms  "
+          f"max {latencies[-1] * 1e3:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--distinct", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--deadline", type=float, default=0.25)
+    parser.add_argument(
+        "--spread", type=float, default=0.5, help="seconds over which requests arrive"
+    )
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Scene checks against a large inventory: indexed lookups vs a list scan.
+
+    python benchmarks/bench_inventory.py [--marks 20000] [--runs 1000]
+
+Runs the ritual scene's "already forged?" check ``--runs`` times against an
+inventory of ``--marks`` seals plus one sigil, once through the scene
+(``Inventory.has_kind``) and once as the old scan over a plain list.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.engine import GameState  # noqa: E402
+from orison.io.terminal.app import SCENES, ConsoleIO  # noqa: E402
+from orison.models import Mark  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--marks", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=1_000)
+    args = parser.parse_args()
+
+    marks = [Mark(f"M-{i}", "seal") for i in range(args.marks)] + [Mark("SIGIL-MEM-1", "sigil")]
+    state = GameState(current_scene_id="ritual")
+    state.inventory = marks
+    io = ConsoleIO()
+    io.write_line = lambda line: None  # type: ignore[assignment]
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        SCENES["ritual"].run(state, io, io)
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        any(m.kind == "sigil" for m in marks)
+    scan = time.perf_counter() - start
+
+    print(f"{args.runs} checks, {args.marks} marks")
+    print(f"  scene (indexed): {indexed * 1e3:8.1f} ms  {indexed / args.runs * 1e6:8.1f} us each")
+    print(f"  list scan:       {scan * 1e3:8.1f} ms  {scan / args.runs * 1e6:8.1f} us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Saves per second for the file and SQLite save stores.
+
+    python benchmarks/bench_save_store.py [--sessions 200] [--saves 20]
+
+Every session saves its own slot repeatedly, as the hosted server does at
+scene transitions; each session runs on a small thread pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.engine import GameState  # noqa: E402
+from orison.engine.store import FileSaveStore, SQLiteSaveStore  # noqa: E402
+from orison.models import Mark  # noqa: E402
+
+
+def _state(i: int) -> GameState:
+    state = GameState(player_name=f"player{i}", current_scene_id="audit")
+    for n in range(20):
+        state.add_mark(Mark(id=f"m{n}", kind="ink", is_witness=n % 3 == 0))
+    state.set_flag("canals_black")
+    state.adjust_rep("scribes", 1)
+    return state
+
+
+def run(store, sessions: int, saves: int, threads: int) -> float:
+    states = [_state(i) for i in range(sessions)]
+
+    def session(i: int) -> None:
+        for _ in range(saves):
+            states[i].save_json(f"player{i}", store=store)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(session, range(sessions)))
+    store.flush()
+    elapsed = time.perf_counter() - start
+    store.close()
+    return sessions * saves / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--saves", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            "file": FileSaveStore(Path(tmp) / "files"),
+            "sqlite": SQLiteSaveStore(Path(tmp) / "saves.db", pool_size=4),
+        }
+        for name, store in backends.items():
+            rate = run(store, args.sessions, args.saves, args.threads)
+            print(f"{name:>7}: {rate:10.0f} saves/s")
+
+
+if __name__ == "__main__":
+    main()
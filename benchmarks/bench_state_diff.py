@@ -0,0 +1,77 @@
+"""Patch size and compute time versus full-state serialization.
+
+    python benchmarks/bench_state_diff.py [--marks 500] [--flags 200] [--turns 2000]
+
+Each turn makes the kind of change a scene does (a goto, a flag, a
+reputation bump, sometimes a mark) and ships it either as a full
+``to_dict()`` JSON payload or as ``encode_patch(diff(last_snapshot, state))``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from orison.engine import GameState  # noqa: E402
+from orison.engine.diff import diff, encode_patch  # noqa: E402
+from orison.models import Mark  # noqa: E402
+
+_SCENES = ("intro", "audit", "arbiter", "decision", "ritual")
+
+
+def _state(marks: int, flags: int) -> GameState:
+    state = GameState(player_name="bench")
+    state.inventory = [Mark.of(f"M-{i}", "seal", i % 9 == 0) for i in range(marks)]
+    state.flags = {f"flag_{i}": i % 2 == 0 for i in range(flags)}
+    state.reputation = {"scribes": 0, "mariners": 0, "lamplighters": 0}
+    return state
+
+
+def _turn(state: GameState, n: int) -> None:
+    state.goto(_SCENES[n % len(_SCENES)])
+    state.set_flag(f"flag_{n % 50}", n % 3 == 0)
+    state.adjust_rep("scribes", 1)
+    if n % 10 == 0:
+        state.add_mark(Mark.of(f"T-{n}", "token"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--marks", type=int, default=500)
+    parser.add_argument("--flags", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=2000)
+    args = parser.parse_args()
+
+    state = _state(args.marks, args.flags)
+    full_bytes = 0
+    start = time.perf_counter()
+    for n in range(args.turns):
+        _turn(state, n)
+        full_bytes += len(json.dumps(state.to_dict(), separators=(",", ":")).encode("utf-8"))
+    full_time = time.perf_counter() - start
+
+    state = _state(args.marks, args.flags)
+    patch_bytes = 0
+    last = state.snapshot()
+    start = time.perf_counter()
+    for n in range(args.turns):
+        _turn(state, n)
+        patch_bytes += len(encode_patch(diff(last, state)))
+        last = state.snapshot()
+    patch_time = time.perf_counter() - start
+
+    rows = (("full", full_bytes, full_time), ("patch", patch_bytes, patch_time))
+    for name, size, elapsed in rows:
+        print(
+            f"{name:>6}: {size / args.turns:9.0f} B/turn  "
+            f"{elapsed / args.turns * 1e6:8.1f} us/turn (incl. the turn itself)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Data files shipped with the package (hint corpus, ...)."""
@@ -1,4 +1,4 @@
 from .game_state import GameState
-from .scene import Scene
+from .scene import Lookup, Prompt, Scene, SceneRunner, StepScene
 
-__all__ = ["GameState", "Scene"]
+__all__ = ["GameState", "Lookup", "Prompt", "Scene", "SceneRunner", "StepScene"]
@@ -0,0 +1,154 @@
+"""Packed save archive (``.orpk``): many sessions in one memory-mapped file.
+
+Layout, all integers little-endian::
+
+    b"ORPK" | u8 version | 3 pad | u32 count | u64 index offset
+    payload 0 | payload 1 | ...            (binary saves, engine/codec.py)
+    INDEX: u32 count | key string block | count x u64 offset | count x u32 length
+
+Opening an archive maps the file and parses only the index, so restoring
+after a restart costs one open and one small parse; each session's payload
+is decoded when (and if) that player reconnects.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import codec
+from .events import RESET
+from .game_state import GameState
+
+if TYPE_CHECKING:
+    from .lazy import SaveView
+
+ARCHIVE_MAGIC = b"ORPK"
+ARCHIVE_VERSION = 1
+ARCHIVE_EXTENSION = ".orpk"
+_HEADER = struct.Struct("<4sB3xIQ")
+
+
+def write_archive(
+    path: str | Path, items: Iterable[tuple[str, GameState]], fsync: bool = False
+) -> int:
+    """Pack ``(key, state)`` pairs into ``path``; returns the number of records.
+
+    The archive is streamed to a temp file and swapped in with ``os.replace``.
+    A repeated key keeps its last state.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    index: dict[str, tuple[int, int]] = {}
+    with tmp.open("wb") as f:
+        f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, 0))
+        off = _HEADER.size
+        for key, state in items:
+            payload = codec.encode_state(state)
+            f.write(payload)
+            index[key] = (off, len(payload))
+            off += len(payload)
+        n = len(index)
+        f.write(
+            struct.pack("<I", n)
+            + codec.str_block(index)
+            + struct.pack(f"<{n}Q", *(o for o, _ in index.values()))
+            + struct.pack(f"<{n}I", *(length for _, length in index.values()))
+        )
+        f.seek(0)
+        f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, n, off))
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp, p)
+    return len(index)
+
+
+class SaveArchive:
+    """Read-only view of an archive; use as a context manager or call ``close()``."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError("not an Orison save archive")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index = self._read_index()
+        except BaseException:
+            self._mm.close()
+            raise
+
+    def _read_index(self) -> dict[str, tuple[int, int]]:
+        mm = self._mm
+        magic, version, count, index_off = _HEADER.unpack_from(mm)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("not an Orison save archive")
+        if version != ARCHIVE_VERSION:
+            raise ValueError(f"unsupported save archive version {version}")
+        try:
+            (n,) = struct.unpack_from("<I", mm, index_off)
+            if n != count:
+                raise ValueError("corrupt save archive index")
+            keys, off = codec.read_str_block(mm, index_off + 4)
+            offsets = struct.unpack_from(f"<{n}Q", mm, off)
+            lengths = struct.unpack_from(f"<{n}I", mm, off + 8 * n)
+        except struct.error as exc:
+            raise ValueError("truncated save archive") from exc
+        return dict(zip(keys, zip(offsets, lengths, strict=True), strict=True))
+
+    def __enter__(self) -> SaveArchive:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def keys(self) -> list[str]:
+        return list(self._index)
+
+    def payload(self, key: str) -> bytes:
+        """The raw binary save for ``key`` (KeyError if absent)."""
+        off, length = self._index[key]
+        return self._mm[off:off + length]
+
+    def peek(self, key: str) -> SaveView:
+        """Header fields now, the rest on access (engine/lazy.py)."""
+        from .lazy import SaveView
+
+        return SaveView(self.payload(key))
+
+    def load_into(self, key: str, state: GameState) -> None:
+        codec.decode_into(state, self.payload(key))
+        if state.events.active:
+            state.events.publish(RESET)
+
+    def get(self, key: str) -> GameState | None:
+        if key not in self._index:
+            return None
+        state = GameState()
+        self.load_into(key, state)
+        return state
+
+    def items(self) -> Iterator[tuple[str, GameState]]:
+        for key in self._index:
+            state = GameState()
+            self.load_into(key, state)
+            yield key, state
@@ -0,0 +1,171 @@
+"""Background autosave at scene transitions.
+
+``watch()`` hooks a GameState so every ``goto`` takes a snapshot (a cheap
+``to_dict()``) and queues it; the scene never waits on the disk. One writer
+thread serializes and writes the snapshots, keeping only the newest one per
+session, so a burst of transitions costs a single write. Files are written
+via temp file + ``os.replace`` and are never torn. Each write is recorded
+in its directory's manifest (engine/manifest.py), like a manual save, so
+Load and Continue menus can reach autosaves.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import codec
+from .events import SceneChanged
+from .game_state import GameState, atomic_write
+from .manifest import SaveManifest
+
+
+@dataclass
+class AutosaveStats:
+    """Counters for sizing and alerting; staleness is submit-to-durable, in seconds."""
+
+    submitted: int = 0
+    written: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    pending: int = 0
+    last_staleness: float = 0.0
+    max_staleness: float = 0.0
+
+
+class _Watch:
+    __slots__ = ("service", "state", "key", "path", "skip")
+
+    def __init__(
+        self, service: AutosaveService, state: GameState, key: str, path: Path, skip: frozenset
+    ) -> None:
+        self.service = service
+        self.state = state
+        self.key = key
+        self.path = path
+        self.skip = skip
+
+    def __call__(self, event: SceneChanged) -> None:
+        if event.scene_id not in self.skip:
+            self.service.submit(self.key, self.state, self.path)
+
+
+class AutosaveService:
+    def __init__(
+        self,
+        directory: str | Path = "save_game/autosave",
+        fmt: str = "json",
+        fsync: bool = False,
+        manifest: bool = True,
+    ) -> None:
+        self.directory = Path(directory)
+        self.fmt = fmt
+        self.fsync = fsync
+        self.manifest = manifest
+        self._pending: dict[str, tuple[Path, dict, float]] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._stats = AutosaveStats()
+        self._thread = threading.Thread(target=self._run, name="orison-autosave", daemon=True)
+        self._thread.start()
+
+    def path_for(self, key: str) -> Path:
+        suffix = codec.EXTENSION if self.fmt == "binary" else ".json"
+        return self.directory / f"{key}{suffix}"
+
+    def watch(
+        self,
+        state: GameState,
+        key: str,
+        path: str | Path | None = None,
+        skip: Iterable[str] = (),
+    ) -> None:
+        """Autosave ``state`` under ``key`` whenever it transitions scenes.
+
+        Transitions into a scene in ``skip`` (e.g. the one that quits) are
+        not saved, so the autosave keeps the last scene worth resuming.
+        """
+        target = Path(path) if path else self.path_for(key)
+        state.events.subscribe(_Watch(self, state, key, target, frozenset(skip)), SceneChanged)
+
+    def unwatch(self, state: GameState) -> None:
+        for handler in state.events.handlers():
+            if isinstance(handler, _Watch) and handler.service is self:
+                state.events.unsubscribe(handler)
+
+    def submit(self, key: str, state: GameState, path: str | Path | None = None) -> None:
+        snapshot = state.to_dict()  # taken now; serialized and written off-thread
+        target = Path(path) if path else self.path_for(key)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("autosave service is closed")
+            previous = self._pending.get(key)
+            # keep the first submit time so staleness covers the whole burst
+            submitted_at = previous[2] if previous else time.monotonic()
+            if previous:
+                self._stats.coalesced += 1
+            self._pending[key] = (target, snapshot, submitted_at)
+            self._stats.submitted += 1
+            self._cond.notify()
+
+    def stats(self) -> AutosaveStats:
+        with self._cond:
+            current = AutosaveStats(**vars(self._stats))
+            current.pending = len(self._pending)
+            if self._pending:
+                oldest = min(t for _, _, t in self._pending.values())
+                current.max_staleness = max(current.max_staleness, time.monotonic() - oldest)
+            return current
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything submitted so far is on disk."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending and self._closed:
+                    return
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            for target, snapshot, submitted_at in batch.values():
+                try:
+                    self._write(target, snapshot)
+                    ok = True
+                except (OSError, ValueError, TypeError):
+                    ok = False
+                with self._cond:
+                    if ok:
+                        staleness = time.monotonic() - submitted_at
+                        self._stats.written += 1
+                        self._stats.last_staleness = staleness
+                        self._stats.max_staleness = max(self._stats.max_staleness, staleness)
+                    else:
+                        self._stats.errors += 1
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def _write(self, target: Path, snapshot: dict) -> None:
+        state = None
+        if target.suffix == codec.EXTENSION:
+            state = GameState.from_dict(snapshot)
+            data = codec.encode_state(state)
+        else:
+            data = json.dumps(snapshot, ensure_ascii=False, indent=2).encode("utf-8")
+        atomic_write(target, data, self.fsync)
+        if self.manifest:
+            SaveManifest(target.parent).record(target, state or GameState.from_dict(snapshot), data)
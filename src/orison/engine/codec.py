@@ -0,0 +1,327 @@
+"""Compact binary save format (``.orsb``).
+
+Layout, all integers little-endian::
+
+    b"ORSB" | u8 format version | u16 schema version
+           | HEAD | STRINGS | INVENTORY | FLAGS | REPUTATION
+
+The schema version is the one ``to_dict`` stamps (engine/migrations.py). A
+save from an older schema is decoded to a document and run through
+``migrate()`` before it is loaded. Format 1 files have no schema field and
+were written at schema 1.
+
+Every section is a u32 byte length followed by its payload, so a reader can
+skip what it does not need. Mark kinds, flag keys and faction names are
+written once into STRINGS and referenced by index; columns are packed as
+fixed-width arrays so both directions are a handful of ``struct`` calls.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from collections.abc import Iterable
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from .migrations import SCHEMA_VERSION
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+MAGIC = b"ORSB"
+FORMAT_VERSION = 2
+EXTENSION = ".orsb"
+
+# flag value tags
+_FALSE, _TRUE, _NONE, _INT, _STR, _FLOAT, _JSON = range(7)
+
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+
+
+def is_binary(data: bytes) -> bool:
+    return data[:4] == MAGIC
+
+
+class _Strings:
+    """Interning table built while encoding."""
+
+    __slots__ = ("index", "items")
+
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.items: list[str] = []
+
+    def ref(self, text: str) -> int:
+        idx = self.index.get(text)
+        if idx is None:
+            idx = self.index[text] = len(self.items)
+            self.items.append(text)
+        return idx
+
+
+def str_block(strs: Iterable[str]) -> bytes:
+    """A string block: ``u32 count | count x u32 byte length | UTF-8 bytes``."""
+    encoded = [s.encode("utf-8") for s in strs]
+    n = len(encoded)
+    return struct.pack(f"<I{n}I", n, *map(len, encoded)) + b"".join(encoded)
+
+
+def read_str_block(data: bytes, off: int, intern: bool = False) -> tuple[list[str], int]:
+    """Read a ``str_block`` at ``off``; returns the strings and the offset after it."""
+    (n,) = _U32.unpack_from(data, off)
+    off += 4
+    lens = struct.unpack_from(f"<{n}I", data, off)
+    off += 4 * n
+    ends = list(accumulate(lens))
+    total = ends[-1] if ends else 0
+    blob = data[off:off + total]
+    starts = [0, *ends[:-1]]  # one longer than ends when there are no strings
+    if blob.isascii():  # the common case: decode once and slice by character
+        text = blob.decode("ascii")
+        out = [text[a:b] for a, b in zip(starts, ends, strict=False)]
+    else:
+        out = [blob[a:b].decode("utf-8") for a, b in zip(starts, ends, strict=False)]
+    if intern:
+        out = list(map(sys.intern, out))
+    return out, off + total
+
+
+def _section(payload: bytes) -> bytes:
+    return _U32.pack(len(payload)) + payload
+
+
+def encode_state(state: GameState) -> bytes:
+    strings = _Strings()
+
+    head = struct.pack("<B", bool(state.running)) + str_block(
+        [state.player_name, state.current_scene_id]
+    )
+
+    inv = state.inventory
+    n = len(inv)
+    inventory = (
+        _U32.pack(n)
+        + str_block(m.id for m in inv)
+        + struct.pack(f"<{n}I", *(strings.ref(m.kind) for m in inv))
+        + bytes(bool(m.is_witness) for m in inv)
+    )
+
+    keys: list[int] = []
+    tags = bytearray()
+    ints: list[int] = []
+    floats: list[float] = []
+    texts: list[str] = []
+    for key, value in state.flags.items():
+        keys.append(strings.ref(key))
+        if value is True:
+            tags.append(_TRUE)
+        elif value is False:
+            tags.append(_FALSE)
+        elif value is None:
+            tags.append(_NONE)
+        elif type(value) is int and -(1 << 63) <= value < (1 << 63):
+            tags.append(_INT)
+            ints.append(value)
+        elif type(value) is str:
+            tags.append(_STR)
+            texts.append(value)
+        elif type(value) is float:
+            tags.append(_FLOAT)
+            floats.append(value)
+        else:
+            tags.append(_JSON)
+            texts.append(json.dumps(value, ensure_ascii=False))
+    flags = (
+        struct.pack(f"<I{len(keys)}I", len(keys), *keys)
+        + bytes(tags)
+        + struct.pack(f"<I{len(ints)}q", len(ints), *ints)
+        + struct.pack(f"<I{len(floats)}d", len(floats), *floats)
+        + str_block(texts)
+    )
+
+    rep = state.reputation
+    for faction, value in rep.items():
+        # bool is an int subclass, but would decode as 0/1: refuse it like any non-int
+        is_int = isinstance(value, int) and not isinstance(value, bool)
+        if not is_int or not -(1 << 63) <= value < (1 << 63):
+            raise ValueError(
+                f"reputation {faction!r} is {value!r}; binary saves hold 64-bit integers"
+            )
+    m = len(rep)
+    reputation = struct.pack(
+        f"<I{m}I{m}q", m, *(strings.ref(f) for f in rep), *rep.values()
+    )
+
+    return b"".join(
+        [
+            MAGIC,
+            struct.pack("<BH", FORMAT_VERSION, SCHEMA_VERSION),
+            _section(head),
+            _section(str_block(strings.items)),
+            _section(inventory),
+            _section(flags),
+            _section(reputation),
+        ]
+    )
+
+
+def _header(data: bytes) -> tuple[int, int]:
+    """Validate the header; returns (schema version, offset of the first section)."""
+    if not is_binary(data):
+        raise ValueError("not an Orison binary save")
+    version = data[4] if len(data) > 4 else None
+    if version == 1:
+        return 1, 5
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary save version {version}")
+    if len(data) < 7:
+        raise ValueError("truncated binary save")
+    return _U16.unpack_from(data, 5)[0], 7
+
+
+def schema_version(data: bytes) -> int:
+    """The save schema version a binary save was written at."""
+    return _header(data)[0]
+
+
+def split_sections(data: bytes) -> list[tuple[int, int]]:
+    """Return (offset, length) for each section after validating the header."""
+    _, off = _header(data)
+    spans: list[tuple[int, int]] = []
+    try:
+        for _ in range(5):
+            (length,) = _U32.unpack_from(data, off)
+            off += 4
+            if off + length > len(data):
+                raise ValueError("truncated binary save")
+            spans.append((off, length))
+            off += length
+    except struct.error as exc:
+        raise ValueError("truncated binary save") from exc
+    return spans
+
+
+def decode_head(data: bytes, span: tuple[int, int]) -> tuple[str, str, bool]:
+    off, _ = span
+    running = bool(data[off])
+    (name, scene), _ = read_str_block(data, off + 1)
+    return name, sys.intern(scene), running
+
+
+def decode_strings(data: bytes, span: tuple[int, int]) -> list[str]:
+    return read_str_block(data, span[0], intern=True)[0]
+
+
+def decode_inventory(
+    data: bytes, span: tuple[int, int], strings: list[str]
+) -> tuple[list[str], list[str], list[bool]]:
+    """Return the inventory as (ids, kinds, is_witness) columns."""
+    off, _ = span
+    (n,) = _U32.unpack_from(data, off)
+    ids, off = read_str_block(data, off + 4)
+    kinds = [strings[k] for k in struct.unpack_from(f"<{n}I", data, off)]
+    off += 4 * n
+    witness = [b != 0 for b in data[off:off + n]]
+    return ids, kinds, witness
+
+
+def decode_flags(data: bytes, span: tuple[int, int], strings: list[str]) -> dict[str, object]:
+    off, _ = span
+    (n,) = _U32.unpack_from(data, off)
+    keys = struct.unpack_from(f"<{n}I", data, off + 4)
+    off += 4 + 4 * n
+    tags = data[off:off + n]
+    off += n
+    (ni,) = _U32.unpack_from(data, off)
+    ints = iter(struct.unpack_from(f"<{ni}q", data, off + 4))
+    off += 4 + 8 * ni
+    (nf,) = _U32.unpack_from(data, off)
+    floats = iter(struct.unpack_from(f"<{nf}d", data, off + 4))
+    off += 4 + 8 * nf
+    texts = iter(read_str_block(data, off)[0])
+    flags: dict[str, object] = {}
+    for key, tag in zip(keys, tags, strict=True):
+        if tag == _TRUE:
+            value: object = True
+        elif tag == _FALSE:
+            value = False
+        elif tag == _NONE:
+            value = None
+        elif tag == _INT:
+            value = next(ints)
+        elif tag == _STR:
+            value = next(texts)
+        elif tag == _FLOAT:
+            value = next(floats)
+        elif tag == _JSON:
+            value = json.loads(next(texts))
+        else:
+            raise ValueError(f"unknown flag tag {tag}")
+        flags[strings[key]] = value
+    return flags
+
+
+def decode_reputation(data: bytes, span: tuple[int, int], strings: list[str]) -> dict[str, int]:
+    off, _ = span
+    (n,) = _U32.unpack_from(data, off)
+    values = struct.unpack_from(f"<{n}I{n}q", data, off + 4)
+    return {strings[values[i]]: values[n + i] for i in range(n)}
+
+
+def _decode(data: bytes) -> tuple:
+    head, strs, inv, flags, rep = split_sections(data)
+    try:
+        strings = decode_strings(data, strs)
+        return (
+            *decode_head(data, head),
+            decode_inventory(data, inv, strings),
+            decode_flags(data, flags, strings),
+            decode_reputation(data, rep, strings),
+        )
+    except (struct.error, IndexError, StopIteration, UnicodeDecodeError) as exc:
+        raise ValueError("corrupt binary save") from exc
+
+
+def decode_dict(data: bytes) -> dict:
+    """A binary save as a ``to_dict`` document, stamped with its own schema version."""
+    version = schema_version(data)
+    name, scene, running, (ids, kinds, witness), flags, reputation = _decode(data)
+    return {
+        "version": version,
+        "player_name": name,
+        "current_scene_id": scene,
+        "running": running,
+        "inventory": [
+            {"id": i, "kind": k, "is_witness": w}
+            for i, k, w in zip(ids, kinds, witness, strict=True)
+        ],
+        "flags": flags,
+        "reputation": reputation,
+    }
+
+
+def decode_into(state: GameState, data: bytes) -> None:
+    """Load a binary save straight into ``state`` (no intermediate GameState).
+
+    A save from an older schema goes through ``migrate()`` first.
+    """
+    from ..models import Inventory, Mark
+
+    if schema_version(data) != SCHEMA_VERSION:
+        from .game_state import GameState
+
+        old = GameState.from_dict(decode_dict(data))  # from_dict runs migrate()
+        name, scene, running = old.player_name, old.current_scene_id, old.running
+        inventory, flag_map, reputation = old.inventory, old.flags, old.reputation
+    else:
+        name, scene, running, columns, flag_map, reputation = _decode(data)
+        inventory = Inventory(map(Mark.of, *columns))
+    state.player_name = name
+    state.current_scene_id = scene
+    state.running = running
+    state.inventory = inventory
+    state.flags = flag_map
+    state.reputation = reputation
@@ -0,0 +1,165 @@
+"""State patches for sync and replication.
+
+``diff(old, new)`` compares two GameStates (or StateSnapshots) and returns a
+``StatePatch`` holding only what differs: changed scalar fields, flag and
+reputation keys set or removed, and marks added or removed by id. Values
+in a patch are absolute (``scribes -> 3``, not ``+1``), so applying a patch
+twice is the same as applying it once.
+
+Containers that a snapshot still shares with the state (engine/snapshot.py)
+are skipped by identity, so diffing a state against its last snapshot
+only walks what was written since.
+
+Wire form (``encode_patch``) is a compact JSON array::
+
+    [1, {scalars}, {flags set}, [flags unset], {rep set}, [rep unset],
+     [[id, kind, is_witness], ...], [removed ids]]
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .flags import FlagStore
+    from .game_state import GameState
+    from .snapshot import StateSnapshot
+
+    StateLike = GameState | StateSnapshot
+
+from .events import RESET
+from .flags import _NAMES
+
+PATCH_VERSION = 1
+_SCALARS = ("player_name", "current_scene_id", "running")
+
+
+@dataclass
+class StatePatch:
+    scalars: dict[str, object] = field(default_factory=dict)
+    flags_set: dict[str, object] = field(default_factory=dict)
+    flags_unset: list[str] = field(default_factory=list)
+    rep_set: dict[str, int] = field(default_factory=dict)
+    rep_unset: list[str] = field(default_factory=list)
+    marks_added: list[tuple[str, str, bool]] = field(default_factory=list)
+    marks_removed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any(vars(self).values())
+
+
+def _dict_delta(old: dict, new: dict, set_out: dict, unset_out: list) -> None:
+    if old is new:
+        return
+    for key, value in new.items():
+        if key not in old or old[key] != value or type(old[key]) is not type(value):
+            set_out[key] = value
+    unset_out.extend(key for key in old if key not in new)
+
+
+def _flag_delta(old: FlagStore, new: FlagStore, patch: StatePatch) -> None:
+    """Declared flags compare as bitmasks; only the side tables compare key by key."""
+    _dict_delta(old._other, new._other, patch.flags_set, patch.flags_unset)
+    changed = (old._present ^ new._present) | ((old._values ^ new._values) & new._present)
+    bit = 0
+    while changed:
+        if changed & 1:
+            name = _NAMES[bit]
+            if new._present >> bit & 1:
+                patch.flags_set[name] = bool(new._values >> bit & 1)
+            elif name not in new._other:
+                patch.flags_unset.append(name)
+        changed >>= 1
+        bit += 1
+    if patch.flags_unset and patch.flags_set:  # a key that moved between bitset and side table
+        patch.flags_unset[:] = [k for k in patch.flags_unset if k not in new]
+
+
+def diff(old: StateLike, new: StateLike) -> StatePatch:
+    patch = StatePatch()
+    for name in _SCALARS:
+        value = getattr(new, name)
+        if getattr(old, name) != value:
+            patch.scalars[name] = value
+
+    _flag_delta(old.flags, new.flags, patch)
+
+    _dict_delta(old.reputation._data, new.reputation._data, patch.rep_set, patch.rep_unset)
+
+    oi, ni = old.inventory._by_id, new.inventory._by_id
+    if oi is not ni:
+        for mark_id, mark in ni.items():
+            prev = oi.get(mark_id)
+            if prev is not mark and prev != mark:
+                if prev is not None:
+                    patch.marks_removed.append(mark_id)  # same id, different mark: replace
+                patch.marks_added.append((mark.id, mark.kind, mark.is_witness))
+        patch.marks_removed.extend(mark_id for mark_id in oi if mark_id not in ni)
+    return patch
+
+
+def apply_patch(state: GameState, patch: StatePatch) -> None:
+    """Bring ``state`` up to the patch's target (safe to repeat)."""
+    from ..models import Mark
+
+    for name, value in patch.scalars.items():
+        if name == "current_scene_id":
+            if state.current_scene_id != value:
+                state.goto(value)
+        else:
+            setattr(state, name, value)
+    for key, value in patch.flags_set.items():
+        state.set_flag(key, value)
+    for key in patch.flags_unset:
+        state.clear_flag(key)
+    for faction, value in patch.rep_set.items():
+        current = state.get_rep(faction)
+        if current != value:
+            state.adjust_rep(faction, value - current)
+    if any(f in state.reputation for f in patch.rep_unset):
+        state.reputation = {k: v for k, v in state.reputation.items() if k not in patch.rep_unset}
+        if state.events.active:  # there is no per-faction removal event
+            state.events.publish(RESET)
+    for mark_id in patch.marks_removed:
+        state.remove_mark(mark_id)
+    for mark_id, kind, is_witness in patch.marks_added:
+        held = state.inventory.get(mark_id)
+        mark = Mark.of(mark_id, kind, is_witness)
+        if held is not None and held != mark:
+            state.remove_mark(mark_id)
+        state.add_mark(mark)
+
+
+def encode_patch(patch: StatePatch) -> bytes:
+    body = [
+        PATCH_VERSION,
+        patch.scalars,
+        patch.flags_set,
+        patch.flags_unset,
+        patch.rep_set,
+        patch.rep_unset,
+        patch.marks_added,
+        patch.marks_removed,
+    ]
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_patch(data: bytes) -> StatePatch:
+    try:
+        fields = json.loads(data)
+        version, scalars, flags_set, flags_unset, rep_set, rep_unset, added, removed = fields
+    except (TypeError, ValueError) as exc:
+        raise ValueError("corrupt state patch") from exc
+    if version != PATCH_VERSION:
+        raise ValueError(f"unsupported state patch version {version}")
+    return StatePatch(
+        scalars=scalars,
+        flags_set=flags_set,
+        flags_unset=flags_unset,
+        rep_set=rep_set,
+        rep_unset=rep_unset,
+        marks_added=[(i, k, bool(w)) for i, k, w in added],
+        marks_removed=removed,
+    )
@@ -0,0 +1,137 @@
+"""Typed state-mutation events on a synchronous, allocation-light bus.
+
+Every GameState owns an ``EventBus`` (``state.events``). The mutation
+methods (``goto``, ``set_flag``, ``clear_flag``, ``adjust_rep``,
+``add_mark``, ``remove_mark``) publish one small NamedTuple event. Loads
+and restores publish ``RESET``. Handlers run inline, in subscription
+order.
+
+The no-subscriber path costs one attribute check: ``bus.active`` is a
+plain bool, and events are only built when it is true. ``EventBatch``
+is a subscriber that queues events for a consumer to drain in batches.
+It can be bounded, in which case it drops the oldest events and counts
+them.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from ..models import Mark
+
+
+class SceneChanged(NamedTuple):
+    scene_id: str
+
+
+class FlagSet(NamedTuple):
+    key: str
+    value: object
+
+
+class FlagCleared(NamedTuple):
+    key: str
+
+
+class RepAdjusted(NamedTuple):
+    faction: str
+    delta: int
+
+
+class MarkAdded(NamedTuple):
+    mark: Mark
+
+
+class MarkRemoved(NamedTuple):
+    mark_id: str
+
+
+class StateReset(NamedTuple):
+    """The whole state was replaced (load, restore, patch); rebuild from scratch."""
+
+
+RESET = StateReset()
+
+Event = (
+    SceneChanged | FlagSet | FlagCleared | RepAdjusted | MarkAdded | MarkRemoved | StateReset
+)
+Handler = Callable[[Event], None]
+
+
+class EventBus:
+    __slots__ = ("active", "_any", "_by_type")
+
+    def __init__(self) -> None:
+        self.active = False  # any subscriber at all; publishers check this first
+        # tuples are replaced, never mutated: subscribing is rare, and publishing
+        # iterates safely even if a handler unsubscribes itself
+        self._any: tuple[Handler, ...] = ()
+        self._by_type: dict[type, tuple[Handler, ...]] | None = None
+
+    def subscribe(self, handler: Handler, *types: type) -> Handler:
+        """Call ``handler(event)`` for ``types`` (every event if none are given)."""
+        if types:
+            if self._by_type is None:
+                self._by_type = {}
+            for t in types:
+                self._by_type[t] = (*self._by_type.get(t, ()), handler)
+        else:
+            self._any = (*self._any, handler)
+        self.active = True
+        return handler
+
+    def unsubscribe(self, handler: Handler) -> None:
+        self._any = tuple(h for h in self._any if h != handler)
+        if self._by_type:
+            pruned = {t: tuple(h for h in hs if h != handler) for t, hs in self._by_type.items()}
+            self._by_type = {t: hs for t, hs in pruned.items() if hs} or None
+        self.active = bool(self._any or self._by_type)
+
+    def subscribed(self, handler: Handler) -> bool:
+        return handler in self._any or any(handler in hs for hs in (self._by_type or {}).values())
+
+    def handlers(self) -> list[Handler]:
+        """Every subscribed handler once, in subscription order per type."""
+        seen: dict[int, Handler] = {id(h): h for h in self._any}
+        for hs in (self._by_type or {}).values():
+            for h in hs:
+                seen.setdefault(id(h), h)
+        return list(seen.values())
+
+    def publish(self, event: Event) -> None:
+        if self._by_type:
+            for handler in self._by_type.get(type(event), ()):
+                handler(event)
+        for handler in self._any:
+            handler(event)
+
+
+class EventBatch:
+    """Subscriber that queues events; ``drain()`` hands them over as one list.
+
+    With ``max_pending`` set, the oldest events are dropped (and counted in
+    ``dropped``) once that many are waiting.
+    """
+
+    __slots__ = ("_queue", "dropped")
+
+    def __init__(self, max_pending: int | None = None) -> None:
+        self._queue: deque[Event] = deque(maxlen=max_pending)
+        self.dropped = 0
+
+    def __call__(self, event: Event) -> None:
+        queue = self._queue
+        if queue.maxlen is not None and len(queue) == queue.maxlen:
+            self.dropped += 1
+        queue.append(event)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def drain(self) -> list[Event]:
+        events = list(self._queue)
+        self._queue.clear()
+        return events
@@ -0,0 +1,88 @@
+"""Stable fingerprints of GameState projections, and a render cache keyed by them.
+
+A ``Projection`` names the few parts of a state that some output depends
+on (flags, reputation factions, whether a witness mark or a mark kind is
+held). ``Projection.fingerprint(state)`` serializes just those values
+canonically (sorted, typed JSON) and hashes them with BLAKE2b, so equal
+projections give equal fingerprints in every process and across restarts.
+
+``RenderCache`` is an opt-in LRU for scene output keyed by
+``(scene id, fingerprint)``: a scene renders once per distinct projection
+and later visits reuse the lines. Hits, misses and evictions are counted.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .game_state import GameState
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Projection:
+    flags: tuple[str, ...] = ()
+    reputation: tuple[str, ...] = ()
+    kinds: tuple[str, ...] = ()
+    witness: bool = False
+
+    def values(self, state: GameState) -> list:
+        """The projected values, in a canonical order."""
+        flags = state.flags
+        return [
+            {k: flags[k] for k in sorted(self.flags) if k in flags},  # absent != None
+            [state.get_rep(f) for f in sorted(self.reputation)],
+            [state.inventory.has_kind(k) for k in sorted(self.kinds)],
+            state.inventory.has_witness if self.witness else None,
+        ]
+
+    def fingerprint(self, state: GameState) -> str:
+        canonical = json.dumps(
+            self.values(state), sort_keys=True, separators=(",", ":"), default=repr
+        )
+        return blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class RenderCache(Generic[T]):
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], T] = OrderedDict()
+        self._stats = CacheStats()
+
+    def get_or_render(self, scene_id: str, fingerprint: str, render: Callable[[], T]) -> T:
+        key = (scene_id, fingerprint)
+        entries = self._entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self._stats.misses += 1
+            value = entries[key] = render()
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self._stats.evictions += 1
+            return value
+        entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        stats = self._stats
+        return CacheStats(stats.hits, stats.misses, stats.evictions, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,212 @@
+"""Story flags: declared booleans in a bitset, everything else in a side table.
+
+Boolean story flags are declared once per process with ``declare_flags``;
+each gets a bit. A ``FlagStore`` keeps two ints for them (which flags are
+present, and their values) and a small dict for any other flag, such as
+``policy = "secret"``, or a declared flag holding a non-bool value. It is
+a MutableMapping, so scenes keep using ``flags.get(...)``,
+``flags[key] = ...`` and ``in``.
+
+Every write or delete records its key in ``dirty`` (a bit for declared
+flags, a lazily made set for the rest). A saver or sync consumer calls
+``take_dirty(owner)`` to learn what changed since it last looked, so its
+cost follows the number of changed flags, not the total. Taking clears the
+set, so a store has one owner: the first ``take_dirty`` claims it and a
+different owner gets a RuntimeError instead of silently stealing changes
+(``release_dirty`` hands it back). Copies and snapshots start unowned.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager
+
+_BITS: dict[str, int] = {}
+_NAMES: list[str] = []
+_UNOWNED = object()
+
+
+def declare_flags(*names: str) -> None:
+    """Give each boolean flag a bit (declaring a name twice is a no-op)."""
+    for name in names:
+        if name not in _BITS:
+            _BITS[sys.intern(name)] = len(_NAMES)
+            _NAMES.append(sys.intern(name))
+
+
+def declared_flags() -> list[str]:
+    return list(_NAMES)
+
+
+@contextmanager
+def flag_scope(*names: str) -> Iterator[None]:
+    """Declare ``names`` only for the ``with`` block (tools and tests).
+
+    Every bit handed out inside the block is withdrawn on exit, so stores
+    built inside it must not outlive it.
+    """
+    mark = len(_NAMES)
+    declare_flags(*names)
+    try:
+        yield
+    finally:
+        for name in _NAMES[mark:]:
+            del _BITS[name]
+        del _NAMES[mark:]
+
+
+class FlagStore(MutableMapping):
+    __slots__ = (
+        "_present", "_values", "_other", "_shared", "_dirty_bits", "_dirty_other", "_owner"
+    )
+
+    def __init__(self, items: Iterable[tuple[str, object]] | Mapping[str, object] = ()) -> None:
+        self._present = 0
+        self._values = 0
+        self._other: dict[str, object] = {}
+        self._shared = False  # _other is shared with a snapshot; copy before writing
+        self._dirty_bits = 0  # dirty declared flags, as a mask
+        self._dirty_other: set[str] | None = None  # dirty side-table keys, made on demand
+        self._owner: object = _UNOWNED  # the one consumer of take_dirty()
+        for key, value in items.items() if isinstance(items, Mapping) else items:
+            self[key] = value
+        self._dirty_bits, self._dirty_other = 0, None  # a freshly built store is clean
+
+    def __getitem__(self, key: str) -> object:
+        bit = _BITS.get(key)
+        if bit is not None and self._present >> bit & 1:
+            return bool(self._values >> bit & 1)
+        return self._other[key]
+
+    def get(self, key: str, default: object = None) -> object:
+        bit = _BITS.get(key)
+        if bit is not None and self._present >> bit & 1:
+            return bool(self._values >> bit & 1)
+        return self._other.get(key, default)
+
+    def __setitem__(self, key: str, value: object) -> None:
+        bit = _BITS.get(key)
+        if bit is not None and type(value) is bool:
+            mask = 1 << bit
+            self._present |= mask
+            if value:
+                self._values |= mask
+            else:
+                self._values &= ~mask
+            if key in self._other:
+                if self._shared:
+                    self._own()
+                del self._other[key]
+            self._dirty_bits |= mask
+        else:
+            if bit is not None:
+                self._present &= ~(1 << bit)
+                self._values &= ~(1 << bit)
+            if self._shared:
+                self._own()
+            self._other[sys.intern(key)] = value
+            self._mark_other(key, bit)
+
+    def __delitem__(self, key: str) -> None:
+        bit = _BITS.get(key)
+        if bit is not None and self._present >> bit & 1:
+            self._present &= ~(1 << bit)
+            self._values &= ~(1 << bit)
+            self._dirty_bits |= 1 << bit
+        else:
+            if self._shared and key in self._other:
+                self._own()
+            del self._other[key]
+            self._mark_other(key, bit)
+
+    def _mark_other(self, key: str, bit: int | None) -> None:
+        if bit is not None:  # declared flag holding a non-bool: its bit still names it
+            self._dirty_bits |= 1 << bit
+        elif self._dirty_other is None:
+            self._dirty_other = {key}
+        else:
+            self._dirty_other.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        bit = _BITS.get(key)  # type: ignore[arg-type]
+        if bit is not None and self._present >> bit & 1:
+            return True
+        return key in self._other
+
+    def __iter__(self) -> Iterator[str]:
+        present = self._present
+        bit = 0
+        while present:
+            if present & 1:
+                yield _NAMES[bit]
+            present >>= 1
+            bit += 1
+        yield from self._other
+
+    def __len__(self) -> int:
+        return self._present.bit_count() + len(self._other)
+
+    def __repr__(self) -> str:
+        return f"FlagStore({dict(self.items())!r})"
+
+    def copy(self) -> FlagStore:
+        new = FlagStore()
+        new._present, new._values, new._other = self._present, self._values, dict(self._other)
+        return new
+
+    def snapshot(self) -> FlagStore:
+        """O(1) copy (clean, no dirty keys); the side table is shared until written."""
+        new = FlagStore()
+        new._present, new._values, new._other = self._present, self._values, self._other
+        new._shared = self._shared = True
+        return new
+
+    def _own(self) -> None:
+        self._other = dict(self._other)
+        self._shared = False
+
+    # -- change tracking -------------------------------------------------
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        """Keys written or deleted since the last ``take_dirty()``."""
+        keys = set(self._dirty_other or ())
+        bits, bit = self._dirty_bits, 0
+        while bits:
+            if bits & 1:
+                keys.add(_NAMES[bit])
+            bits >>= 1
+            bit += 1
+        return frozenset(keys)
+
+    def take_dirty(self, owner: object = None) -> dict[str, object]:
+        """Return ``{key: current value}`` for every dirty key and reset the set.
+
+        A deleted flag maps to ``DELETED``. The first call claims the store
+        for ``owner``; a call from any other owner raises RuntimeError.
+        """
+        if self._owner is not owner:
+            if self._owner is not _UNOWNED:
+                raise RuntimeError(f"flag changes are already consumed by {self._owner!r}")
+            self._owner = owner
+        if not self._dirty_bits and not self._dirty_other:
+            return {}
+        keys = self.dirty
+        self._dirty_bits, self._dirty_other = 0, None
+        return {key: self.get(key, DELETED) for key in keys}
+
+    def release_dirty(self, owner: object = None) -> None:
+        """Give up ``owner``'s claim (a no-op for anyone else)."""
+        if self._owner is owner:
+            self._owner = _UNOWNED
+
+
+class _Deleted:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "DELETED"
+
+
+DELETED = _Deleted()
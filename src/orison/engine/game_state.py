@@ -1,44 +1,134 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import TYPE_CHECKING
 import json
+import os
+import sys
 from pathlib import Path
 
+from ..models.inventory import Inventory
+from .events import (
+    RESET,
+    EventBus,
+    FlagCleared,
+    FlagSet,
+    MarkAdded,
+    MarkRemoved,
+    RepAdjusted,
+    SceneChanged,
+)
+from .flags import FlagStore
+from .migrations import SCHEMA_VERSION, migrate
+from .reputation import Reputation
+
 if TYPE_CHECKING:
     from ..models import Mark
+    from .snapshot import StateSnapshot
+    from .store import SaveStore
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Holds global game state. UI-agnostic.
 
     - player_name: simple placeholder now; will expand later
     - current_scene_id: logical scene key
     - inventory: player's tokens/marks (Step 3)
-    - flags: world/story booleans (Step 3)
+    - flags: world/story booleans (Step 3), a FlagStore (engine/flags.py)
+    - reputation: faction standing, a copy-on-write Reputation (engine/reputation.py)
+    - events: EventBus (engine/events.py); every mutation made through the
+      methods below (goto, adjust_rep, set_flag, ...) publishes a typed
+      event, so scenes mutate through these and savers/UIs subscribe.
+
+    Slotted (no per-instance __dict__) with interned scene ids, flag keys and
+    faction names, since a host keeps one of these per connected player;
+    ``python -m orison.tools.footprint`` reports what a session costs.
     """
 
     player_name: str = ""
     current_scene_id: str = "intro"
     running: bool = True
-    inventory: list["Mark"] = field(default_factory=list)
-    flags: dict[str, object] = field(default_factory=dict)
-    reputation: dict[str, int] = field(default_factory=dict)
+    inventory: Inventory = field(default_factory=Inventory)
+    flags: FlagStore = field(default_factory=FlagStore)
+    reputation: Reputation = field(default_factory=Reputation)
+    events: EventBus = field(default_factory=EventBus, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "inventory" and not isinstance(value, Inventory):
+            value = Inventory(value)  # plain lists still assign; keep the indexes
+        elif name == "flags" and not isinstance(value, FlagStore):
+            value = FlagStore(value)
+        elif name == "reputation" and not isinstance(value, Reputation):
+            value = Reputation(value)
+        object.__setattr__(self, name, value)
 
     def stop(self) -> None:
         self.running = False
 
     def goto(self, scene_id: str) -> None:
-        self.current_scene_id = scene_id
+        self.current_scene_id = scene_id = sys.intern(scene_id)
+        if self.events.active:
+            self.events.publish(SceneChanged(scene_id))
         
     def adjust_rep(self, faction: str, delta: int) -> None:
+        faction = sys.intern(faction)
         self.reputation[faction] = self.reputation.get(faction, 0) + delta
+        if self.events.active:
+            self.events.publish(RepAdjusted(faction, delta))
+
+    def set_flag(self, key: str, value: object = True) -> None:
+        self.flags[key] = value
+        if self.events.active:
+            self.events.publish(FlagSet(key, value))
+
+    def clear_flag(self, key: str) -> None:
+        if key in self.flags:
+            del self.flags[key]
+            if self.events.active:
+                self.events.publish(FlagCleared(key))
+
+    def add_mark(self, mark: Mark) -> bool:
+        """Add ``mark``; returns False (and changes nothing) if its id is already held."""
+        added = self.inventory.add(mark)
+        if added and self.events.active:
+            self.events.publish(MarkAdded(mark))
+        return added
+
+    def remove_mark(self, mark_id: str) -> Mark | None:
+        mark = self.inventory.discard(mark_id)
+        if mark is not None and self.events.active:
+            self.events.publish(MarkRemoved(mark_id))
+        return mark
     
     def get_rep(self, faction: str) -> int:
         return self.reputation.get(faction,0)
     
+    def snapshot(self) -> StateSnapshot:
+        """O(1) copy-on-write snapshot; see engine/snapshot.py."""
+        from .snapshot import StateSnapshot
+        return StateSnapshot(
+            self.player_name,
+            self.current_scene_id,
+            self.running,
+            self.inventory.snapshot(),
+            self.flags.snapshot(),
+            self.reputation.snapshot(),
+        )
+
+    def restore(self, snap: StateSnapshot) -> None:
+        """Return to ``snap`` in O(1); the snapshot stays valid for reuse."""
+        self.player_name = snap.player_name
+        self.current_scene_id = snap.current_scene_id
+        self.running = snap.running
+        self.inventory = snap.inventory.snapshot()
+        self.flags = snap.flags.snapshot()
+        self.reputation = snap.reputation.snapshot()
+        if self.events.active:
+            self.events.publish(RESET)
+
     def to_dict(self) -> dict:
         return {
+            "version": SCHEMA_VERSION,
             "player_name": self.player_name,
             "current_scene_id": self.current_scene_id,
             "running": self.running,
@@ -52,40 +142,113 @@ class GameState:
         
     @classmethod
     def from_dict(cls, data:dict) -> "GameState":
-        from ..models import Mark
         gs = cls()
-        gs.player_name = data.get("player_name","")
-        gs.current_scene_id = data.get("current_scene_id","intro")
-        gs.running = bool(data.get("running",True))
-        gs.inventory = [
-            Mark(
-                id=item.get("id",""),
-                kind=item.get("kind",""),
-                is_witness=bool(item.get("is_witness",False)),
-            )
-            for item in data.get("inventory",[])
-        ]
-        gs.flags = dict(data.get("flags",{}))
-        gs.reputation = dict(data.get("reputation",{}))
+        gs._load_dict(data)
         return gs
+
+    def _load_dict(self, data: dict) -> None:
+        """Overwrite this state from a to_dict() document, in place.
+
+        Older documents are upgraded first (engine/migrations.py). A
+        malformed document raises ValueError and changes nothing.
+        """
+        from ..models import Mark
+        if not isinstance(data, dict):
+            raise ValueError("save is not a JSON object")
+        try:  # build everything first, so a bad document leaves the state untouched
+            data = migrate(data)
+            name = data.get("player_name","")
+            scene = sys.intern(data.get("current_scene_id","intro"))
+            running = bool(data.get("running",True))
+            inventory = Inventory(
+                Mark.of(
+                    id=item.get("id",""),
+                    kind=item.get("kind",""),
+                    is_witness=bool(item.get("is_witness",False)),
+                )
+                for item in data.get("inventory",[])
+            )
+            flags = FlagStore(data.get("flags",{}))
+            reputation = Reputation(data.get("reputation",{}))
+        except (AttributeError, TypeError) as exc:
+            raise ValueError(f"malformed save: {exc}") from exc
+        self.player_name = name
+        self.current_scene_id = scene
+        self.running = running
+        self.inventory = inventory
+        self.flags = flags
+        self.reputation = reputation
+        if self.events.active:
+            self.events.publish(RESET)
     
     def _apply(self, other: "GameState") -> None:
-        self.player_name = other.player_name
-        self.current_scene_id = other.current_scene_id
-        self.running = other.running
-        self.inventory = list(other.inventory)
-        self.flags = dict(other.flags)
-        self.reputation = dict(other.reputation)
+        self.restore(other.snapshot())  # shares containers copy-on-write
         
-    def save_json(self, path: str | Path) -> None:
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
-        with p.open("w",encoding="utf-8") as f:
-            json.dump(self.to_dict(),f,ensure_ascii=False,indent=2)
+    def save_json(
+        self, path: str | Path, manifest: bool = True, store: SaveStore | None = None
+    ) -> None:
+        if store is not None:  # ``path`` names a slot in the store (engine/store.py)
+            store.put(str(path), self.to_dict())
+            return
+        text = json.dumps(self.to_dict(),ensure_ascii=False,indent=2)
+        self._write_save(Path(path), text.encode("utf-8"), manifest)
+
+    def _write_save(self, p: Path, data: bytes, manifest: bool) -> None:
+        atomic_write(p, data)
+        if manifest:  # keep the directory's slot index current (engine/manifest.py)
+            from .manifest import SaveManifest
+            SaveManifest(p.parent).record(p, self, data)
     
-    def load_json_into_self(self, path: str | Path) -> None:
+    def load_json_into_self(self, path: str | Path, store: SaveStore | None = None) -> None:
+        if store is not None:
+            self._load_dict(store.get(str(path)))
+            return
         p = Path(path)
         with p.open("r", encoding="utf-8") as f:
             data = json.load(f)
-        loaded = GameState.from_dict(data)
-        self._apply(loaded)
+        self._load_dict(data)
+
+    # Binary saves (engine/codec.py): picked by the ".orsb" extension or fmt="binary"
+    def save(self, path: str | Path, fmt: str | None = None, manifest: bool = True) -> None:
+        from . import codec
+        p = Path(path)
+        if _save_format(p, fmt) == "json":
+            self.save_json(p, manifest)
+            return
+        self._write_save(p, codec.encode_state(self), manifest)
+
+    def load(self, path: str | Path, fmt: str | None = None) -> None:
+        from . import codec
+        p = Path(path)
+        if _save_format(p, fmt) == "json":
+            self.load_json_into_self(p)
+            return
+        codec.decode_into(self, p.read_bytes())
+        if self.events.active:
+            self.events.publish(RESET)
+
+
+def _interned_keys(mapping: dict) -> dict:
+    intern = sys.intern
+    return {intern(k): v for k, v in mapping.items()}
+
+
+def atomic_write(path: str | Path, data: bytes, fsync: bool = False) -> None:
+    """Write via a temp file and os.replace so a crash never leaves a torn file."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_name(p.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp, p)
+
+
+def _save_format(path: Path, fmt: str | None) -> str:
+    if fmt is None:
+        return "binary" if path.suffix == ".orsb" else "json"
+    if fmt not in ("json", "binary"):
+        raise ValueError(f"unknown save format: {fmt}")
+    return fmt
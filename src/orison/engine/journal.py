@@ -0,0 +1,242 @@
+"""Append-only journaled saves with periodic compaction.
+
+A journaled save is two files next to each other:
+
+- ``<path>.ckpt``: ``b"ORCK" | u32 generation |`` a binary save (engine/codec.py)
+- ``<path>.jrnl``: ``b"ORJL" | u32 generation |`` then records, each
+  ``u32 length | u32 crc32 | payload`` where payload is a compact JSON list
+  such as ``["goto", "audit"]`` or ``["setrep", "scribes", 3]``.
+
+``JournalStore`` subscribes to a GameState's scene changes and resets, and
+``save()`` appends only what changed since the previous save. Flag,
+reputation and inventory changes come from the dirty sets of the
+FlagStore, Reputation and Inventory, so a flag toggled ten times costs one
+record and direct writes such as ``state.reputation[f] = n`` are journaled
+like ``adjust_rep``. Loading replays the journal onto the checkpoint; a
+torn or corrupt final record (crash mid-append) ends the replay and is
+truncated away. Once the journal passes ``compact_bytes`` the state is
+folded into a fresh checkpoint with the next generation; a journal whose
+generation does not match the checkpoint is stale and ignored, which keeps
+a crash between the two renames from replaying records twice.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+
+from . import codec
+from .events import Event, SceneChanged, StateReset
+from .flags import DELETED
+from .game_state import GameState, atomic_write
+
+CHECKPOINT_MAGIC = b"ORCK"
+JOURNAL_MAGIC = b"ORJL"
+_HEADER = struct.Struct("<4sI")
+_RECORD = struct.Struct("<II")
+
+
+class JournalStore:
+    def __init__(
+        self, path: str | Path, compact_bytes: int = 64 * 1024, fsync: bool = False
+    ) -> None:
+        base = Path(path)
+        self.checkpoint_path = base.with_name(base.name + ".ckpt")
+        self.journal_path = base.with_name(base.name + ".jrnl")
+        self.compact_bytes = compact_bytes
+        self.fsync = fsync
+        self.generation = 0
+        self.journal_size = 0
+        self._pending: list[list] = []
+        self._needs_checkpoint = True
+        self._last_scalars: tuple[str, str, bool] | None = None
+        self._containers: tuple[object, ...] = ()  # the ones whose dirty sets we own
+
+    # -- recording -----------------------------------------------------
+
+    def attach(self, state: GameState) -> None:
+        # flags, reputation and marks are not subscribed to: save() takes the
+        # containers' dirty sets, as their owner
+        if not state.events.subscribed(self._record):
+            state.events.subscribe(self._record, SceneChanged, StateReset)
+
+    def detach(self, state: GameState) -> None:
+        state.events.unsubscribe(self._record)
+        for container in _containers(state):
+            container.release_dirty(self)
+
+    def _record(self, event: Event) -> None:
+        kind = type(event)
+        if kind is SceneChanged:
+            self._pending.append(["goto", event.scene_id])
+        elif kind is StateReset:
+            self._needs_checkpoint = True
+            self._pending.clear()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    # -- saving --------------------------------------------------------
+
+    def save(self, state: GameState) -> int:
+        """Persist changes since the last save; returns bytes written."""
+        if self._needs_checkpoint or not self.checkpoint_path.exists():
+            return self.checkpoint(state)
+        if not _same(_containers(state), self._containers):  # e.g. ``state.inventory = [...]``
+            return self.checkpoint(state)
+        # plain field writes (player_name, running, ...) are not observed; compare instead
+        scalars = (state.player_name, state.current_scene_id, state.running)
+        last_name, last_scene, last_running = self._last_scalars or ("", "", True)
+        if scalars[0] != last_name:
+            self._pending.append(["name", scalars[0]])
+        if scalars[2] != last_running:
+            self._pending.append(["running", scalars[2]])
+        gotos = (r[1] for r in reversed(self._pending) if r[0] == "goto")
+        journaled_scene = next(gotos, last_scene)
+        if scalars[1] != journaled_scene:
+            self._pending.append(["goto", scalars[1]])
+        for key, value in state.flags.take_dirty(self).items():  # one record per changed flag
+            self._pending.append(["unflag", key] if value is DELETED else ["flag", key, value])
+        for faction, value in state.reputation.take_dirty(self).items():
+            self._pending.append(
+                ["unrep", faction] if value is DELETED else ["setrep", faction, value]
+            )
+        for mark_id, mark in state.inventory.take_dirty(self).items():  # in inventory order
+            self._pending.append(
+                ["remove", mark_id] if mark is None
+                else ["add", mark.id, mark.kind, mark.is_witness]
+            )
+        if not self._pending:
+            return 0
+        blob = b"".join(_encode_record(r) for r in self._pending)
+        with self.journal_path.open("ab") as f:
+            f.write(blob)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._pending.clear()
+        self._last_scalars = scalars
+        self.journal_size += len(blob)
+        if self.journal_size > self.compact_bytes:
+            self.checkpoint(state)
+        return len(blob)
+
+    def checkpoint(self, state: GameState) -> int:
+        """Fold everything into a new checkpoint and start an empty journal."""
+        generation = self.generation + 1
+        payload = _HEADER.pack(CHECKPOINT_MAGIC, generation) + codec.encode_state(state)
+        atomic_write(self.checkpoint_path, payload, self.fsync)
+        atomic_write(self.journal_path, _HEADER.pack(JOURNAL_MAGIC, generation), self.fsync)
+        self._take_all(state)
+        self.generation = generation
+        self.journal_size = _HEADER.size
+        self._pending.clear()
+        self._needs_checkpoint = False
+        self._last_scalars = (state.player_name, state.current_scene_id, state.running)
+        return len(payload) + _HEADER.size
+
+    def _take_all(self, state: GameState) -> None:
+        """Drop the containers' changes: they are in the checkpoint already."""
+        self._containers = _containers(state)
+        for container in self._containers:
+            container.take_dirty(self)
+
+    # -- loading -------------------------------------------------------
+
+    def load_into(self, state: GameState) -> int:
+        """Load checkpoint + journal into ``state``; returns records replayed."""
+        data = self.checkpoint_path.read_bytes()
+        magic, generation = _HEADER.unpack_from(data)
+        if magic != CHECKPOINT_MAGIC:
+            raise ValueError("not an Orison journal checkpoint")
+        codec.decode_into(state, data[_HEADER.size:])
+        self.generation = generation
+        replayed, good = 0, _HEADER.size
+        try:
+            journal = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            journal = b""
+        current = len(journal) >= _HEADER.size
+        if current and _HEADER.unpack_from(journal) == (JOURNAL_MAGIC, generation):
+            for record, end in _iter_records(journal, _HEADER.size):
+                _replay(state, record)
+                replayed += 1
+                good = end
+            if good < len(journal):  # torn tail from a crash mid-append
+                with self.journal_path.open("r+b") as f:
+                    f.truncate(good)
+        else:
+            # stale (pre-compaction) or missing journal: the checkpoint is authoritative
+            atomic_write(self.journal_path, _HEADER.pack(JOURNAL_MAGIC, generation), self.fsync)
+        self.journal_size = good
+        self._take_all(state)
+        self._pending.clear()
+        self._needs_checkpoint = False
+        self._last_scalars = (state.player_name, state.current_scene_id, state.running)
+        return replayed
+
+
+def _containers(state: GameState) -> tuple:
+    return (state.flags, state.reputation, state.inventory)
+
+
+def _same(these: tuple, those: tuple) -> bool:
+    """Identity, not ==: a replaced container starts with a clean dirty set."""
+    return len(these) == len(those) and all(a is b for a, b in zip(these, those, strict=True))
+
+
+def _encode_record(record: list) -> bytes:
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _RECORD.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _iter_records(journal: bytes, off: int):
+    """Yield (record, end offset) until the data ends or stops checking out."""
+    while off + _RECORD.size <= len(journal):
+        length, crc = _RECORD.unpack_from(journal, off)
+        start = off + _RECORD.size
+        payload = journal[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            return
+        try:
+            record = json.loads(payload)
+        except ValueError:
+            return
+        off = start + length
+        yield record, off
+
+
+def _replay(state: GameState, record: list) -> None:
+    """Apply one record with plain field writes (no events are published)."""
+    from ..models import Mark
+
+    op, *args = record
+    if op == "goto":
+        state.current_scene_id = args[0]
+    elif op == "setrep":
+        state.reputation[args[0]] = args[1]
+    elif op == "unrep":
+        state.reputation.pop(args[0], None)
+    elif op == "rep":  # a delta, written by older builds
+        faction, delta = args
+        state.reputation[faction] = state.reputation.get(faction, 0) + delta
+    elif op == "flag":
+        state.flags[args[0]] = args[1]
+    elif op == "unflag":
+        state.flags.pop(args[0], None)
+    elif op == "add":  # a re-added id moves to the end, as it did when it was written
+        state.inventory.discard(args[0])
+        state.inventory.add(Mark.of(id=args[0], kind=args[1], is_witness=args[2]))
+    elif op == "remove":
+        state.inventory.discard(args[0])
+    elif op == "name":
+        state.player_name = args[0]
+    elif op == "running":
+        state.running = args[0]
+    else:
+        raise ValueError(f"unknown journal record: {op}")
+
@@ -0,0 +1,188 @@
+"""Cheap read-only views of saves.
+
+``SaveView`` answers "who is this and where are they?" without building a
+GameState. The header fields (``player_name``, ``current_scene_id``,
+``running``) are read immediately; ``inventory``, ``flags`` and
+``reputation`` are decoded on first access and cached.
+
+- Binary saves: only the HEAD section is decoded up front; each other
+  section is decoded on its own when first touched.
+- JSON saves: the leading header keys are scanned from the first few KB
+  (``to_dict`` writes them first); the full document is parsed only when a
+  deferred field is read, and Marks are built only when ``inventory`` is.
+
+Saves from an older schema version, binary or JSON, are decoded and
+migrated up front.
+
+``to_state()``/``apply_to()`` turn the view into a real GameState once a
+scene actually needs to run.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from json.scanner import make_scanner
+from pathlib import Path
+
+from ..models.inventory import Inventory
+from . import codec
+from .events import RESET
+from .game_state import GameState, _interned_keys
+from .migrations import SCHEMA_VERSION, migrate
+
+_HEADER_KEYS = frozenset(("player_name", "current_scene_id", "running"))
+_PEEK_KEYS = _HEADER_KEYS | {"version"}
+_PEEK_BYTES = 4096
+_WS = re.compile(r"[ \t\n\r]*")
+_scan = make_scanner(json.JSONDecoder())
+
+
+class SaveView:
+    __slots__ = (
+        "player_name",
+        "current_scene_id",
+        "running",
+        "_data",
+        "_doc",
+        "_spans",
+        "_strings",
+        "_inventory",
+        "_flags",
+        "_reputation",
+    )
+
+    def __init__(self, data: bytes | dict) -> None:
+        self._data = data
+        self._doc: dict | None = migrate(data) if isinstance(data, dict) else None
+        self._spans: list[tuple[int, int]] | None = None
+        self._strings: list[str] | None = None
+        self._inventory: Inventory | None = None
+        self._flags: dict[str, object] | None = None
+        self._reputation: dict[str, int] | None = None
+        if self._doc is not None:
+            head = self._doc
+        elif codec.is_binary(data) and codec.schema_version(data) != SCHEMA_VERSION:
+            head = self._doc = migrate(codec.decode_dict(data))
+        elif codec.is_binary(data):
+            self._spans = codec.split_sections(data)
+            name, scene, running = codec.decode_head(data, self._spans[0])
+            head = {"player_name": name, "current_scene_id": scene, "running": running}
+        else:
+            head = _peek_json_head(data)
+            if head is None or head.get("version") != SCHEMA_VERSION:
+                head = self._document()  # older saves are migrated before anything is read
+        self.player_name = head.get("player_name", "")
+        self.current_scene_id = head.get("current_scene_id", "intro")
+        self.running = bool(head.get("running", True))
+
+    @classmethod
+    def open(cls, path: str | Path) -> SaveView:
+        return cls(Path(path).read_bytes())
+
+    def __repr__(self) -> str:
+        return (
+            f"SaveView(player_name={self.player_name!r}, "
+            f"current_scene_id={self.current_scene_id!r})"
+        )
+
+    # -- deferred fields -----------------------------------------------
+
+    def _document(self) -> dict:
+        if self._doc is None:
+            doc = json.loads(self._data)
+            if not isinstance(doc, dict):
+                raise ValueError("save is not a JSON object")
+            self._doc = migrate(doc)
+        return self._doc
+
+    def _string_table(self) -> list[str]:
+        if self._strings is None:
+            self._strings = codec.decode_strings(self._data, self._spans[1])
+        return self._strings
+
+    @property
+    def inventory(self) -> Inventory:
+        if self._inventory is None:
+            from ..models import Mark
+
+            if self._spans is not None:
+                cols = codec.decode_inventory(self._data, self._spans[2], self._string_table())
+                self._inventory = Inventory(map(Mark.of, *cols))
+            else:
+                self._inventory = Inventory(
+                    Mark.of(
+                        id=item.get("id", ""),
+                        kind=item.get("kind", ""),
+                        is_witness=bool(item.get("is_witness", False)),
+                    )
+                    for item in self._document().get("inventory", [])
+                )
+        return self._inventory
+
+    @property
+    def flags(self) -> dict[str, object]:
+        if self._flags is None:
+            if self._spans is not None:
+                self._flags = codec.decode_flags(self._data, self._spans[3], self._string_table())
+            else:
+                self._flags = dict(self._document().get("flags", {}))
+        return self._flags
+
+    @property
+    def reputation(self) -> dict[str, int]:
+        if self._reputation is None:
+            if self._spans is not None:
+                self._reputation = codec.decode_reputation(
+                    self._data, self._spans[4], self._string_table()
+                )
+            else:
+                self._reputation = _interned_keys(self._document().get("reputation", {}))
+        return self._reputation
+
+    # -- materializing -------------------------------------------------
+
+    def apply_to(self, state: GameState) -> None:
+        """Overwrite ``state`` with this save, in place."""
+        state.player_name = self.player_name
+        state.current_scene_id = self.current_scene_id
+        state.running = self.running
+        state.inventory = Inventory(self.inventory)
+        state.flags = dict(self.flags)
+        state.reputation = dict(self.reputation)
+        if state.events.active:
+            state.events.publish(RESET)
+
+    def to_state(self) -> GameState:
+        state = GameState()
+        self.apply_to(state)
+        return state
+
+
+def _peek_json_head(data: bytes) -> dict | None:
+    """Scan the header keys at the start of a JSON save; None if they are not all first."""
+    text = data[:_PEEK_BYTES].decode("utf-8", errors="ignore")
+    head: dict = {}
+    idx = _WS.match(text).end()
+    if text[idx:idx + 1] != "{":
+        return None
+    idx += 1
+    try:
+        while not _HEADER_KEYS <= head.keys():
+            idx = _WS.match(text, idx).end()
+            if text[idx:idx + 1] != '"':
+                return None
+            key, idx = _scan(text, idx)
+            if key not in _PEEK_KEYS:
+                return None
+            idx = _WS.match(text, idx).end()
+            if text[idx:idx + 1] != ":":
+                return None
+            head[key], idx = _scan(text, _WS.match(text, idx + 1).end())
+            idx = _WS.match(text, idx).end()
+            if text[idx:idx + 1] != ",":
+                return None  # a short or unusual document: let the full parse decide
+            idx += 1
+    except (StopIteration, ValueError):
+        return None
+    return head
@@ -0,0 +1,191 @@
+"""Save-slot manifest: list saves without opening them.
+
+Every ``GameState.save_json``/``save`` appends one line to
+``manifest.jsonl`` in the save's directory::
+
+    ["save_orison.json", "Tester", "audit", 1760000000.0, 412, "9f1c20ab"]
+
+(slot file name, player name, scene, timestamp, size in bytes, crc32). The
+newest line per slot wins and lines stay in save order, so the menus only
+read the file's tail (``recent``/``latest``): a few KB, however many slots
+exist. A full listing joins all lines into one JSON array and parses it with
+a single ``json.loads``.
+
+Reads never write. ``compact()`` rewrites the file with one line per slot;
+call it explicitly (``compact_if_stale()`` at startup, say). Appends and
+compaction hold the same per-file lock, and compaction re-reads the file
+under it, so an entry recorded meanwhile (the autosave thread, for one)
+is never dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import NamedTuple
+
+from .game_state import GameState, atomic_write
+
+MANIFEST_NAME = "manifest.jsonl"
+_TAIL_CHUNK = 8192
+_LOCKS: dict[Path, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    key = path.resolve()
+    with _LOCKS_GUARD:
+        lock = _LOCKS.get(key)
+        if lock is None:
+            lock = _LOCKS[key] = threading.Lock()
+        return lock
+
+
+class ManifestEntry(NamedTuple):
+    slot: str
+    player_name: str
+    scene: str
+    saved_at: float
+    size: int
+    checksum: str
+
+
+class SaveManifest:
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+
+    def record(self, slot_path: str | Path, state: GameState, data: bytes) -> ManifestEntry:
+        entry = ManifestEntry(
+            slot=Path(slot_path).name,
+            player_name=state.player_name,
+            scene=state.current_scene_id,
+            saved_at=time.time(),
+            size=len(data),
+            checksum=f"{zlib.crc32(data):08x}",
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with _lock_for(self.path), self.path.open("a", encoding="utf-8") as f:
+            f.write(line)
+        return entry
+
+    def entries(self) -> dict[str, ManifestEntry]:
+        """Newest entry per slot (keyed by slot file name)."""
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return {}
+        make = ManifestEntry._make
+        # later lines overwrite earlier ones
+        return {row[0]: make(row) for row in _parse_rows(text)}
+
+    def recent(self, limit: int = 10) -> list[ManifestEntry]:
+        """Newest ``limit`` slots, newest first, reading backwards from the end."""
+        out: list[ManifestEntry] = []
+        seen: set[str] = set()
+        try:
+            f = self.path.open("rb")
+        except FileNotFoundError:
+            return out
+        with f:
+            pos = f.seek(0, 2)
+            carry = b""
+            while pos > 0 and len(out) < limit:
+                step = min(_TAIL_CHUNK, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b"\n")
+                carry = lines.pop(0) if pos > 0 else b""  # may be a partial line
+                for line in reversed(lines):
+                    row = _parse_line(line)
+                    if row is not None and row[0] not in seen:
+                        seen.add(row[0])
+                        out.append(ManifestEntry._make(row))
+                        if len(out) >= limit:
+                            break
+        return out
+
+    def latest(self) -> ManifestEntry | None:
+        newest = self.recent(1)
+        return newest[0] if newest else None
+
+    def compact(self) -> None:
+        """Rewrite the manifest with only the newest line per slot."""
+        with _lock_for(self.path):
+            self._rewrite(self.entries())
+
+    def compact_if_stale(self) -> bool:
+        """Compact once stale lines outnumber live slots; returns whether it did."""
+        with _lock_for(self.path):
+            try:
+                rows = _parse_rows(self.path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                return False
+            latest = {row[0]: ManifestEntry._make(row) for row in rows}
+            if len(rows) <= 2 * len(latest) + 64:
+                return False
+            self._rewrite(latest)
+            return True
+
+    def _rewrite(self, entries: dict[str, ManifestEntry]) -> None:
+        ordered = sorted(entries.values(), key=lambda e: e.saved_at)  # keep save order for recent()
+        lines = [json.dumps(e, ensure_ascii=False, separators=(",", ":")) for e in ordered]
+        atomic_write(self.path, ("\n".join(lines) + "\n" if lines else "").encode("utf-8"))
+
+    def rebuild(self) -> dict[str, ManifestEntry]:
+        """Recreate the manifest from the save files themselves (lost or foreign directory).
+
+        Each save is only peeked (engine/lazy.py): header fields, no Marks.
+        """
+        from .codec import EXTENSION
+        from .lazy import SaveView
+
+        found: list[ManifestEntry] = []
+        for p in self.directory.iterdir() if self.directory.is_dir() else ():
+            if p.suffix not in (".json", EXTENSION) or p.name == MANIFEST_NAME:
+                continue
+            try:
+                data = p.read_bytes()
+                view = SaveView(data)
+                saved_at = p.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            checksum = f"{zlib.crc32(data):08x}"
+            found.append(
+                ManifestEntry(
+                    p.name, view.player_name, view.current_scene_id, saved_at, len(data), checksum
+                )
+            )
+        entries = {e.slot: e for e in found}
+        with _lock_for(self.path):
+            self._rewrite(entries)
+        return entries
+
+    def path_of(self, entry: ManifestEntry) -> Path:
+        return self.directory / entry.slot
+
+
+def _parse_rows(text: str) -> list[list]:
+    body = text.rstrip("\n")
+    if not body:
+        return []
+    try:
+        return json.loads("[" + body.replace("\n", ",") + "]")
+    except ValueError:
+        # a torn last line (crash mid-append) or stray junk: salvage line by line
+        rows = (_parse_line(line) for line in body.split("\n"))
+        return [row for row in rows if row is not None]
+
+
+def _parse_line(line: str | bytes) -> list | None:
+    try:
+        row = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(row, list) and len(row) == 6:
+        return row
+    return None
@@ -0,0 +1,91 @@
+"""Save schema versions and the migration steps between them.
+
+``GameState.to_dict`` stamps ``"version": SCHEMA_VERSION`` into every save.
+Loading runs ``migrate()``, which applies the registered steps one version
+at a time, so an old save is upgraded on read and written back at the
+current version the next time it is saved. ``orison.tools.migrate`` does
+the same for a whole directory or store ahead of time.
+
+To change the schema, bump SCHEMA_VERSION and register one step::
+
+    @migration(1)
+    def _v1_to_v2(data: dict) -> dict:
+        ...  # return the upgraded document; do not mutate ``data``
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+SCHEMA_VERSION = 1
+
+Migration = Callable[[dict], dict]
+_STEPS: dict[int, Migration] = {}
+
+
+def migration(from_version: int) -> Callable[[Migration], Migration]:
+    """Register the step upgrading ``from_version`` to ``from_version + 1``."""
+
+    def register(step: Migration) -> Migration:
+        if from_version in _STEPS:
+            raise ValueError(f"migration from version {from_version} already registered")
+        _STEPS[from_version] = step
+        return step
+
+    return register
+
+
+def version_of(data: dict) -> int:
+    if not isinstance(data, dict):
+        raise ValueError("save is not a JSON object")
+    version = data.get("version", 0)
+    if isinstance(version, bool) or not isinstance(version, int):
+        raise ValueError(f"malformed save: version {version!r} is not an integer")
+    return version
+
+
+def needs_migration(data: dict) -> bool:
+    return version_of(data) != SCHEMA_VERSION
+
+
+def migrate(data: dict) -> dict:
+    """Return ``data`` upgraded to SCHEMA_VERSION (``data`` itself if already current).
+
+    A document the steps cannot read raises ValueError, like a bad version.
+    """
+    version = version_of(data)
+    if version > SCHEMA_VERSION:
+        raise ValueError(
+            f"save schema version {version} is newer than this build ({SCHEMA_VERSION})"
+        )
+    while version < SCHEMA_VERSION:
+        step = _STEPS.get(version)
+        if step is None:
+            raise ValueError(f"no migration from save schema version {version}")
+        try:
+            data = step(data)
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise ValueError(f"malformed save: {exc}") from exc
+        version += 1
+        data["version"] = version
+    return data
+
+
+@migration(0)
+def _v0_to_v1(data: dict) -> dict:
+    """Unversioned saves: spell out the defaults ``from_dict`` used to assume."""
+    return {
+        "player_name": data.get("player_name", ""),
+        "current_scene_id": data.get("current_scene_id", "intro"),
+        "running": bool(data.get("running", True)),
+        "inventory": [
+            {
+                "id": item.get("id", ""),
+                "kind": item.get("kind", ""),
+                "is_witness": bool(item.get("is_witness", False)),
+            }
+            for item in data.get("inventory", [])
+        ],
+        "flags": dict(data.get("flags", {})),
+        "reputation": dict(data.get("reputation", {})),
+    }
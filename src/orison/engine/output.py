@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+
+class BufferedOutput:
+    """OutputPort that batches a frame's lines into a single write.
+
+    Scenes write 10-15 lines per frame; sending each one on its own costs a
+    syscall (and over a socket, possibly a packet) per line. Lines collect
+    here until ``flush()`` - called by the driver when the scene asks for
+    input or finishes its frame with ``GameState.goto`` - or until the
+    buffer passes ``high_water`` characters.
+    """
+
+    def __init__(self, sink: Callable[[str], object], high_water: int = 8192) -> None:
+        self._sink = sink
+        self.high_water = high_water
+        self._parts: list[str] = []
+        self._size = 0
+        self.flushes = 0  # sink calls so far; handy for measuring batching
+
+    def write_line(self, text: str) -> None:
+        self.write(text + "\n")
+
+    def write(self, text: str) -> None:
+        """Buffer raw text (e.g. a prompt without a trailing newline)."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.high_water:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        return self._size
+
+    def flush(self) -> None:
+        if not self._parts:
+            return
+        chunk = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self.flushes += 1
+        self._sink(chunk)
@@ -0,0 +1,110 @@
+"""Faction reputation: a copy-on-write mapping of faction -> standing.
+
+``Reputation`` is a MutableMapping over one plain dict. Like Inventory and
+FlagStore, ``snapshot()`` is O(1): both sides point at the same dict, and
+whichever side writes first copies it. Every write goes through the
+mapping, so ``state.reputation[faction] = n`` is as safe for snapshots as
+``adjust_rep``.
+
+Writes and deletes also record the faction in ``dirty``; a saver takes the
+changes with ``take_dirty(owner)``, with the same single-owner rule as
+FlagStore, so direct writes reach a journal too.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+
+from .flags import _UNOWNED, DELETED
+
+
+class Reputation(MutableMapping):
+    __slots__ = ("_data", "_shared", "_dirty", "_owner")
+
+    def __init__(self, items: Iterable[tuple[str, int]] | Mapping[str, int] = ()) -> None:
+        self._data: dict[str, int] = {}
+        self._shared = False  # _data is shared with a snapshot; copy before writing
+        self._dirty: set[str] | None = None  # factions changed since take_dirty(), made on demand
+        self._owner: object = _UNOWNED  # the one consumer of take_dirty()
+        for faction, value in items.items() if isinstance(items, Mapping) else items:
+            self._data[sys.intern(faction)] = value
+
+    def __getitem__(self, faction: str) -> int:
+        return self._data[faction]
+
+    def get(self, faction: str, default: object = None) -> object:
+        return self._data.get(faction, default)
+
+    def __setitem__(self, faction: str, value: int) -> None:
+        if self._shared:
+            self._own()
+        faction = sys.intern(faction)
+        self._data[faction] = value
+        self._mark(faction)
+
+    def __delitem__(self, faction: str) -> None:
+        if self._shared and faction in self._data:
+            self._own()
+        del self._data[faction]
+        self._mark(faction)
+
+    def _mark(self, faction: str) -> None:
+        if self._dirty is None:
+            self._dirty = {faction}
+        else:
+            self._dirty.add(faction)
+
+    def __contains__(self, faction: object) -> bool:
+        return faction in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"Reputation({self._data!r})"
+
+    def copy(self) -> Reputation:
+        new = Reputation()
+        new._data = dict(self._data)
+        return new
+
+    def snapshot(self) -> Reputation:
+        """O(1) copy; the dict is shared until either side writes."""
+        new = Reputation()
+        new._data = self._data
+        new._shared = self._shared = True
+        return new
+
+    def _own(self) -> None:
+        self._data = dict(self._data)
+        self._shared = False
+
+    # -- change tracking -------------------------------------------------
+
+    @property
+    def dirty(self) -> frozenset[str]:
+        """Factions written or deleted since the last ``take_dirty()``."""
+        return frozenset(self._dirty or ())
+
+    def take_dirty(self, owner: object = None) -> dict[str, object]:
+        """Return ``{faction: current value}`` for every dirty faction and reset the set.
+
+        A deleted faction maps to ``DELETED``. Owned like ``FlagStore.take_dirty``.
+        """
+        if self._owner is not owner:
+            if self._owner is not _UNOWNED:
+                raise RuntimeError(f"reputation changes are already consumed by {self._owner!r}")
+            self._owner = owner
+        if not self._dirty:
+            return {}
+        factions, self._dirty = self._dirty, None
+        return {faction: self._data.get(faction, DELETED) for faction in factions}
+
+    def release_dirty(self, owner: object = None) -> None:
+        """Give up ``owner``'s claim (a no-op for anyone else)."""
+        if self._owner is owner:
+            self._owner = _UNOWNED
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Protocol, TYPE_CHECKING
+from collections.abc import Callable, Generator
 
 if TYPE_CHECKING:  # avoid import cycle at runtime
     from .game_state import GameState
@@ -14,6 +16,38 @@ class InputPort(Protocol):
     def read_line(self, prompt: str = "") -> str: ...
 
 
+@dataclass(frozen=True)
+class Prompt:
+    """A scene paused on one line of input.
+
+    choices/default describe a menu (None for free text) so a UI can render
+    buttons instead of a text box; the scene still validates the answer.
+    """
+
+    text: str = ""
+    choices: frozenset[str] | None = None
+    default: str | None = None
+
+
+@dataclass(frozen=True)
+class Lookup:
+    """A scene paused on a value it should not compute inline.
+
+    For example, a hint from an out-of-process arbiter. A driver that can
+    wait asynchronously resolves it by ``kind`` (SessionHost's ``lookups``).
+    Any other driver calls ``fallback()``. Either way the scene is resumed
+    with the resulting string, as if it were an answer.
+    """
+
+    kind: str
+    arg: str
+    fallback: Callable[[], str]
+
+
+# A resumable scene body: yields Prompts (or Lookups), is resumed with the answer line.
+SceneSteps = Generator[Prompt | Lookup, str, None]
+
+
 class Scene(ABC):
     """Abstract base class for scenes.
 
@@ -33,3 +67,56 @@ class Scene(ABC):
         Concrete scenes decide when to transition state or stop the game.
         """
         raise NotImplementedError
+
+
+class StepScene(Scene):
+    """Scene written as a generator instead of blocking on read_line.
+
+    ``steps`` yields a Prompt whenever it needs input and is resumed with the
+    answer, so one thread or event loop can hold any number of paused scenes
+    (see SceneRunner). ``run`` adapts it back to the blocking protocol.
+    """
+
+    @abstractmethod
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
+        raise NotImplementedError
+
+    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
+        runner = SceneRunner(self, state, io_out)
+        prompt = runner.start()
+        while prompt is not None:
+            if isinstance(prompt, Lookup):
+                prompt = runner.resume(prompt.fallback())
+            else:
+                prompt = runner.resume(io_in.read_line(prompt.text))
+
+
+class SceneRunner:
+    """Drives one StepScene frame an answer at a time; never blocks."""
+
+    __slots__ = ("_steps", "prompt")
+
+    def __init__(self, scene: StepScene, state: GameState, io_out: OutputPort) -> None:
+        self._steps = scene.steps(state, io_out)
+        self.prompt: Prompt | Lookup | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._steps is None
+
+    def start(self) -> Prompt | Lookup | None:
+        """Run up to the first prompt; None means the frame already finished."""
+        return self._advance(None)
+
+    def resume(self, answer: str) -> Prompt | Lookup | None:
+        return self._advance(answer)
+
+    def _advance(self, answer: str | None) -> Prompt | Lookup | None:
+        if self._steps is None:
+            raise RuntimeError("scene frame already finished")
+        try:
+            self.prompt = self._steps.send(answer)  # type: ignore[arg-type]
+        except StopIteration:
+            self._steps = None
+            self.prompt = None
+        return self.prompt
@@ -0,0 +1,80 @@
+"""Copy-on-write snapshots of a GameState, and a ring of recent checkpoints.
+
+``GameState.snapshot()`` is O(1): the snapshot points at the state's current
+inventory, flags and reputation and marks them shared. Whichever side writes
+to a shared container first copies just that container (Inventory,
+FlagStore and Reputation each do this themselves), so untouched containers
+stay shared between any number of snapshots.
+``GameState.restore(snap)`` swaps the pointers back, also in O(1).
+
+Snapshots are values: nothing ever writes through them, so one snapshot can
+be restored or branched from any number of times.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from ..models.inventory import Inventory
+    from .flags import FlagStore
+    from .game_state import GameState
+    from .reputation import Reputation
+
+
+class StateSnapshot(NamedTuple):
+    player_name: str
+    current_scene_id: str
+    running: bool
+    inventory: Inventory
+    flags: FlagStore
+    reputation: Reputation
+
+    def to_state(self) -> GameState:
+        """A new, independent GameState starting from this snapshot (for what-if branches)."""
+        from .game_state import GameState
+
+        state = GameState()
+        state.restore(self)
+        return state
+
+    def to_dict(self) -> dict:
+        return self.to_state().to_dict()
+
+
+class CheckpointRing:
+    """The last ``size`` checkpoints of one session, oldest first."""
+
+    def __init__(self, state: GameState, size: int = 8) -> None:
+        self.state = state
+        self._ring: deque[StateSnapshot] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def __iter__(self) -> Iterator[StateSnapshot]:
+        return iter(self._ring)
+
+    def push(self) -> StateSnapshot:
+        """Checkpoint the state as it is now (drops the oldest when full)."""
+        snap = self.state.snapshot()
+        self._ring.append(snap)
+        return snap
+
+    def peek(self, back: int = 0) -> StateSnapshot | None:
+        """The checkpoint ``back`` steps before the newest, or None."""
+        if back >= len(self._ring):
+            return None
+        return self._ring[-1 - back]
+
+    def undo(self) -> bool:
+        """Restore the newest checkpoint and drop it; False if there is none."""
+        if not self._ring:
+            return False
+        self.state.restore(self._ring.pop())
+        return True
+
+    def clear(self) -> None:
+        self._ring.clear()
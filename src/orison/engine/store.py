@@ -0,0 +1,261 @@
+"""Pluggable save stores behind ``GameState.save_json``/``load_json_into_self``.
+
+A store maps slot names to ``GameState.to_dict()`` documents. Two backends
+ship with the same behaviour:
+
+- ``FileSaveStore``: one JSON file per slot (the classic layout).
+- ``SQLiteSaveStore``: one table in a WAL-mode database. Connections come
+  from a small pool so concurrent sessions do not serialize on one handle,
+  and ``put`` only queues the write: pending slots are committed together in
+  one transaction once ``batch_size`` is reached, or by a background flusher
+  once the oldest has waited ``max_delay``, or on ``flush()``. Reads see
+  queued writes, including a batch that is being committed; deletes are
+  queued behind earlier saves of the slot and committed at once.
+
+Missing slots raise FileNotFoundError in both, so callers that already catch
+OSError for file saves need no changes.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Protocol
+
+from .game_state import atomic_write
+
+
+class SaveStore(Protocol):
+    def put(self, slot: str, data: dict) -> None: ...
+
+    def get(self, slot: str) -> dict: ...
+
+    def delete(self, slot: str) -> None: ...
+
+    def slots(self) -> list[str]: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _dumps(data: dict) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FileSaveStore:
+    def __init__(self, root: str | Path, fsync: bool = False) -> None:
+        self.root = Path(root)
+        self.fsync = fsync
+
+    def _path(self, slot: str) -> Path:
+        return self.root / f"{slot}.json"
+
+    def put(self, slot: str, data: dict) -> None:
+        atomic_write(self._path(slot), _dumps(data), self.fsync)
+
+    def get(self, slot: str) -> dict:
+        with self._path(slot).open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def delete(self, slot: str) -> None:
+        self._path(slot).unlink(missing_ok=True)
+
+    def slots(self) -> list[str]:
+        return sorted(p.stem for p in self.root.glob("*.json"))
+
+    def flush(self) -> None:
+        pass  # every put is already on disk
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteSaveStore:
+    def __init__(
+        self,
+        path: str | Path,
+        pool_size: int = 4,
+        batch_size: int = 64,
+        max_delay: float = 0.5,
+        synchronous: str = "NORMAL",
+    ) -> None:
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.synchronous = synchronous
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all: list[sqlite3.Connection] = []
+        self._pending: dict[str, bytes | None] = {}  # None marks a queued delete
+        self._inflight: dict[str, bytes | None] = {}  # the batch flush() is committing
+        self._pending_since = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        if self.path == ":memory:":
+            pool_size = 1  # every connection to ":memory:" would open its own private database
+        else:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(max(1, pool_size)):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS saves ("
+                " slot TEXT PRIMARY KEY, data BLOB NOT NULL, updated_at REAL NOT NULL)"
+            )
+        self._flusher_thread = threading.Thread(
+            target=self._flusher, name="orison-save-flush", daemon=True
+        )
+        self._flusher_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        self._all.append(conn)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def put(self, slot: str, data: dict) -> None:
+        self._queue(slot, _dumps(data))
+
+    def put_many(self, items: dict[str, dict]) -> None:
+        for slot, data in items.items():
+            self.put(slot, data)
+
+    def _queue(self, slot: str, blob: bytes | None) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("save store is closed")
+            if not self._pending:
+                self._pending_since = time.monotonic()
+                self._wake.notify()  # start the max_delay clock in the flusher
+            self._pending[slot] = blob  # a newer save of the same slot replaces the queued one
+            due = len(self._pending) >= self.batch_size
+        if due:
+            self.flush()
+
+    def _flusher(self) -> None:
+        """Commit queued saves once the oldest has waited ``max_delay``."""
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if not self._pending:
+                        self._wake.wait()
+                        continue
+                    remaining = self._pending_since + self.max_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wake.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except sqlite3.Error:
+                with self._lock:  # the batch was re-queued; retry after another max_delay
+                    self._pending_since = time.monotonic()
+
+    def flush(self) -> None:
+        """Commit every queued save (and delete) in one transaction."""
+        with self._flush_lock:
+            with self._lock:
+                # the batch stays readable through _inflight until it is committed
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            if not batch:
+                return
+            now = time.time()
+            try:
+                with self._connection() as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        conn.executemany(
+                            "INSERT INTO saves (slot, data, updated_at) VALUES (?, ?, ?)"
+                            " ON CONFLICT(slot) DO UPDATE SET data = excluded.data,"
+                            " updated_at = excluded.updated_at",
+                            [(slot, blob, now) for slot, blob in batch.items() if blob is not None],
+                        )
+                        conn.executemany(
+                            "DELETE FROM saves WHERE slot = ?",
+                            [(slot,) for slot, blob in batch.items() if blob is None],
+                        )
+                        conn.execute("COMMIT")
+                    except BaseException:
+                        conn.execute("ROLLBACK")
+                        raise
+            except BaseException:
+                with self._lock:  # put the batch back unless newer saves superseded it
+                    for slot, blob in batch.items():
+                        self._pending.setdefault(slot, blob)
+                    if self._pending:
+                        self._pending_since = time.monotonic()
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+
+    def _queued(self, slot: str) -> tuple[bool, bytes | None]:
+        """(found, blob) from the queue or the batch being committed; blob None = deleted."""
+        with self._lock:
+            for layer in (self._pending, self._inflight):
+                if slot in layer:
+                    return True, layer[slot]
+        return False, None
+
+    def get(self, slot: str) -> dict:
+        # queued layers first: anything committed after this check is already in the table
+        found, blob = self._queued(slot)
+        if not found:
+            with self._connection() as conn:
+                row = conn.execute("SELECT data FROM saves WHERE slot = ?", (slot,)).fetchone()
+            blob = row[0] if row is not None else None
+        if blob is None:
+            raise FileNotFoundError(f"no save in slot {slot!r}")
+        return json.loads(blob)
+
+    def delete(self, slot: str) -> None:
+        """Queue a delete after any save of ``slot`` and commit it right away."""
+        self._queue(slot, None)
+        self.flush()
+
+    def slots(self) -> list[str]:
+        with self._lock:
+            overlay = {**self._inflight, **self._pending}
+        with self._connection() as conn:
+            stored = {row[0] for row in conn.execute("SELECT slot FROM saves")}
+        for slot, blob in overlay.items():
+            if blob is None:
+                stored.discard(slot)
+            else:
+                stored.add(slot)
+        return sorted(stored)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify_all()
+        self._flusher_thread.join()
+        self.flush()
+        for conn in self._all:
+            conn.close()
+        self._all.clear()
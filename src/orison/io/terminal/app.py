@@ -1,10 +1,33 @@
 from __future__ import annotations
+import sys
+from collections.abc import Generator
 from dataclasses import dataclass
-from typing import Dict
-from ...engine import GameState, Scene
-from ...engine.scene import InputPort, OutputPort
-from ...models import Contract, Mark
-from ...models.arbiter import TerminalArbiter
+from functools import partial
+from pathlib import Path
+from typing import TextIO
+from ...engine import GameState, Lookup, Prompt, Scene, StepScene
+from ...engine.autosave import AutosaveService
+from ...engine.fingerprint import Projection, RenderCache
+from ...engine.flags import declare_flags
+from ...engine.manifest import SaveManifest
+from ...engine.output import BufferedOutput
+from ...engine.scene import OutputPort, SceneSteps
+from ...models import Contract, ContractRegistry, Mark
+from ...models.arbiter import Arbiter, CorpusArbiter
+
+SAVE_DIR = "save_game"
+DEFAULT_SAVE_PATH = "save_game/save_orison.json"
+AUTOSAVE_PATH = "save_game/autosave.json"  # beside the manual saves, so Load/Continue list it
+
+# boolean story flags live in the FlagStore bitset; "policy" stays a typed entry
+declare_flags(
+    "has_witness_mark",
+    "canals_black",
+    "secret_clause_active",
+    "checked_ledger",
+    "visited_dock",
+    "sigil_for_memory",
+)
 
 
 @dataclass
@@ -16,9 +39,39 @@ class ConsoleIO:
         return input(prompt)
 
 
+class BufferedConsoleIO:
+    """ConsoleIO that writes each frame (plus its prompt) in one go.
+
+    Lines are held in a BufferedOutput and flushed together with the prompt
+    right before blocking on input, and by the main loop after each scene.
+    """
+
+    def __init__(self, stream: TextIO | None = None, high_water: int = 8192) -> None:
+        self.stream = stream if stream is not None else sys.stdout
+        self.out = BufferedOutput(self._emit, high_water=high_water)
+
+    def _emit(self, chunk: str) -> None:
+        self.stream.write(chunk)
+        self.stream.flush()
+
+    def write_line(self, text: str) -> None:
+        self.out.write_line(text)
+
+    def flush(self) -> None:
+        self.out.flush()
+
+    def read_line(self, prompt: str = "") -> str:
+        self.out.write(prompt)
+        self.out.flush()
+        return input()
+
+
 # Step 11: centralized input guard (single-shot with safe default)
-def _choice_or_default(io_in: InputPort, io_out: OutputPort, prompt: str, valid: set[str], default: str) -> str:
-    raw = (io_in.read_line(prompt) or "").strip()
+# Used as `choice = yield from _choice_or_default(...)` inside a scene's steps().
+def _choice_or_default(
+    io_out: OutputPort, prompt: str, valid: set[str], default: str
+) -> Generator[Prompt, str, str]:
+    raw = ((yield Prompt(prompt, frozenset(valid), default)) or "").strip()
     if not raw:
         return default
     if raw in valid:
@@ -27,15 +80,15 @@ def _choice_or_default(io_in: InputPort, io_out: OutputPort, prompt: str, valid:
     return default
 
 
-class IntroScene(Scene):
+class IntroScene(StepScene):
     def __init__(self) -> None:
         super().__init__(scene_id="intro")
 
-    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
         io_out.write_line("Welcome to Orison.")
         if not state.player_name:
             io_out.write_line("What is your name?")
-            state.player_name = io_in.read_line("> ").strip() or "Wanderer"
+            state.player_name = (yield Prompt("> ")).strip() or "Wanderer"
             io_out.write_line(f"Hello, {state.player_name}.")
         
         scribes = state.get_rep("scribes")
@@ -50,15 +103,15 @@ class IntroScene(Scene):
         io_out.write_line("4) Save game")
         io_out.write_line("5) Load game")
         io_out.write_line("6) Continue (load last save)")
-        choice = _choice_or_default(io_in, io_out, "Choose [1-6]: ", set("123456"), default="3")
+        choice = yield from _choice_or_default(io_out, "Choose [1-6]: ", set("123456"), default="3")
 
         if choice == "1":
             state.goto("audit")
         elif choice == "2":
-            has_witness = any(m.is_witness for m in state.inventory)
+            has_witness = state.inventory.has_witness
             if not has_witness:
-                state.inventory.append(Mark(id="M-WIT-DEMO", kind="witness", is_witness=True))
-                state.flags["has_witness_mark"] = True
+                state.add_mark(Mark.of(id="M-WIT-DEMO", kind="witness", is_witness=True))
+                state.set_flag("has_witness_mark", True)
                 io_out.write_line("You received a Witness Mark.")
             else:
                 io_out.write_line("You already carry a Witness Mark.")
@@ -66,25 +119,39 @@ class IntroScene(Scene):
         elif choice == "3":
             state.goto("end")
         elif choice == "4":
-            path = io_in.read_line("Save path [save_game/save_orison.json]: ").strip() or "save_game/save_orison.json"
+            path = (yield Prompt(f"Save path [{DEFAULT_SAVE_PATH}]: ")).strip() or DEFAULT_SAVE_PATH
             try:
-                state.save_json(path)
+                state.save(path)
                 io_out.write_line(f"Saved to {path}")
-            except OSError as e:
+            except (OSError, ValueError) as e:  # a binary save refuses out-of-range reputation
                 io_out.write_line(f"Could not save: {e}")
             state.goto("intro")
         elif choice == "5":
-            path = io_in.read_line("Load path [save_game/save_orison.json]: ").strip() or "save_game/save_orison.json"
+            # list slots from the manifest only; no save file is opened to build the menu
+            manifest = SaveManifest(SAVE_DIR)
+            slots = manifest.recent(9)
+            if slots:
+                io_out.write_line("Saved games:")
+                for i, entry in enumerate(slots, 1):
+                    who = entry.player_name or "?"
+                    io_out.write_line(f"{i}) {entry.slot} - {who} at {entry.scene}")
+            answer = (yield Prompt(f"Load slot or path [{DEFAULT_SAVE_PATH}]: ")).strip()
+            if answer.isdigit() and 1 <= int(answer) <= len(slots):
+                path = str(manifest.path_of(slots[int(answer) - 1]))
+            else:
+                path = answer or DEFAULT_SAVE_PATH
             try:
-                state.load_json_into_self(path)
+                state.load(path)
                 io_out.write_line("Loaded. Returning to main menu.")
             except (OSError, ValueError) as e:
                 io_out.write_line(f"Could not load: {e}")
             state.goto("intro")
         elif choice == "6":
-            default_path = "save_game/save_orison.json"
+            # a save taken on the way out would only resume into the quit screen
+            latest = next((e for e in SaveManifest(SAVE_DIR).recent(9) if e.scene != "end"), None)
+            path = str(Path(SAVE_DIR) / latest.slot) if latest else DEFAULT_SAVE_PATH
             try:
-                state.load_json_into_self(default_path)
+                state.load(path)
                 io_out.write_line("Continuing from last save...")
             except (OSError, ValueError) as e:
                 io_out.write_line(f"No save to continue: {e}")
@@ -93,66 +160,108 @@ class IntroScene(Scene):
             io_out.write_line("I did not understand. Returning to menu.")
             state.goto("intro")         
 
-class AuditScene(Scene):
-    """A minimal audit to demonstrate routing and models."""
-    def __init__(self) -> None:
-        super().__init__(scene_id="audit")
-        
-    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
-        public = Contract(
+def city_ledger() -> ContractRegistry:
+    """The contracts the audit reviews (one ledger per AuditScene, shared by all sessions)."""
+    return ContractRegistry([
+        Contract(
             id="C-001",
             title="Canal Maintenance Oath",
             clauses=["Keep canals clear"],
             is_public=True,
-        )
+        ),
+        Contract(
+            id="C-SEC-001",
+            title="Night Discharge Waiver",
+            clauses=["Discharge blackwater at night"],
+            is_public=False,
+        ),
+    ])
 
-        secret_active = state.flags.get("secret_clause_active", False)
-        secret = (
-            Contract(
-                id="C-SEC-001",
-                title="Night Discharge Waiver",
-                clauses=["Discharge blackwater at night"],
-                is_public=False,
-            )
-            if secret_active
-            else None
-        )
 
-        has_witness = any(m.is_witness for m in state.inventory)
-        flag_has_witness = state.flags.get("has_witness_mark", False)
+# a secret contract only binds a session once the flag revealing it is set
+SECRET_GATES: dict[str, str] = {"C-SEC-001": "secret_clause_active"}
 
-        canals_black = False
-        if secret is not None and public.conflicts_with(secret):
-            canals_black = True
-        state.flags["canals_black"] = canals_black
 
-        io_out.write_line("")
-        io_out.write_line("Audit: Review Summary")
-        io_out.write_line(str(public))
-        if secret_active and secret is not None:
-            io_out.write_line(str(secret))
-        io_out.write_line(
+class AuditScene(StepScene):
+    """A minimal audit to demonstrate routing and models.
+
+    Contracts live in a ContractRegistry that maintains its conflicts, so
+    the summary reads them in O(conflicts) instead of re-checking pairs.
+    The summary depends only on AUDIT_VIEW (and the ledger's version), so
+    with a RenderCache it is rendered once per distinct projection and
+    replayed on later visits.
+    """
+    AUDIT_VIEW = Projection(
+        # every flag the summary reads: each secret gate, plus the witness mark
+        flags=(*dict.fromkeys(SECRET_GATES.values()), "has_witness_mark"),
+        reputation=("scribes", "mariners"),
+        witness=True,
+    )
+
+    def __init__(
+        self,
+        render_cache: RenderCache | None = None,
+        ledger: ContractRegistry | None = None,
+    ) -> None:
+        super().__init__(scene_id="audit")
+        self.render_cache = render_cache
+        self.ledger = ledger if ledger is not None else city_ledger()
+
+    def _in_force(self, state: GameState, contract: Contract) -> bool:
+        gate = SECRET_GATES.get(contract.id)
+        return gate is None or bool(state.flags.get(gate, False))
+
+    def render(self, state: GameState) -> tuple[tuple[str, ...], bool]:
+        """Summary and menu lines, plus whether the canals run black."""
+        in_force = self._in_force
+        canals_black = any(
+            in_force(state, public) and in_force(state, secret)
+            for public, secret in self.ledger.conflicts()
+        )
+
+        lines = ["", "Audit: Review Summary"]
+        lines += [str(c) for c in self.ledger.public()]
+        lines += [str(c) for c in self.ledger.secret() if in_force(state, c)]
+
+        has_witness = state.inventory.has_witness
+        flag_has_witness = state.flags.get("has_witness_mark", False)
+        lines.append(
             f"You hold a witness mark: {'yes' if has_witness else 'no'} "
             f"(flag: {'yes' if flag_has_witness else 'no'})"
         )
 
-        io_out.write_line(f"Canal status: {'BLACK' if canals_black else 'CLEAR'}")
+        lines.append(f"Canal status: {'BLACK' if canals_black else 'CLEAR'}")
 
         scribes = state.get_rep("scribes")
         mariners = state.get_rep("mariners")
-        io_out.write_line(f"Reputation - Scribes: {scribes} | Mariners: {mariners}")
+        lines.append(f"Reputation - Scribes: {scribes} | Mariners: {mariners}")
 
-        io_out.write_line("")
-        io_out.write_line("What is next?")
-        io_out.write_line("1) Return to main menu")
-        io_out.write_line("2) Conclude for now")
-        io_out.write_line("3) Investigate (check ledger or visit dock)")
-        io_out.write_line("4) Visit the Arbiter")
-        io_out.write_line("5) Toggle secret clause (reveal/withdraw)")
-        io_out.write_line("6) Proceed to decision")
-        io_out.write_line("7) Assemble a ritual token")
-        choice = _choice_or_default(
-            io_in, io_out, "Choose [1-7]: ", set("1234567"), default="1"
+        lines += [
+            "",
+            "What is next?",
+            "1) Return to main menu",
+            "2) Conclude for now",
+            "3) Investigate (check ledger or visit dock)",
+            "4) Visit the Arbiter",
+            "5) Toggle secret clause (reveal/withdraw)",
+            "6) Proceed to decision",
+            "7) Assemble a ritual token",
+        ]
+        return tuple(lines), canals_black
+
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
+        if self.render_cache is None:
+            lines, canals_black = self.render(state)
+        else:
+            fingerprint = f"{self.ledger.version}:{self.AUDIT_VIEW.fingerprint(state)}"
+            lines, canals_black = self.render_cache.get_or_render(
+                self.scene_id, fingerprint, lambda: self.render(state)
+            )
+        state.set_flag("canals_black", canals_black)  # applied on cache hits too
+        for line in lines:
+            io_out.write_line(line)
+        choice = yield from _choice_or_default(
+            io_out, "Choose [1-7]: ", set("1234567"), default="1"
         )
 
         if choice == "1":
@@ -163,14 +272,14 @@ class AuditScene(Scene):
             return
         elif choice == "3":
             def handle_check_ledger() -> str:
-                state.flags["checked_ledger"] = True
+                state.set_flag("checked_ledger", True)
                 io_out.write_line(
                     "Ledger notes: backlog of repairs and mismatched reports."
                 )
                 return "intro"
 
             def handle_visit_dock() -> str:
-                state.flags["visited_dock"] = True
+                state.set_flag("visited_dock", True)
                 io_out.write_line(
                     "At the docks: faint smell of blackwater and nervous whispers."
                 )
@@ -187,8 +296,8 @@ class AuditScene(Scene):
             io_out.write_line("1) Check ledger")
             io_out.write_line("2) Visit dock")
             io_out.write_line("3) Back")
-            sub = _choice_or_default(
-                io_in, io_out, "Choose [1-3]: ", set("123"), default="3"
+            sub = yield from _choice_or_default(
+                io_out, "Choose [1-3]: ", set("123"), default="3"
             )
 
             next_scene = strategies.get(sub, lambda: "intro")()
@@ -199,7 +308,7 @@ class AuditScene(Scene):
             return
         elif choice == "5":
             new_state = not state.flags.get("secret_clause_active", False)
-            state.flags["secret_clause_active"] = new_state
+            state.set_flag("secret_clause_active", new_state)
             if new_state:
                 io_out.write_line(
                     "Secret clause is now ACTIVE (a hidden waiver exists)."
@@ -221,29 +330,30 @@ class AuditScene(Scene):
         io_out.write_line("Invalid choice. returning to main menu")
         state.goto("intro")
         
-class ArbiterScene(Scene):
-    def __init__(self) -> None:
+class ArbiterScene(StepScene):
+    def __init__(self, arbiter: Arbiter | None = None) -> None:
         super().__init__(scene_id="arbiter")
-        self.arbiter = TerminalArbiter()
+        self.arbiter = arbiter if arbiter is not None else CorpusArbiter()
     
-    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
         io_out.write_line("")
         io_out.write_line("You meet the Arbiter. Offer a memory to receive a hint.")
-        memory = io_in.read_line(
+        memory = (yield Prompt(
             "Type a memory (or just press Enter to skip): "
-        ).strip()
-        hint = self.arbiter.trade_memory_for_hint(memory)
+        )).strip()
+        # hosted sessions may resolve this through an async arbiter (server/hints.py)
+        hint = yield Lookup("hint", memory, partial(self.arbiter.trade_memory_for_hint, memory))
         io_out.write_line(f"Arbiter's hint: {hint}")
         io_out.write_line("")
         io_out.write_line("1) Return to main menu")
-        _ = _choice_or_default(io_in, io_out, "Choose [1]: ", {"1"}, default="1")
+        _ = yield from _choice_or_default(io_out, "Choose [1]: ", {"1"}, default="1")
         state.goto("intro")
         
-class DecisionScene(Scene):
+class DecisionScene(StepScene):
     def __init__(self) -> None:
         super().__init__(scene_id="decision")
     
-    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
         secret_active = state.flags.get("secret_clause_active", False)
         current = "SECRET WAIVER ACTIVE" if secret_active else "PUBLIC OATH ONLY"
         io_out.write_line("")
@@ -251,20 +361,20 @@ class DecisionScene(Scene):
         io_out.write_line(f"Current stance: {current}")
         io_out.write_line("1) Restore the public oath (disable secret waiver)")
         io_out.write_line("2) Legalize the secret waiver (keep it active)")
-        choice = _choice_or_default(
-            io_in, io_out, "Choose [1-2]: ", {"1", "2"}, default="1"
+        choice = yield from _choice_or_default(
+            io_out, "Choose [1-2]: ", {"1", "2"}, default="1"
         )
         
         if choice == "1":
-            state.flags["secret_clause_active"] = False
-            state.flags["policy"] = "public"
+            state.set_flag("secret_clause_active", False)
+            state.set_flag("policy", "public")
             state.adjust_rep("scribes", +1)
             state.adjust_rep("mariners", -1)
             io_out.write_line("City response: Relief across districts. Oath restored.")
             state.goto("intro")
         elif choice == "2":
-            state.flags["secret_clause_active"] = True
-            state.flags["policy"] = "secret"
+            state.set_flag("secret_clause_active", True)
+            state.set_flag("policy", "secret")
             state.adjust_rep("scribes", -1)
             state.adjust_rep("mariners", +1)
             io_out.write_line("City response: Uneasy acceptance. Hidden waivers now legal.")
@@ -273,25 +383,25 @@ class DecisionScene(Scene):
             io_out.write_line("No decision made. Returning to main menu.")
             state.goto("intro")
 
-class RitualScene(Scene):
+class RitualScene(StepScene):
     def __init__(self) -> None:
         super().__init__(scene_id = "ritual")
     
-    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
         io_out.write_line("")
         io_out.write_line("Ritual: Assemble the Memory Sigil")
         #  if already forged, short-circuit
-        if any(m.kind == "sigil" for m in state.inventory):
+        if state.inventory.has_kind("sigil"):
             io_out.write_line("You already forged a Memory Sigil.")
             state.goto("audit")
             return
         
         io_out.write_line("Combine two parts. Hint: words tied to your duty.")
-        part_a  = io_in.read_line("Enter part A (or blank to cancel): ").strip()
+        part_a  = (yield Prompt("Enter part A (or blank to cancel): ")).strip()
         if not part_a:
             state.goto("audit")
             return
-        part_b = io_in.read_line("Enter part B (or blank to cancel): ").strip()
+        part_b = (yield Prompt("Enter part B (or blank to cancel): ")).strip()
         if not part_b:
             state.goto("audit")
             return
@@ -303,26 +413,28 @@ class RitualScene(Scene):
             return {x, y} == {"witness","oath"}
         
         if valid_combo(a, b):
-            if not any(m.kind == "sigil" for m in state.inventory):
-                state.inventory.append(Mark(id="SIGIL-MEM-1", kind="sigil", is_witness=False))
-            state.flags["sigil_for_memory"] = True
+            if not state.inventory.has_kind("sigil"):
+                state.add_mark(Mark.of(id="SIGIL-MEM-1", kind="sigil", is_witness=False))
+            state.set_flag("sigil_for_memory", True)
             io_out.write_line("Ritual succeeds. A Memory Sigil hums in your hands.")
             state.goto("audit")
         else:
             io_out.write_line("The glyphs sputter. Hint: try combining 'witness' with 'oath'.")
             state.goto("audit")
-class EndScene(Scene):
+class EndScene(StepScene):
     def __init__(self) -> None:
         super().__init__(scene_id="end")
 
-    def run(self, state: GameState, io_in: InputPort, io_out: OutputPort) -> None:
+    def steps(self, state: GameState, io_out: OutputPort) -> SceneSteps:
         io_out.write_line("This is the end of the demo scaffold. Goodbye.")
         state.stop()
+        return
+        yield  # no input needed; still a generator
 
 
-SCENES: Dict[str, Scene] = {
+SCENES: dict[str, Scene] = {
     "intro": IntroScene(),
-    "audit": AuditScene(),
+    "audit": AuditScene(render_cache=RenderCache(maxsize=64)),
     "arbiter": ArbiterScene(),
     "decision": DecisionScene(),
     "ritual": RitualScene(),
@@ -332,10 +444,18 @@ SCENES: Dict[str, Scene] = {
 
 def run_terminal_app() -> None:
     state = GameState()
-    io = ConsoleIO()
-    while state.running:
-        scene = SCENES.get(state.current_scene_id)
-        if not scene:
-            io.write_line(f"Unknown scene: {state.current_scene_id}")
-            break
-        scene.run(state, io, io)
+    io = BufferedConsoleIO()
+    SaveManifest(SAVE_DIR).compact_if_stale()  # reads never compact; tidy up once per start
+    autosave = AutosaveService()
+    autosave.watch(state, "terminal", AUTOSAVE_PATH, skip=("end",))  # nothing to resume there
+    try:
+        while state.running:
+            scene = SCENES.get(state.current_scene_id)
+            if not scene:
+                io.write_line(f"Unknown scene: {state.current_scene_id}")
+                break
+            scene.run(state, io, io)
+            io.flush()  # frame ended with a goto
+    finally:
+        io.flush()
+        autosave.close()
@@ -1,4 +1,6 @@
 from .mark import Mark
 from .contract import Contract
+from .inventory import Inventory
+from .registry import ContractRegistry
 
-__all__ = ["Mark", "Contract"]
+__all__ = ["Mark", "Contract", "Inventory", "ContractRegistry"]
@@ -1,5 +1,15 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
 from typing import Protocol
 
+from .matcher import PhraseMatcher
+
+
 class Arbiter(Protocol):
     def trade_memory_for_hint(self,memory: str) -> str:
         ...
@@ -12,4 +22,86 @@ class TerminalArbiter:
             return "The canals hide more than water. Check th ledger for missing report."
         if "dock" in memory.lower():
             return "The dock workers know about the blackwater. ask them again."
-        return "Every memory is a clue. Look for what is missing"
\ No newline at end of file
+        return "Every memory is a clue. Look for what is missing"
+
+
+@dataclass(frozen=True)
+class HintEntry:
+    id: str
+    keywords: tuple[str, ...]  # any one of them, matched case-insensitively
+    hint: str
+    priority: int = 0  # highest wins; ties go to the earlier entry
+
+
+@dataclass(frozen=True)
+class HintCorpus:
+    entries: tuple[HintEntry, ...]
+    empty: str  # reply to a blank memory
+    default: str  # reply when nothing matches
+
+
+def load_hint_corpus(path: str | Path | None = None) -> HintCorpus:
+    """Read a hint corpus (defaults to the packaged orison/data/hints.json)."""
+    if path is None:
+        text = resources.files("orison.data").joinpath("hints.json").read_text(encoding="utf-8")
+    else:
+        text = Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+        entries = tuple(
+            HintEntry(
+                id=str(e["id"]),
+                keywords=_keywords(e["keywords"]),
+                hint=str(e["hint"]),
+                priority=int(e.get("priority", 0)),
+            )
+            for e in data["hints"]
+        )
+        return HintCorpus(entries, str(data["empty"]), str(data["default"]))
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        raise ValueError(f"malformed hint corpus: {exc}") from exc
+
+
+def _keywords(raw: object) -> tuple[str, ...]:
+    if not isinstance(raw, list) or not raw:
+        raise ValueError(f"keywords must be a non-empty list, got {raw!r}")
+    if not all(isinstance(k, str) and k.strip() for k in raw):
+        raise ValueError(f"keywords must be non-empty strings, got {raw!r}")
+    return tuple(k.lower() for k in raw)
+
+
+class CorpusArbiter:
+    """Arbiter driven by a hint corpus instead of hardcoded branches.
+
+    The corpus keywords are compiled into one PhraseMatcher, so a memory is
+    lowercased once and scanned once however many hints there are. Replies
+    are cached per memory in a bounded LRU (``cache_info()`` reports it).
+    """
+
+    def __init__(self, corpus: HintCorpus | None = None, cache_size: int = 1024) -> None:
+        self.corpus = corpus if corpus is not None else load_hint_corpus()
+        ids = [e.id for e in self.corpus.entries]
+        if len(set(ids)) != len(ids):
+            raise ValueError("hint ids must be unique")
+        self._matcher = PhraseMatcher({e.id: e.keywords for e in self.corpus.entries})
+        # best first: by priority, then corpus order
+        self._ranked = sorted(self.corpus.entries, key=lambda e: -e.priority)
+        self._lookup = lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, memory: str) -> str:
+        if not memory.strip():
+            return self.corpus.empty
+        found = self._matcher.scan(memory.lower())
+        for entry in self._ranked:
+            if entry.id in found:
+                return entry.hint
+        return self.corpus.default
+
+    def trade_memory_for_hint(self, memory: str) -> str:
+        return self._lookup(memory)
+
+    def cache_info(self) -> tuple:
+        return self._lookup.cache_info()
+
+    def cache_clear(self) -> None:
+        self._lookup.cache_clear()
@@ -0,0 +1,137 @@
+"""Whole-ledger conflict audits for offline runs (city-wide audits, balancing).
+
+``bulk_audit(contracts)`` evaluates every public/secret pair at once and
+returns the conflicting pairs and per-contract conflict counts. The result
+matches calling ``Contract.conflicts_with`` on each pair.
+
+Each contract's clause tags (models/clauses.py) are encoded as one row of
+a boolean tag matrix. ``CONFLICTS`` becomes a tag-by-tag rule matrix ``R``,
+so the conflict matrix is ``(public_tags @ R @ secret_tags.T) > 0``. With
+NumPy installed (``pip install orison[audit]``) this is computed with
+vectorized matrix products, ``chunk`` public rows at a time to bound
+memory. Without it a pure-Python fallback walks an inverted index of
+secret contracts. It gives identical results, in the same order.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .clauses import CLAUSE_PHRASES, CONFLICTS
+from .contract import Contract
+
+TAGS: tuple[str, ...] = tuple(sorted(CLAUSE_PHRASES))
+
+
+@dataclass(frozen=True)
+class BulkAuditResult:
+    public: tuple[str, ...]  # contract ids, in input order
+    secret: tuple[str, ...]
+    pairs: list[tuple[str, str]]  # (public id, secret id), public-major then secret order
+    counts: dict[str, int]  # conflicts per contract id, zeros included
+    backend: str  # "numpy" or "python"
+
+
+def _numpy() -> Any | None:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def bulk_audit(
+    contracts: Iterable[Contract], backend: str = "auto", chunk: int = 4096
+) -> BulkAuditResult:
+    """Audit every public/secret pair in ``contracts``.
+
+    ``backend`` is "auto" (NumPy when installed), "numpy" or "python".
+    """
+    public: list[Contract] = []
+    secret: list[Contract] = []
+    for contract in contracts:
+        (public if contract.is_public else secret).append(contract)
+
+    np = None
+    if backend in ("auto", "numpy"):
+        np = _numpy()
+        if np is None and backend == "numpy":
+            raise ImportError("bulk_audit(backend='numpy') needs NumPy: pip install orison[audit]")
+    elif backend != "python":
+        raise ValueError(f"unknown bulk audit backend {backend!r}")
+
+    if np is not None:
+        hits, public_counts, secret_counts = _numpy_audit(np, public, secret, chunk)
+    else:
+        hits, public_counts, secret_counts = _python_audit(public, secret)
+
+    counts = dict(zip((c.id for c in public), public_counts, strict=True))
+    counts.update(zip((c.id for c in secret), secret_counts, strict=True))
+    return BulkAuditResult(
+        public=tuple(c.id for c in public),
+        secret=tuple(c.id for c in secret),
+        pairs=[(public[i].id, secret[j].id) for i, j in hits],
+        counts=counts,
+        backend="python" if np is None else "numpy",
+    )
+
+
+# index pairs, public counts, secret counts
+_Audit = tuple[list[tuple[int, int]], list[int], list[int]]
+
+
+def _python_audit(public: list[Contract], secret: list[Contract]) -> _Audit:
+    breaching: dict[tuple[str, str], list[int]] = {}
+    for j, contract in enumerate(secret):
+        for key in contract._breaches:
+            breaching.setdefault(key, []).append(j)
+    hits: list[tuple[int, int]] = []
+    public_counts = [0] * len(public)
+    secret_counts = [0] * len(secret)
+    for i, contract in enumerate(public):
+        row: set[int] = set()
+        for key in contract._claims:
+            row.update(breaching.get(key, ()))
+        public_counts[i] = len(row)
+        for j in sorted(row):
+            hits.append((i, j))
+            secret_counts[j] += 1
+    return hits, public_counts, secret_counts
+
+
+def tag_matrix(np: Any, contracts: list[Contract]) -> Any:
+    """Boolean ``len(contracts) x len(TAGS)`` matrix of clause tags."""
+    column = {tag: k for k, tag in enumerate(TAGS)}
+    matrix = np.zeros((len(contracts), len(TAGS)), dtype=bool)
+    for i, contract in enumerate(contracts):
+        for tag in contract.tags:
+            matrix[i, column[tag]] = True
+    return matrix
+
+
+def rule_matrix(np: Any) -> Any:
+    """Boolean ``TAGS x TAGS`` matrix: ``[a, b]`` is set when (a, b) is in CONFLICTS."""
+    column = {tag: k for k, tag in enumerate(TAGS)}
+    rules = np.zeros((len(TAGS), len(TAGS)), dtype=bool)
+    for obligation, violation in CONFLICTS:
+        rules[column[obligation], column[violation]] = True
+    return rules
+
+
+def _numpy_audit(np: Any, public: list[Contract], secret: list[Contract], chunk: int) -> _Audit:
+    # float32 products go through BLAS; the sums involved are tiny, so they stay exact
+    claims = tag_matrix(np, public).astype(np.float32) @ rule_matrix(np).astype(np.float32)
+    breaches_t = tag_matrix(np, secret).astype(np.float32).T
+    hits: list[tuple[int, int]] = []
+    public_counts: list[int] = []
+    secret_counts = np.zeros(len(secret), dtype=np.int64)
+    step = max(1, chunk)
+    for start in range(0, len(public), step):
+        conflict = (claims[start:start + step] @ breaches_t) > 0
+        rows, cols = np.nonzero(conflict)  # row-major, matching the fallback's order
+        hits.extend(zip((rows + start).tolist(), cols.tolist(), strict=True))
+        public_counts.extend(conflict.sum(axis=1).tolist())
+        secret_counts += conflict.sum(axis=0)
+    return hits, public_counts, secret_counts.tolist()
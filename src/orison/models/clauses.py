@@ -0,0 +1,34 @@
+"""The phrase table behind ``Contract.conflicts_with``.
+
+``CLAUSE_PHRASES`` names the obligations a public contract can swear to
+and the violations a secret one can hide, as lowercase phrases matched
+anywhere in a contract's clauses. ``CONFLICTS`` pairs them: a public
+contract tagged with the first conflicts with a secret one tagged with
+the second. Extend the tables, not the Contract code.
+"""
+
+from __future__ import annotations
+
+from .matcher import PhraseMatcher
+
+CLAUSE_PHRASES: dict[str, tuple[str, ...]] = {
+    "canals_clear": ("keep canals clear", "keep canal clear"),
+    "dumping": ("dump", "discharge", "blackwater"),
+}
+
+# (public obligation, secret violation)
+CONFLICTS: tuple[tuple[str, str], ...] = (("canals_clear", "dumping"),)
+
+CLAUSE_MATCHER = PhraseMatcher(CLAUSE_PHRASES)
+
+
+def normalize(clauses: list[str]) -> str:
+    """Clause text as the matcher sees it (joined, lowercased)."""
+    return " ".join(clauses).lower()
+
+
+def conflict_keys(tags: frozenset[str]) -> tuple[frozenset, frozenset]:
+    """What a contract with ``tags`` swears to, and what it breaks, as CONFLICTS pairs."""
+    claims = frozenset(pair for pair in CONFLICTS if pair[0] in tags)
+    breaches = frozenset(pair for pair in CONFLICTS if pair[1] in tags)
+    return claims, breaches
@@ -1,17 +1,38 @@
 from __future__ import annotations
 from dataclasses import dataclass,field
 
+from .clauses import CLAUSE_MATCHER, conflict_keys, normalize
+
 @dataclass
 class Contract:
     """A public or private agreement with simple clauses.
 
-    Level 6: @dataclass with list field
+    Level 6: @dataclass with a tuple field (lists are converted on assignment)
     Level 4: __str__ vs __repr__ (user vs developer view)
     """
     id: str
     title: str
-    clauses: list[str] = field(default_factory=list)
+    clauses: tuple[str, ...] = ()
     is_public: bool = True
+    # precomputed from clauses (models/clauses.py); clauses are stored as a
+    # tuple so they cannot be edited in place, and every assignment recomputes
+    tags: frozenset[str] = field(init=False, repr=False, compare=False)
+    _claims: frozenset = field(init=False, repr=False, compare=False)
+    _breaches: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._index()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "clauses":
+            value = tuple(value)  # type: ignore[arg-type]
+        object.__setattr__(self, name, value)
+        if name == "clauses":
+            self._index()
+
+    def _index(self) -> None:
+        self.tags = CLAUSE_MATCHER.scan(normalize(self.clauses))
+        self._claims, self._breaches = conflict_keys(self.tags)
     
     def __str__(self) -> str:
         vis = "public" if self.is_public else "secret"
@@ -21,13 +42,10 @@ class Contract:
     def conflicts_with(self, other: "Contract") -> bool:
         """Return True if this contract conflicts with the other.
             Minimal domain rule: a public 'keep canals clear' oath conflicts with any
-            secret clause that implies blackwater dumping/discharge.
+            secret clause that implies blackwater dumping/discharge
+            (the phrase tables live in models/clauses.py).
         """
-        a = " ".join(self.clauses).lower()
-        b = " ".join(other.clauses).lower()
-        def mentions_clear(s: str) -> bool:
-            return "keep canals clear" in s or "keep canal clear" in s
-        def mentions_dump(s: str) -> bool:
-            return "dump" in s or "discharge" in s or "blackwater" in s
-        return (self.is_public and not other.is_public and mentions_clear(a) and mentions_dump(b)) or \
-               (other.is_public and not self.is_public and mentions_clear(b) and mentions_dump(a))
\ No newline at end of file
+        if bool(self.is_public) == bool(other.is_public):
+            return False
+        public, secret = (self, other) if self.is_public else (other, self)
+        return not public._claims.isdisjoint(secret._breaches)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import overload
+
+from .mark import Mark
+
+_UNOWNED = object()
+
+
+class Inventory:
+    """The player's marks, indexed so scene checks are O(1).
+
+    Marks are keyed by id (adding an id twice keeps the first mark) and kept
+    in insertion order. Counts by kind and the number of witness marks are
+    maintained on every change. Iteration, len(), indexing and == against a
+    list behave like the old ``list[Mark]``, so ``to_dict``/``from_dict`` and
+    existing callers keep working.
+
+    Every add or removal records the mark id in ``dirty``, most recent
+    last. A saver takes the changes with ``take_dirty(owner)``; like
+    FlagStore's, the set has one owner, and copies and snapshots start
+    clean and unowned.
+    """
+
+    __slots__ = ("_by_id", "_kinds", "_witnesses", "_shared", "_dirty", "_owner")
+
+    def __init__(self, marks: Iterable[Mark] = ()) -> None:
+        self._by_id: dict[str, Mark] = {}
+        self._kinds: dict[str, int] = {}
+        self._witnesses = 0
+        self._shared = False
+        self._dirty: dict[str, None] | None = None  # ids changed since take_dirty()
+        self._owner: object = _UNOWNED  # the one consumer of take_dirty()
+        self.add_many(marks)
+        self._dirty = None  # a freshly built inventory is clean
+
+    def snapshot(self) -> Inventory:
+        """O(1) copy: both sides share storage until one of them changes."""
+        twin = Inventory.__new__(Inventory)
+        twin._by_id, twin._kinds, twin._witnesses = self._by_id, self._kinds, self._witnesses
+        twin._shared = self._shared = True
+        twin._dirty, twin._owner = None, _UNOWNED
+        return twin
+
+    def _own(self) -> None:
+        """Copy shared storage before the first write (copy-on-write)."""
+        self._by_id = dict(self._by_id)
+        self._kinds = dict(self._kinds)
+        self._shared = False
+
+    # -- mutation --------------------------------------------------------
+
+    def add(self, mark: Mark) -> bool:
+        """Add ``mark``; returns False if a mark with its id is already held."""
+        if mark.id in self._by_id:
+            return False
+        if self._shared:
+            self._own()
+        self._by_id[mark.id] = mark
+        self._kinds[mark.kind] = self._kinds.get(mark.kind, 0) + 1
+        if mark.is_witness:
+            self._witnesses += 1
+        self._mark(mark.id)
+        return True
+
+    def add_many(self, marks: Iterable[Mark]) -> int:
+        """Add several marks; returns how many were new."""
+        add = self.add
+        return sum(add(m) for m in marks)
+
+    def discard(self, mark_id: str) -> Mark | None:
+        """Remove and return the mark with ``mark_id`` (None if absent)."""
+        if self._shared:
+            if mark_id not in self._by_id:
+                return None
+            self._own()
+        mark = self._by_id.pop(mark_id, None)
+        if mark is not None:
+            left = self._kinds[mark.kind] - 1
+            if left:
+                self._kinds[mark.kind] = left
+            else:
+                del self._kinds[mark.kind]
+            if mark.is_witness:
+                self._witnesses -= 1
+            self._mark(mark_id)
+        return mark
+
+    def discard_many(self, mark_ids: Iterable[str]) -> list[Mark]:
+        removed = (self.discard(i) for i in mark_ids)
+        return [m for m in removed if m is not None]
+
+    def clear(self) -> None:
+        for mark_id in self._by_id:
+            self._mark(mark_id)
+        self._by_id, self._kinds = {}, {}
+        self._witnesses = 0
+        self._shared = False
+
+    def _mark(self, mark_id: str) -> None:
+        dirty = self._dirty
+        if dirty is None:
+            self._dirty = {mark_id: None}
+        else:
+            dirty.pop(mark_id, None)  # keep ids in the order of their last change
+            dirty[mark_id] = None
+
+    # list-style spellings
+    append = add
+    extend = add_many
+
+    # -- change tracking -------------------------------------------------
+
+    @property
+    def dirty(self) -> tuple[str, ...]:
+        """Mark ids added or removed since the last ``take_dirty()``, oldest change first."""
+        return tuple(self._dirty or ())
+
+    def take_dirty(self, owner: object = None) -> dict[str, Mark | None]:
+        """Return ``{mark id: mark held now}`` for every dirty id and reset the set.
+
+        A removed mark maps to None. The order is that of the last change
+        to each id, so re-adding the marks in it reproduces the inventory's
+        order. The first call claims the inventory for ``owner``; a call
+        from any other owner raises RuntimeError.
+        """
+        if self._owner is not owner:
+            if self._owner is not _UNOWNED:
+                raise RuntimeError(f"inventory changes are already consumed by {self._owner!r}")
+            self._owner = owner
+        if not self._dirty:
+            return {}
+        ids, self._dirty = self._dirty, None
+        return {mark_id: self._by_id.get(mark_id) for mark_id in ids}
+
+    def release_dirty(self, owner: object = None) -> None:
+        """Give up ``owner``'s claim (a no-op for anyone else)."""
+        if self._owner is owner:
+            self._owner = _UNOWNED
+
+    # -- queries ---------------------------------------------------------
+
+    def get(self, mark_id: str) -> Mark | None:
+        return self._by_id.get(mark_id)
+
+    def count_kind(self, kind: str) -> int:
+        return self._kinds.get(kind, 0)
+
+    def has_kind(self, kind: str) -> bool:
+        return kind in self._kinds
+
+    def kinds(self) -> dict[str, int]:
+        return dict(self._kinds)
+
+    @property
+    def witness_count(self) -> int:
+        return self._witnesses
+
+    @property
+    def has_witness(self) -> bool:
+        return self._witnesses > 0
+
+    # -- sequence protocol -----------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Mark]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, item: object) -> bool:
+        """Accepts a mark id or a Mark."""
+        if isinstance(item, str):
+            return item in self._by_id
+        if isinstance(item, Mark):
+            return self._by_id.get(item.id) == item
+        return False
+
+    @overload
+    def __getitem__(self, index: int) -> Mark: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Mark]: ...
+    def __getitem__(self, index: int | slice) -> Mark | list[Mark]:
+        return list(self._by_id.values())[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Inventory):
+            return list(self._by_id.values()) == list(other._by_id.values())
+        if isinstance(other, (list, tuple)):
+            return list(self._by_id.values()) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Inventory({list(self._by_id.values())!r})"
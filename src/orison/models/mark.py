@@ -1,18 +1,44 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import ClassVar
+from weakref import WeakValueDictionary
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True, eq=False)
 class Mark:
     """A simple token that proves witnessing or grants limited access.
 
     Level 6: @dataclass (fields, defaults)
     Level 4: __str__ vs __repr__ (human vs developer display)
+
+    Marks are immutable values. ``Mark.of(...)`` returns the one shared
+    instance for a given (id, kind, is_witness), so thousands of sessions
+    holding the same mark hold one object; loading and the scenes use it.
     """
     id: str
     kind: str  # e.g., "witness", "seal", "archive"
     is_witness: bool = False
-    
+
+    _interned: ClassVar[WeakValueDictionary[tuple[str, str, bool], Mark]] = WeakValueDictionary()
+
+    @classmethod
+    def of(cls, id: str, kind: str, is_witness: bool = False) -> Mark:
+        key = (id, kind, bool(is_witness))
+        mark = cls._interned.get(key)
+        if mark is None:
+            mark = cls._interned.setdefault(key, cls(*key))
+        return mark
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:  # interned marks: the common case is one identity check
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.id, self.kind, self.is_witness) == (other.id, other.kind, other.is_witness)
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.kind, self.is_witness))
+
     def __str__(self) -> str:
         status = "witness" if self.is_witness else "token"
         return f"Mark[{self.id}] ({self.kind}, {status})"
-    
+
@@ -0,0 +1,76 @@
+"""Multi-pattern phrase matching (Aho-Corasick).
+
+``PhraseMatcher`` is built once from a table of ``tag -> phrases`` and then
+reports which tags occur in a text in a single left-to-right pass,
+however many phrases the table holds. Matching is plain substring
+matching, like ``phrase in text``; callers normalize (e.g. lowercase)
+both the phrases and the text. Overlapping phrases, and phrases nested
+inside other phrases, are all found.
+
+The automaton is compiled to a full transition table: each state maps
+every character that can continue some phrase to its next state, and any
+other character goes back to the root. Scanning is then one dict lookup
+per character, and it stops early once every tag has been seen.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+
+
+class PhraseMatcher:
+    __slots__ = ("_delta", "_out", "_all")
+
+    def __init__(self, table: Mapping[str, Iterable[str]]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[frozenset[str]] = [frozenset()]
+        for tag, phrases in table.items():
+            for phrase in phrases:
+                if not phrase:
+                    raise ValueError(f"empty phrase for tag {tag!r}")
+                node = 0
+                for ch in phrase:
+                    nxt = goto[node].get(ch)
+                    if nxt is None:
+                        nxt = goto[node][ch] = len(goto)
+                        goto.append({})
+                        out.append(frozenset())
+                    node = nxt
+                out[node] = out[node] | {tag}
+
+        # breadth-first: complete each state's transitions from its failure state,
+        # which is always shallower and so already complete
+        delta: list[dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in goto[1:])
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())  # the root's children fail to the root
+        while queue:
+            node = queue.popleft()
+            out[node] = out[node] | out[fail[node]]
+            row = dict(delta[fail[node]])
+            for ch, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(ch, 0)
+                row[ch] = child
+                queue.append(child)
+            delta[node] = row
+        self._delta = delta
+        self._out = {i: tags for i, tags in enumerate(out) if tags}
+        self._all = frozenset(table)
+
+    @property
+    def tags(self) -> frozenset[str]:
+        return self._all
+
+    def scan(self, text: str) -> frozenset[str]:
+        """The tags whose phrases occur in ``text``."""
+        delta, out, everything = self._delta, self._out, self._all
+        found: frozenset[str] = frozenset()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if state in out:
+                found = found | out[state]
+                if found == everything:
+                    break
+        return found
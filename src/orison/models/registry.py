@@ -0,0 +1,125 @@
+"""A ledger of contracts that keeps its conflicts up to date as it changes.
+
+``ContractRegistry`` indexes contracts by id, splits them into public and
+secret, and keeps inverted indexes from conflict keys (the
+``(obligation, violation)`` pairs of models/clauses.py) to the contracts
+that claim or breach them. Adding a contract looks up only the contracts
+filed under its own keys and confirms each with ``conflicts_with``.
+Revoking one drops just its own conflicts. ``conflicts()`` reads the
+maintained set, so a summary costs O(conflicts) rather than a check of
+every public/secret pair.
+
+Contracts are indexed by their tags when added. To change a contract's
+clauses, revoke it and add the new version.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from .contract import Contract
+
+
+class ContractRegistry:
+    def __init__(self, contracts: Iterable[Contract] = ()) -> None:
+        self._by_id: dict[str, Contract] = {}
+        self._public: dict[str, Contract] = {}
+        self._secret: dict[str, Contract] = {}
+        self._claimants: dict[tuple[str, str], dict[str, None]] = {}  # public ids per key
+        self._breachers: dict[tuple[str, str], dict[str, None]] = {}  # secret ids per key
+        self._edges: dict[str, dict[str, None]] = {}  # id -> ids it conflicts with
+        # (public id, secret id), in discovery order
+        self._conflicts: dict[tuple[str, str], None] = {}
+        self.version = 0  # bumped on every change, for callers that cache derived output
+        for contract in contracts:
+            self.add(contract)
+
+    # -- mutation --------------------------------------------------------
+
+    def add(self, contract: Contract) -> list[Contract]:
+        """Add ``contract``; returns the contracts it newly conflicts with."""
+        if contract.id in self._by_id:
+            raise ValueError(f"contract {contract.id!r} is already registered")
+        public = bool(contract.is_public)
+        own_keys, other_index = (
+            (contract._claims, self._breachers) if public else (contract._breaches, self._claimants)
+        )
+        candidates: dict[str, None] = {}
+        for key in own_keys:
+            candidates.update(other_index.get(key, ()))
+
+        self._by_id[contract.id] = contract
+        (self._public if public else self._secret)[contract.id] = contract
+        index = self._claimants if public else self._breachers
+        for key in own_keys:
+            index.setdefault(key, {})[contract.id] = None
+        self._edges[contract.id] = {}
+
+        found = []
+        for other_id in candidates:
+            other = self._by_id[other_id]
+            if contract.conflicts_with(other):
+                self._link(contract.id, other_id, public)
+                found.append(other)
+        self.version += 1
+        return found
+
+    def add_many(self, contracts: Iterable[Contract]) -> int:
+        """Add several contracts; returns how many conflicts were found."""
+        return sum(len(self.add(c)) for c in contracts)
+
+    def revoke(self, contract_id: str) -> Contract:
+        """Remove and return a contract, dropping its conflicts (KeyError if absent)."""
+        contract = self._by_id.pop(contract_id)
+        public = bool(contract.is_public)
+        del (self._public if public else self._secret)[contract_id]
+        index, keys = (
+            (self._claimants, contract._claims) if public else (self._breachers, contract._breaches)
+        )
+        for key in keys:
+            ids = index[key]
+            del ids[contract_id]
+            if not ids:
+                del index[key]
+        for other_id in self._edges.pop(contract_id):
+            del self._edges[other_id][contract_id]
+            del self._conflicts[(contract_id, other_id) if public else (other_id, contract_id)]
+        self.version += 1
+        return contract
+
+    def _link(self, contract_id: str, other_id: str, public: bool) -> None:
+        self._edges[contract_id][other_id] = None
+        self._edges[other_id][contract_id] = None
+        self._conflicts[(contract_id, other_id) if public else (other_id, contract_id)] = None
+
+    # -- queries ---------------------------------------------------------
+
+    def get(self, contract_id: str) -> Contract | None:
+        return self._by_id.get(contract_id)
+
+    def public(self) -> list[Contract]:
+        return list(self._public.values())
+
+    def secret(self) -> list[Contract]:
+        return list(self._secret.values())
+
+    def conflicts(self) -> list[tuple[Contract, Contract]]:
+        """Every ``(public, secret)`` conflicting pair, in the order found."""
+        by_id = self._by_id
+        return [(by_id[p], by_id[s]) for p, s in self._conflicts]
+
+    def conflicts_for(self, contract_id: str) -> list[Contract]:
+        """The contracts ``contract_id`` conflicts with (KeyError if absent)."""
+        return [self._by_id[i] for i in self._edges[contract_id]]
+
+    def conflict_count(self) -> int:
+        return len(self._conflicts)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Contract]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, contract_id: object) -> bool:
+        return contract_id in self._by_id
@@ -0,0 +1,6 @@
+from .host import SessionHost, serve
+from .ring import HashRing
+from .session import Session
+from .supervisor import Supervisor
+
+__all__ = ["HashRing", "Session", "SessionHost", "Supervisor", "serve"]
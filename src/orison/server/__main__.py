@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from .hints import AsyncArbiterClient, SocketHintBackend
+from .host import serve
+from .supervisor import Supervisor
+
+
+async def _serve_with_hints(
+    host: str, port: int, max_sessions: int, hints: str, deadline: float
+) -> None:
+    hint_host, _, hint_port = hints.rpartition(":")
+    backend = SocketHintBackend(hint_host or "127.0.0.1", int(hint_port))
+    client = AsyncArbiterClient(backend, deadline=deadline)
+    try:
+        await serve(host, port, max_sessions=max_sessions, lookups={"hint": client.hint})
+    finally:
+        await backend.close()
+
+
+async def _supervise(host: str, port: int, workers: int | None, max_sessions: int) -> None:
+    supervisor = Supervisor(workers, max_sessions=max_sessions)
+    await supervisor.start(host, port)
+    try:
+        await supervisor.serve_forever()
+    finally:
+        await supervisor.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="orison.server", description="Host many Orison sessions over TCP."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument(
+        "--max-sessions", type=int, default=10_000, help="sessions per worker process"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="fork N workers sharded by player id (0 = one per core); clients send their id first",
+    )
+    parser.add_argument(
+        "--hints",
+        metavar="HOST:PORT",
+        help="ask this hint service for Arbiter hints (single worker only)",
+    )
+    parser.add_argument(
+        "--hint-deadline",
+        type=float,
+        default=0.25,
+        help="seconds before falling back to the local Arbiter",
+    )
+    args = parser.parse_args(argv)
+    if args.hints and args.workers != 1:
+        parser.error("--hints needs --workers 1")
+    try:
+        if args.hints:
+            asyncio.run(
+                _serve_with_hints(
+                    args.host, args.port, args.max_sessions, args.hints, args.hint_deadline
+                )
+            )
+        elif args.workers == 1:
+            asyncio.run(serve(args.host, args.port, max_sessions=args.max_sessions))
+        else:
+            asyncio.run(_supervise(args.host, args.port, args.workers or None, args.max_sessions))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Arbiter hints from an out-of-process backend, without stalling sessions.
+
+``AsyncArbiterClient.hint(memory)`` asks a backend for a hint and waits at
+most ``deadline`` seconds. On a timeout or a backend error it answers from
+a local fallback arbiter (``TerminalArbiter``) instead. Identical memories
+asked while a call is in flight share that one backend call. Plug it into
+a SessionHost as ``lookups={"hint": client.hint}`` and ArbiterScene's
+lookups are resolved through it.
+
+``SocketHintBackend`` talks to a hint service over one multiplexed TCP
+connection. The protocol is one JSON object per line: requests are
+``{"id": n, "memory": "..."}`` and replies are ``{"id": n, "hint": "..."}``,
+in any order. ``HintServer`` is a local stand-in for that service, backed
+by a CorpusArbiter with an optional artificial delay, so the whole path
+can be built and load-tested without an external service::
+
+    python -m orison.server.hints --port 7788 --delay 0.05
+    python -m orison.server --hints 127.0.0.1:7788
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from ..models.arbiter import Arbiter, CorpusArbiter, TerminalArbiter
+
+HintBackend = Callable[[str], Awaitable[str]]
+
+
+@dataclass
+class HintStats:
+    requests: int = 0
+    backend_calls: int = 0
+    coalesced: int = 0  # requests that joined an identical in-flight call
+    timeouts: int = 0
+    errors: int = 0
+    in_flight: int = 0
+
+
+class AsyncArbiterClient:
+    def __init__(
+        self,
+        backend: HintBackend,
+        deadline: float = 0.25,
+        fallback: Arbiter | None = None,
+    ) -> None:
+        self.backend = backend
+        self.deadline = deadline
+        self.fallback = fallback if fallback is not None else TerminalArbiter()
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._waiters: dict[str, int] = {}
+        self._stats = HintStats()
+
+    async def hint(self, memory: str) -> str:
+        stats = self._stats
+        stats.requests += 1
+        call = self._inflight.get(memory)
+        if call is None:
+            call = self._inflight[memory] = asyncio.ensure_future(self._call(memory))
+            call.add_done_callback(lambda done: self._forget(memory, done))
+        else:
+            stats.coalesced += 1
+        self._waiters[memory] = self._waiters.get(memory, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), self.deadline)
+        except TimeoutError:
+            stats.timeouts += 1
+        except asyncio.CancelledError:
+            if not call.cancelled():
+                raise  # this caller was cancelled, not the shared call
+            stats.errors += 1  # the shared call was abandoned under us: treat it as a backend error
+        except Exception:  # the backend failed; the player still gets a hint
+            stats.errors += 1
+        finally:
+            left = self._waiters[memory] - 1
+            if left:
+                self._waiters[memory] = left
+            else:
+                del self._waiters[memory]
+                if not call.done():
+                    self._forget(memory, call)  # later requests start a fresh call
+                    call.cancel()  # nobody is waiting on it any more
+        return self.fallback.trade_memory_for_hint(memory)
+
+    async def _call(self, memory: str) -> str:
+        self._stats.backend_calls += 1
+        self._stats.in_flight += 1
+        try:
+            return await self.backend(memory)
+        finally:
+            self._stats.in_flight -= 1
+
+    def _forget(self, memory: str, done: asyncio.Future) -> None:
+        if self._inflight.get(memory) is done:
+            del self._inflight[memory]
+
+    def stats(self) -> HintStats:
+        return HintStats(**vars(self._stats))
+
+
+class SocketHintBackend:
+    """A HintBackend over one TCP connection, (re)opened on demand."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 7788) -> None:
+        self.host = host
+        self.port = port
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future[str]] = {}
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, memory: str) -> str:
+        writer = await self._connect()
+        request_id = next(self._ids)
+        reply = self._pending[request_id] = asyncio.get_running_loop().create_future()
+        try:
+            writer.write(json.dumps({"id": request_id, "memory": memory}).encode("utf-8") + b"\n")
+            await writer.drain()
+            return await reply
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                reader, self._writer = await asyncio.open_connection(self.host, self.port)
+                self._reader_task = asyncio.get_running_loop().create_task(
+                    self._read(reader, self._writer)
+                )
+            return self._writer
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        error: Exception = ConnectionError("hint service closed the connection")
+        try:
+            async for line in reader:
+                message = json.loads(line)
+                reply = self._pending.get(message["id"])
+                if reply is not None and not reply.done():
+                    reply.set_result(str(message["hint"]))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            error = ConnectionError(f"hint service connection failed: {exc}")
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._writer = None
+            for reply in self._pending.values():
+                if not reply.done():
+                    reply.set_exception(error)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+
+
+class HintServer:
+    """Local stand-in for an out-of-process hint engine.
+
+    Requests on one connection are answered concurrently, each after
+    ``delay`` seconds, so a slow engine can be simulated.
+    """
+
+    def __init__(self, arbiter: Arbiter | None = None, delay: float = 0.0) -> None:
+        self.arbiter = arbiter if arbiter is not None else CorpusArbiter()
+        self.delay = delay
+        self.served = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._serve, host, port)
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None, "server not started"
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        assert self._server is not None, "server not started"
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks: set[asyncio.Task] = set()
+        try:
+            async for line in reader:
+                task = asyncio.ensure_future(self._answer(json.loads(line), writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (OSError, ValueError):
+            pass  # a broken client only loses its own connection
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _answer(self, request: dict, writer: asyncio.StreamWriter) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        hint = self.arbiter.trade_memory_for_hint(str(request.get("memory", "")))
+        self.served += 1
+        writer.write(json.dumps({"id": request.get("id"), "hint": hint}).encode("utf-8") + b"\n")
+        try:
+            await writer.drain()
+        except OSError:
+            pass
+
+
+async def _serve_hints(host: str, port: int, delay: float) -> None:
+    server = HintServer(delay=delay)
+    await server.start(host, port)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="orison.server.hints", description="Stand-in Arbiter hint service."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7788)
+    parser.add_argument(
+        "--delay", type=float, default=0.0, help="seconds to wait before each reply"
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve_hints(args.host, args.port, args.delay))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
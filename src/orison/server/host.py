@@ -0,0 +1,239 @@
+"""Asyncio host that multiplexes many line-oriented sessions on one loop.
+
+Each TCP client gets one ``Session`` and one coroutine. A session never reads
+its next line until the previous frame has been handed to the kernel, so a
+slow client only parks its own coroutine; one that stays stalled past
+``drain_timeout`` is disconnected instead of growing an unbounded buffer.
+
+A scene that pauses on a ``Lookup`` (e.g. an Arbiter hint) is resolved by
+awaiting the matching entry of ``lookups``, so a slow backend parks only
+that session's coroutine. Kinds without a resolver use the lookup's
+fallback.
+
+Clients are plain non-blocking sockets, so a live session can be detached
+(socket, unread bytes and all) and attached to another host, see
+``orison.server.supervisor``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import socket
+from collections.abc import Awaitable, Callable, Mapping
+
+from ..engine import Lookup, Scene
+from ..engine.autosave import AutosaveService
+from .session import Session
+
+
+class _Client:
+    __slots__ = ("session", "sock", "buffer", "task", "idle", "detached")
+
+    def __init__(self, session: Session, sock: socket.socket, buffer: bytes) -> None:
+        self.session = session
+        self.sock = sock
+        self.buffer = buffer
+        self.task: asyncio.Task | None = None
+        self.idle = asyncio.Event()  # set while waiting on the client, safe to detach
+        self.detached = False
+
+
+class SessionHost:
+    def __init__(
+        self,
+        scenes: Mapping[str, Scene] | None = None,
+        *,
+        max_sessions: int = 10_000,
+        drain_timeout: float = 10.0,
+        line_limit: int = 4096,
+        on_close: Callable[[str], None] | None = None,
+        autosave: AutosaveService | None = None,
+        lookups: Mapping[str, Callable[[str], Awaitable[str]]] | None = None,
+    ) -> None:
+        self.scenes = scenes
+        self.max_sessions = max_sessions
+        self.drain_timeout = drain_timeout
+        self.line_limit = line_limit
+        self.on_close = on_close
+        self.autosave = autosave
+        self.lookups = dict(lookups or {})
+        self.clients: dict[str, _Client] = {}
+        self._ids = itertools.count(1)
+        self._listener: socket.socket | None = None
+        self._accept_task: asyncio.Task | None = None
+
+    @property
+    def sessions(self) -> dict[str, Session]:
+        return {sid: c.session for sid, c in self.clients.items()}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        listener = socket.create_server((host, port), backlog=1024)
+        listener.setblocking(False)
+        self._listener = listener
+        self._accept_task = asyncio.get_running_loop().create_task(self._accept_loop())
+
+    @property
+    def port(self) -> int:
+        assert self._listener is not None, "host not started"
+        return self._listener.getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        assert self._accept_task is not None, "host not started"
+        await self._accept_task
+
+    async def close(self) -> None:
+        if self._accept_task is not None:
+            self._accept_task.cancel()
+            await asyncio.gather(self._accept_task, return_exceptions=True)
+            self._accept_task = None
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        tasks = [c.task for c in self.clients.values() if c.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _accept_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._listener is not None
+        while True:
+            sock, _ = await loop.sock_accept(self._listener)
+            self.attach(sock)
+
+    def attach(
+        self,
+        sock: socket.socket,
+        session: Session | None = None,
+        initial: bytes = b"",
+        session_id: str | None = None,
+    ) -> Session | None:
+        """Start serving ``sock``; pass ``session`` to resume a detached one."""
+        sock.setblocking(False)
+        sid = session.session_id if session is not None else (session_id or f"s{next(self._ids)}")
+        if len(self.clients) >= self.max_sessions or sid in self.clients:
+            reason = "Server full." if sid not in self.clients else "Session already active."
+            try:
+                sock.send(f"{reason} Try again later.\n".encode())
+            except OSError:
+                pass
+            sock.close()
+            return None
+        resumed = session is not None
+        if session is None:
+            session = Session(sid, scenes=self.scenes)
+        session.defer_lookups = bool(self.lookups)
+        if self.autosave is not None:
+            self.autosave.watch(session.state, sid)
+        client = _Client(session, sock, initial)
+        self.clients[sid] = client
+        client.task = asyncio.get_running_loop().create_task(self._serve(client, resumed))
+        return session
+
+    async def detach(self, session_id: str) -> tuple[Session, socket.socket, bytes] | None:
+        """Stop serving a session without closing its socket.
+
+        Waits until the session is idle (between frames), so no output is cut
+        short; returns the session, its socket and any bytes read but not yet
+        fed.
+        """
+        client = self.clients.get(session_id)
+        if client is None or client.task is None or client.detached:
+            return None
+        client.detached = True  # claim it; a concurrent detach gets None
+        idle = asyncio.ensure_future(client.idle.wait())
+        await asyncio.wait({idle, client.task}, return_when=asyncio.FIRST_COMPLETED)
+        idle.cancel()
+        if client.task.done():  # the client left while we waited
+            client.sock.close()
+            if self.on_close is not None:
+                self.on_close(session_id)
+            return None
+        client.task.cancel()
+        await asyncio.gather(client.task, return_exceptions=True)
+        return client.session, client.sock, client.buffer
+
+    async def _serve(self, client: _Client, resumed: bool) -> None:
+        loop = asyncio.get_running_loop()
+        session = client.session
+        try:
+            if not resumed and not await self._step(client, session.start()):
+                return
+            while not session.closed:
+                line = self._next_line(client)
+                if line is None:
+                    client.idle.set()
+                    try:
+                        data = await loop.sock_recv(client.sock, self.line_limit)
+                    except ConnectionError:
+                        break
+                    finally:
+                        client.idle.clear()
+                    if not data:
+                        break  # client went away
+                    client.buffer += data
+                    if b"\n" not in client.buffer and len(client.buffer) > self.line_limit:
+                        break  # oversized line; drop the client rather than buffer it
+                    continue
+                if not await self._step(client, session.feed(line)):
+                    return
+        finally:
+            self.clients.pop(session.session_id, None)
+            if self.autosave is not None:  # detached or closed, this host stops saving it
+                self.autosave.unwatch(session.state)
+            if not client.detached:
+                client.sock.close()
+                if self.on_close is not None:
+                    self.on_close(session.session_id)
+
+    @staticmethod
+    def _next_line(client: _Client) -> str | None:
+        raw, sep, rest = client.buffer.partition(b"\n")
+        if not sep:
+            return None
+        client.buffer = rest
+        return raw.decode("utf-8", errors="replace").rstrip("\r")
+
+    async def _step(self, client: _Client, lines: list[str]) -> bool:
+        """Send a frame's output, then resolve any lookups it parked on."""
+        session = client.session
+        if not await self._send(client, lines):
+            return False
+        while session.lookup is not None:
+            value = await self._resolve(session.lookup)
+            if not await self._send(client, session.resolve(value)):
+                return False
+        return True
+
+    async def _resolve(self, lookup: Lookup) -> str:
+        resolver = self.lookups.get(lookup.kind)
+        if resolver is None:
+            return lookup.fallback()
+        try:
+            return await resolver(lookup.arg)
+        except Exception:  # a broken resolver must not end the player's session
+            return lookup.fallback()
+
+    async def _send(self, client: _Client, lines: list[str]) -> bool:
+        """Write one frame and wait for the kernel to take it; False drops the client."""
+        chunk = "".join(f"{line}\n" for line in lines) + client.session.prompt
+        if not chunk:
+            return True
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().sock_sendall(client.sock, chunk.encode("utf-8")),
+                self.drain_timeout,
+            )
+        except (TimeoutError, OSError):
+            return False
+        return True
+
+
+async def serve(host: str = "127.0.0.1", port: int = 7777, **options) -> None:
+    session_host = SessionHost(**options)
+    await session_host.start(host, port)
+    try:
+        await session_host.serve_forever()
+    finally:
+        await session_host.close()
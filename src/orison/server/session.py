@@ -0,0 +1,220 @@
+"""Non-blocking session driver over the scene protocols.
+
+``StepScene``s are driven through a ``SceneRunner``: the scene pauses at each
+Prompt and is resumed when the client's next line arrives, so a session holds
+one suspended generator and no thread.
+
+Legacy scenes that only implement the blocking ``Scene.run`` still work: they
+run against a replaying InputPort. When such a scene asks for a line that has
+not arrived yet, the run is abandoned, the state is rolled back to the
+frame's start, and the scene is re-run from the top once the next line is
+fed. Lines already written are suppressed on replay, so the client sees each
+line exactly once.
+
+A StepScene can also pause on a ``Lookup`` (a value such as an arbiter hint
+that should not be computed inline). By default the session resolves it on
+the spot with ``lookup.fallback()``. With ``defer_lookups`` set, the session
+parks on it instead (``lookup`` is set and ``prompt`` is empty) until the
+host calls ``resolve(value)``. Resolved values are kept with the frame's
+answers, so a replay after a handoff sees the same values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from ..engine import GameState, Lookup, Prompt, Scene, SceneRunner, StepScene
+from ..engine.snapshot import StateSnapshot
+
+
+class _NeedInput(Exception):
+    """Raised by the replay port when the scene outruns the buffered input."""
+
+    def __init__(self, prompt: str) -> None:
+        super().__init__(prompt)
+        self.prompt = prompt
+
+
+class _FrameIO:
+    """InputPort/OutputPort pair for one attempt at running a scene frame."""
+
+    __slots__ = ("answers", "pos", "skip", "written", "out")
+
+    def __init__(self, answers: list[str], skip: int) -> None:
+        self.answers = answers
+        self.pos = 0
+        self.skip = skip  # lines already delivered by an earlier attempt
+        self.written = 0
+        self.out: list[str] = []
+
+    def write_line(self, text: str) -> None:
+        self.written += 1
+        if self.written > self.skip:
+            self.out.append(text)
+
+    def read_line(self, prompt: str = "") -> str:
+        if self.pos >= len(self.answers):
+            raise _NeedInput(prompt)
+        answer = self.answers[self.pos]
+        self.pos += 1
+        return answer
+
+
+class Session:
+    """One player's game, driven line by line instead of by a blocking loop.
+
+    ``start()``, ``feed()`` and ``resolve()`` return the output produced
+    since the last call; ``prompt`` holds the text the scene is currently
+    waiting on, and ``lookup`` the Lookup it is parked on, if any.
+    """
+
+    __slots__ = (
+        "session_id", "state", "scenes", "prompt", "lookup", "defer_lookups",
+        "_answers", "_emitted", "_frame", "_runner", "_io",
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        state: GameState | None = None,
+        scenes: Mapping[str, Scene] | None = None,
+        defer_lookups: bool = False,
+    ) -> None:
+        if scenes is None:
+            from ..io.terminal.app import SCENES
+
+            scenes = SCENES
+        self.session_id = session_id
+        self.state = state if state is not None else GameState()
+        self.scenes = scenes
+        self.prompt = ""
+        self.lookup: Lookup | None = None
+        self.defer_lookups = defer_lookups
+        self._answers: list[str] = []
+        self._emitted = 0
+        self._frame: StateSnapshot | None = None  # state at the start of the pending scene
+        self._runner: SceneRunner | None = None  # paused StepScene, if any
+        self._io: _FrameIO | None = None
+
+    @property
+    def closed(self) -> bool:
+        return not self.state.running
+
+    def start(self) -> list[str]:
+        return self._advance()
+
+    def feed(self, line: str) -> list[str]:
+        if self.closed:
+            return []
+        if self.lookup is not None:
+            raise RuntimeError("session is waiting on a lookup; resolve() it first")
+        return self._resume(line)
+
+    def resolve(self, value: str) -> list[str]:
+        """Resume the frame parked on ``lookup`` with its resolved value."""
+        if self.lookup is None:
+            raise RuntimeError("no lookup pending")
+        self.lookup = None
+        return self._resume(value)
+
+    def _resume(self, line: str) -> list[str]:
+        self._answers.append(line)
+        runner, io = self._runner, self._io
+        if runner is None or io is None:
+            return self._advance()
+        prompt = self._settle(runner, runner.resume(line))
+        out, io.out = io.out, []
+        if prompt is not None:
+            self._pause(prompt, io)
+            return out
+        self._end_frame()
+        return out + self._advance()
+
+    def to_dict(self) -> dict:
+        """Portable form used to hand a live session to another worker.
+
+        The state is taken as of the pending frame's start; together with the
+        frame's answers so far that is enough to resume mid-frame (by replay)
+        without re-sending output.
+        """
+        return {
+            "session_id": self.session_id,
+            "state": (self._frame if self._frame is not None else self.state).to_dict(),
+            "answers": list(self._answers),
+            "emitted": self._emitted,
+            "prompt": self.prompt,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, scenes: Mapping[str, Scene] | None = None) -> Session:
+        session = cls(data["session_id"], GameState.from_dict(data.get("state", {})), scenes)
+        session._answers = list(data.get("answers", []))
+        session._emitted = int(data.get("emitted", 0))
+        session.prompt = data.get("prompt", "")
+        return session
+
+    def _advance(self) -> list[str]:
+        out: list[str] = []
+        state = self.state
+        while state.running:
+            scene = self.scenes.get(state.current_scene_id)
+            if scene is None:
+                out.append(f"Unknown scene: {state.current_scene_id}")
+                state.stop()
+                break
+            if self._frame is None:
+                self._frame = state.snapshot()  # O(1); rolled back to if a legacy scene blocks
+            io = _FrameIO(self._answers, self._emitted)
+            if isinstance(scene, StepScene):
+                runner = SceneRunner(scene, state, io)
+                prompt = runner.start()
+                for answer in self._answers:  # only after a handoff mid-frame
+                    if prompt is None:
+                        break
+                    prompt = runner.resume(answer)
+                prompt = self._settle(runner, prompt)
+                out.extend(io.out)
+                if prompt is not None:
+                    io.out = []
+                    self._runner = runner
+                    self._pause(prompt, io)
+                    return out
+            else:
+                try:
+                    scene.run(state, io, io)
+                except _NeedInput as need:
+                    out.extend(io.out)
+                    self._pause(Prompt(need.prompt), io)
+                    state.restore(self._frame)
+                    return out
+                out.extend(io.out)
+            self._end_frame()
+        self.prompt = ""
+        return out
+
+    def _settle(
+        self, runner: SceneRunner, prompt: Prompt | Lookup | None
+    ) -> Prompt | Lookup | None:
+        """Resolve lookups inline with their fallback unless they are deferred."""
+        while isinstance(prompt, Lookup) and not self.defer_lookups:
+            value = prompt.fallback()
+            self._answers.append(value)
+            prompt = runner.resume(value)
+        return prompt
+
+    def _pause(self, prompt: Prompt | Lookup, io: _FrameIO) -> None:
+        self._emitted = max(self._emitted, io.written)
+        self._io = io
+        if isinstance(prompt, Lookup):
+            self.lookup = prompt
+            self.prompt = ""
+        else:
+            self.lookup = None
+            self.prompt = prompt.text
+
+    def _end_frame(self) -> None:
+        self._answers.clear()
+        self._emitted = 0
+        self._frame = None
+        self._runner = None
+        self._io = None
@@ -0,0 +1,354 @@
+"""Multi-process supervisor that shards sessions across forked workers.
+
+The supervisor owns the listening socket. Each client opens with one line
+naming its player id; the supervisor picks the owning worker from a
+consistent hash of that id and passes the client socket itself (not a proxy)
+over a Unix ``SOCK_SEQPACKET`` control channel, so game traffic never crosses
+the supervisor again. Every worker runs its own ``SessionHost`` loop and
+therefore its own core.
+
+Draining or adding a worker moves only the sessions whose owner changed: the
+old owner detaches each one between frames and returns ``Session.to_dict()``
+(built on ``GameState.to_dict``) with the socket; the supervisor forwards
+both to the new owner, which resumes with ``Session.from_dict``.
+
+Linux-only: relies on ``fork`` and descriptor passing (``socket.send_fds``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+from collections import defaultdict
+
+from .host import SessionHost
+from .ring import HashRing
+from .session import Session
+
+_MAX_MESSAGE = 1 << 20
+
+
+def _send(ctrl: socket.socket, message: dict, fd: int | None = None) -> None:
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    socket.send_fds(ctrl, [payload], [fd] if fd is not None else [])
+
+
+def _recv(ctrl: socket.socket) -> tuple[dict | None, list[int]]:
+    try:
+        data, fds, _flags, _addr = socket.recv_fds(ctrl, _MAX_MESSAGE, 1)
+    except OSError:
+        return None, []
+    if not data:
+        return None, fds
+    return json.loads(data), fds
+
+
+def _control_pair() -> tuple[socket.socket, socket.socket]:
+    parent, child = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    for end in (parent, child):
+        end.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _MAX_MESSAGE)
+    return parent, child
+
+
+class _Worker:
+    """Worker-process side: one SessionHost fed by the control channel."""
+
+    def __init__(self, name: str, ctrl: socket.socket, max_sessions: int = 10_000) -> None:
+        self.name = name
+        self.ctrl = ctrl
+        self.host = SessionHost(max_sessions=max_sessions, on_close=self._on_close)
+        self._done: asyncio.Future | None = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._done = loop.create_future()
+        loop.add_reader(self.ctrl, self._on_message)
+        try:
+            await self._done
+        finally:
+            loop.remove_reader(self.ctrl)
+            self.host.on_close = None
+            await self.host.close()
+            self.ctrl.close()
+
+    def _finish(self) -> None:
+        if self._done is not None and not self._done.done():
+            self._done.set_result(None)
+
+    def _on_message(self) -> None:
+        message, fds = _recv(self.ctrl)
+        if message is None:
+            self._finish()  # supervisor went away
+            return
+        op = message["op"]
+        if op == "attach":
+            data = message.get("session")
+            attached = self.host.attach(
+                socket.socket(fileno=fds[0]),
+                session=Session.from_dict(data) if data else None,
+                initial=message.get("initial", "").encode("latin-1"),
+                session_id=message["player"],
+            )
+            if attached is None and message["player"] not in self.host.clients:
+                self._on_close(message["player"])  # turned away (full): not placed here
+        elif op == "release":
+            asyncio.ensure_future(self._release(message["players"]))
+        elif op == "drain":
+            asyncio.ensure_future(self._drain())
+        elif op == "stop":
+            self._finish()
+
+    async def _release(self, players: list[str]) -> None:
+        for player in players:
+            detached = await self.host.detach(player)
+            if detached is None:
+                continue
+            session, sock, buffer = detached
+            _send(
+                self.ctrl,
+                {
+                    "op": "handoff",
+                    "player": player,
+                    "session": session.to_dict(),
+                    "initial": buffer.decode("latin-1"),
+                },
+                sock.fileno(),
+            )
+            sock.close()
+
+    async def _drain(self) -> None:
+        await self._release(list(self.host.clients))
+        _send(self.ctrl, {"op": "drained"})
+        self._finish()
+
+    def _on_close(self, player: str) -> None:
+        try:
+            _send(self.ctrl, {"op": "closed", "player": player})
+        except OSError:
+            pass
+
+
+def _worker_main(
+    name: str, ctrl: socket.socket, inherited: list[int], max_sessions: int
+) -> None:
+    for fd in inherited:  # the supervisor's listener and other workers' channels
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    asyncio.run(_Worker(name, ctrl, max_sessions).run())
+
+
+class _WorkerHandle:
+    __slots__ = ("name", "process", "ctrl", "drained")
+
+    def __init__(self, name: str, process, ctrl: socket.socket) -> None:
+        self.name = name
+        self.process = process
+        self.ctrl = ctrl
+        self.drained = asyncio.Event()
+
+
+class Supervisor:
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        vnodes: int = 64,
+        handshake_timeout: float = 10.0,
+        line_limit: int = 4096,
+        max_sessions: int = 10_000,
+    ) -> None:
+        self.initial_workers = workers or os.cpu_count() or 1
+        self.max_sessions = max_sessions  # per worker
+        self.handshake_timeout = handshake_timeout
+        self.line_limit = line_limit
+        self.ring = HashRing(vnodes=vnodes)
+        self.workers: dict[str, _WorkerHandle] = {}
+        self.placement: dict[str, str] = {}  # player id -> worker name
+        self._names = itertools.count()
+        self._listener: socket.socket | None = None
+        self._accept_task: asyncio.Task | None = None
+        self._pending: set[socket.socket] = set()
+        self._moving: set[str] = set()  # released by their owner, handoff not yet routed
+        self._settled = asyncio.Event()  # set while nothing is moving
+        self._settled.set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        listener = socket.create_server((host, port), backlog=1024)
+        listener.setblocking(False)
+        self._listener = listener
+        for _ in range(self.initial_workers):
+            self._spawn()
+        self._accept_task = asyncio.get_running_loop().create_task(self._accept_loop())
+
+    @property
+    def port(self) -> int:
+        assert self._listener is not None, "supervisor not started"
+        return self._listener.getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        assert self._accept_task is not None, "supervisor not started"
+        await self._accept_task
+
+    def _spawn(self) -> str:
+        name = f"w{next(self._names)}"
+        parent, child = _control_pair()
+        inherited = [parent.fileno()] + [h.ctrl.fileno() for h in self.workers.values()]
+        inherited += [s.fileno() for s in self._pending]
+        if self._listener is not None:
+            inherited.append(self._listener.fileno())
+        process = multiprocessing.get_context("fork").Process(
+            target=_worker_main,
+            args=(name, child, inherited, self.max_sessions),
+            name=f"orison-{name}",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        handle = _WorkerHandle(name, process, parent)
+        self.workers[name] = handle
+        self.ring.add(name)
+        asyncio.get_running_loop().add_reader(parent, self._on_message, handle)
+        return name
+
+    async def add_worker(self) -> str:
+        """Fork one more worker and move over the sessions that now hash to it."""
+        name = self._spawn()
+        moves: dict[str, list[str]] = defaultdict(list)
+        for player, owner in self.placement.items():
+            if player not in self._moving and self.ring.node_for(player) != owner:
+                moves[owner].append(player)
+        for owner, players in moves.items():
+            self._moving.update(players)
+            self._settled.clear()
+            _send(self.workers[owner].ctrl, {"op": "release", "players": players})
+        return name
+
+    async def rebalanced(self) -> None:
+        """Wait until every session moved by ``add_worker`` is routed or gone."""
+        await self._settled.wait()
+
+    def _moved(self, player: str) -> None:
+        self._moving.discard(player)
+        if not self._moving:
+            self._settled.set()
+
+    async def drain(self, name: str) -> None:
+        """Hand every session of ``name`` to the remaining workers, then stop it."""
+        handle = self.workers[name]
+        if len(self.workers) == 1:
+            raise RuntimeError("cannot drain the last worker")
+        self.ring.remove(name)
+        _send(handle.ctrl, {"op": "drain"})
+        await handle.drained.wait()
+        await self._retire(handle)
+
+    async def close(self) -> None:
+        if self._accept_task is not None:
+            self._accept_task.cancel()
+            await asyncio.gather(self._accept_task, return_exceptions=True)
+            self._accept_task = None
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        for handle in list(self.workers.values()):
+            try:
+                _send(handle.ctrl, {"op": "stop"})
+            except OSError:
+                pass
+            await self._retire(handle)
+
+    async def _retire(self, handle: _WorkerHandle) -> None:
+        loop = asyncio.get_running_loop()
+        loop.remove_reader(handle.ctrl)
+        handle.ctrl.close()
+        self.workers.pop(handle.name, None)
+        self.ring.remove(handle.name)
+        await loop.run_in_executor(None, handle.process.join)
+
+    async def _accept_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._listener is not None
+        while True:
+            sock, _ = await loop.sock_accept(self._listener)
+            loop.create_task(self._handshake(sock))
+
+    async def _handshake(self, sock: socket.socket) -> None:
+        loop = asyncio.get_running_loop()
+        sock.setblocking(False)
+        self._pending.add(sock)
+        try:
+            buffer = b""
+            while b"\n" not in buffer:
+                data = await asyncio.wait_for(
+                    loop.sock_recv(sock, self.line_limit), self.handshake_timeout
+                )
+                if not data or len(buffer) > self.line_limit:
+                    sock.close()
+                    return
+                buffer += data
+            raw, _, rest = buffer.partition(b"\n")
+            player = raw.decode("utf-8", errors="replace").strip()
+            if not player:
+                sock.close()
+                return
+            self._route(player, sock, rest)
+        except (TimeoutError, OSError):
+            sock.close()
+        finally:
+            self._pending.discard(sock)
+
+    def _route(
+        self, player: str, sock: socket.socket, initial: bytes, session: dict | None = None
+    ) -> None:
+        handle = self.workers[self.ring.node_for(player)]
+        initial_text = initial.decode("latin-1")
+        message = {"op": "attach", "player": player, "session": session, "initial": initial_text}
+        try:
+            _send(handle.ctrl, message, sock.fileno())
+        except OSError:
+            self._drop(handle)  # the client is lost with it, as on a crash
+            self.placement.pop(player, None)
+            return
+        finally:
+            sock.close()  # the worker holds its own copy now
+        self.placement[player] = handle.name
+
+    def _drop(self, handle: _WorkerHandle) -> None:
+        """A worker died: its sessions are gone; stop routing to it."""
+        if self.workers.get(handle.name) is not handle:
+            return
+        asyncio.get_running_loop().remove_reader(handle.ctrl)
+        handle.ctrl.close()
+        self.ring.remove(handle.name)
+        del self.workers[handle.name]
+        for player in [p for p, owner in self.placement.items() if owner == handle.name]:
+            del self.placement[player]
+            self._moved(player)  # a release it never answered
+
+    def _on_message(self, handle: _WorkerHandle) -> None:
+        message, fds = _recv(handle.ctrl)
+        if message is None:
+            self._drop(handle)
+            return
+        op = message["op"]
+        if op == "handoff":
+            self._moved(message["player"])
+            self._route(
+                message["player"],
+                socket.socket(fileno=fds[0]),
+                message.get("initial", "").encode("latin-1"),
+                message["session"],
+            )
+        elif op == "closed":
+            # the client may leave before its owner handles a release; no handoff follows
+            self._moved(message["player"])
+            if self.placement.get(message["player"]) == handle.name:
+                del self.placement[message["player"]]
+        elif op == "drained":
+            handle.drained.set()
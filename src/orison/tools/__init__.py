@@ -0,0 +1 @@
+"""Offline maintenance tools (``python -m orison.tools.<name>``)."""
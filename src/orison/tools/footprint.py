@@ -0,0 +1,121 @@
+"""Report the memory one hosted session costs.
+
+    python -m orison.tools.footprint [--sessions 2000] [--marks 40] [--flags 30]
+
+Builds a synthetic population of GameStates shaped like real play (shared
+story marks, a few per-player marks, story flags, faction reputation) and
+walks each one's object graph. Objects shared between sessions (interned
+strings, interned Marks, small ints) are counted once for the whole
+population, so the figures are the amortized bytes each extra player adds.
+The synthetic story flags are declared only while ``measure`` runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterable
+from dataclasses import fields
+
+from ..engine import GameState
+from ..engine.flags import flag_scope
+from ..models import Mark
+
+_FACTIONS = ("scribes", "mariners", "lamplighters", "archivists")
+
+
+def deep_sizeof(obj: object, seen: set[int]) -> int:
+    """Bytes reachable from ``obj`` that are not already in ``seen``."""
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif isinstance(o, (str, bytes, int, float, bool, type(None))):
+            continue
+        else:
+            if hasattr(o, "__dict__"):
+                stack.append(vars(o))
+            for cls in type(o).__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if name not in ("__weakref__", "__dict__") and hasattr(o, name):
+                        stack.append(getattr(o, name))
+    return size
+
+
+def synthetic_population(sessions: int, marks: int = 40, flags: int = 30) -> list[GameState]:
+    """Build the population.
+
+    ``story_flag_*`` are bitset flags only if declared (see ``measure``).
+    """
+    shared = [(f"M-STORY-{i}", "seal" if i % 3 else "witness", i % 3 == 0) for i in range(marks)]
+    population = []
+    for n in range(sessions):
+        state = GameState(player_name=f"player-{n}")
+        state.goto(("intro", "audit", "arbiter", "ritual")[n % 4])
+        for i in range(marks):  # most marks come from the story and are identical
+            state.add_mark(Mark.of(*shared[i]) if i % 8 else Mark.of(f"M-{n}-{i}", "token"))
+        for i in range(flags):
+            state.set_flag(f"story_flag_{i}", (n + i) % 2 == 0 if i % 5 else n)
+        for i, faction in enumerate(_FACTIONS):
+            state.adjust_rep(faction, (n + i) % 7 - 3)
+        population.append(state)
+    return population
+
+
+def footprint(states: Iterable[GameState]) -> dict[str, float]:
+    """Average bytes per session, per GameState field and in ``"total"``."""
+    states = list(states)
+    if not states:
+        return {"total": 0.0}
+    seen: set[int] = set()
+    names = [f.name for f in fields(GameState)]
+    totals = dict.fromkeys(names, 0)
+    shell = 0
+    for state in states:
+        seen.add(id(state))
+        shell += sys.getsizeof(state)
+        if hasattr(state, "__dict__"):  # an unslotted GameState pays for its dict too
+            shell += sys.getsizeof(vars(state))
+        for name in names:
+            totals[name] += deep_sizeof(getattr(state, name), seen)
+    report = {name: total / len(states) for name, total in totals.items()}
+    report["(object)"] = shell / len(states)
+    report["total"] = sum(report.values())  # adds up to the breakdown exactly
+    return report
+
+
+def measure(sessions: int, marks: int = 40, flags: int = 30) -> dict[str, float]:
+    """``footprint`` of a synthetic population, with its story flags declared meanwhile."""
+    with flag_scope(*(f"story_flag_{i}" for i in range(flags))):  # as the story declares its flags
+        return footprint(synthetic_population(sessions, marks, flags))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="orison.tools.footprint", description="Per-session memory report."
+    )
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--marks", type=int, default=40)
+    parser.add_argument("--flags", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    report = measure(args.sessions, args.marks, args.flags)
+    total = report.pop("total")
+    print(f"{args.sessions} sessions, {args.marks} marks, {args.flags} flags each")
+    for name, size in sorted(report.items(), key=lambda kv: -kv[1]):
+        print(f"  {name:<18}{size:10.0f} B")
+    print(f"  {'total':<18}{total:10.0f} B/session")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Upgrade saves to the current schema version ahead of time.
+
+    python -m orison.tools.migrate save_game [--workers N]
+    python -m orison.tools.migrate --sqlite save_game/saves.db
+
+Loading already migrates on read (engine/migrations.py); this tool lets a
+deployment upgrade everything in the background instead. Files are
+migrated independently across a process pool, each rewritten atomically,
+so the tool can be stopped and rerun at any point.
+
+Binary saves (``.orsb``) and archives (``.orpk``) carry their schema
+version in each save header and are re-encoded when it is out of date.
+Journal checkpoints migrate on read and are rewritten at the next
+compaction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..engine import codec
+from ..engine.archive import ARCHIVE_EXTENSION, SaveArchive, write_archive
+from ..engine.game_state import GameState, atomic_write
+from ..engine.migrations import SCHEMA_VERSION, migrate, needs_migration
+from ..engine.store import SaveStore
+
+Progress = Callable[[int, int], None]
+_SUFFIXES = (".json", codec.EXTENSION, ARCHIVE_EXTENSION)
+
+
+@dataclass
+class MigrationReport:
+    migrated: int = 0
+    current: int = 0
+    failed: list[str] = field(default_factory=list)
+
+    def add(self, name: str, outcome: str) -> None:
+        if outcome == "migrated":
+            self.migrated += 1
+        elif outcome == "current":
+            self.current += 1
+        else:
+            self.failed.append(f"{name}: {outcome}")
+
+
+def migrate_file(path: str | Path) -> str:
+    """Upgrade one save or archive in place; returns "migrated", "current" or an error message."""
+    p = Path(path)
+    try:
+        if p.suffix == ARCHIVE_EXTENSION:
+            return _migrate_archive(p)
+        raw = p.read_bytes()
+        if codec.is_binary(raw):
+            if codec.schema_version(raw) == SCHEMA_VERSION:
+                return "current"
+            state = GameState()
+            codec.decode_into(state, raw)
+            atomic_write(p, codec.encode_state(state))
+            return "migrated"
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            return "not a save document"
+        if not needs_migration(data):
+            return "current"
+        text = json.dumps(migrate(data), ensure_ascii=False, indent=2)
+        atomic_write(p, text.encode("utf-8"))
+    except (OSError, ValueError, TypeError) as exc:
+        return str(exc)
+    return "migrated"
+
+
+def _migrate_archive(path: Path) -> str:
+    tmp = path.with_name(path.name + ".migrating")
+    with SaveArchive(path) as archive:
+        if all(codec.schema_version(archive.payload(key)) == SCHEMA_VERSION for key in archive):
+            return "current"
+        write_archive(tmp, archive.items())
+    tmp.replace(path)  # after the old mapping is closed
+    return "migrated"
+
+
+def _migrate_doc(data: dict) -> tuple[str, dict | None]:
+    """(outcome, upgraded document); a bad document fails alone, not the batch."""
+    try:
+        if not needs_migration(data):
+            return "current", None
+        return "migrated", migrate(data)
+    except ValueError as exc:
+        return str(exc), None
+
+
+def migrate_directory(
+    directory: str | Path, workers: int | None = None, progress: Progress | None = None
+) -> MigrationReport:
+    root = Path(directory)
+    paths = sorted(p for p in root.iterdir() if p.suffix in _SUFFIXES) if root.is_dir() else []
+    report = MigrationReport()
+    with ProcessPoolExecutor(workers) as pool:
+        outcomes = pool.map(migrate_file, paths, chunksize=max(1, len(paths) // 256))
+        for done, (path, outcome) in enumerate(zip(paths, outcomes, strict=True), 1):
+            report.add(path.name, outcome)
+            if progress:
+                progress(done, len(paths))
+    return report
+
+
+def migrate_store(
+    store: SaveStore, workers: int | None = None, progress: Progress | None = None, chunk: int = 512
+) -> MigrationReport:
+    """Migrate every slot of ``store``: reads and writes here, upgrades in the pool."""
+    slots = store.slots()
+    report = MigrationReport()
+    done = 0
+    with ProcessPoolExecutor(workers) as pool:
+        for start in range(0, len(slots), chunk):
+            batch = slots[start:start + chunk]
+            docs = []
+            for slot in batch:
+                try:
+                    docs.append(store.get(slot))
+                except (OSError, ValueError) as exc:
+                    report.add(slot, str(exc))
+                    docs.append(None)
+            live = [(slot, doc) for slot, doc in zip(batch, docs, strict=True) if doc is not None]
+            upgraded = pool.map(_migrate_doc, [doc for _, doc in live])
+            for (slot, _), (outcome, new) in zip(live, upgraded, strict=True):
+                if new is not None:
+                    store.put(slot, new)
+                report.add(slot, outcome)
+            store.flush()
+            done += len(batch)
+            if progress:
+                progress(done, len(slots))
+    return report
+
+
+def _print_progress(done: int, total: int) -> None:
+    end = "\n" if done == total else ""
+    print(f"\rmigrated {done}/{total}", end=end, file=sys.stderr, flush=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="orison.tools.migrate", description="Upgrade saves to the current schema."
+    )
+    parser.add_argument("directory", nargs="?", default="save_game")
+    parser.add_argument(
+        "--sqlite", metavar="DB", help="migrate a SQLite save store instead of a directory"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: one per core)"
+    )
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    progress = None if args.quiet else _print_progress
+
+    if args.sqlite:
+        from ..engine.store import SQLiteSaveStore
+
+        store = SQLiteSaveStore(args.sqlite)
+        try:
+            report = migrate_store(store, args.workers, progress)
+        finally:
+            store.close()
+    else:
+        report = migrate_directory(args.directory, args.workers, progress)
+    for failure in report.failed:
+        print(f"failed {failure}", file=sys.stderr)
+    print(
+        f"{report.migrated} migrated, {report.current} already current, "
+        f"{len(report.failed)} failed"
+    )
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
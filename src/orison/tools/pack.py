@@ -0,0 +1,75 @@
+"""Convert between ``save_game/*.json`` files and a packed archive.
+
+    python -m orison.tools.pack pack save_game save_game/sessions.orpk
+    python -m orison.tools.pack unpack save_game/sessions.orpk restored/
+
+Archive keys are the JSON file stems; unpacking writes ``<key>.json`` back.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from ..engine import GameState
+from ..engine.archive import SaveArchive, write_archive
+
+
+def _read_saves(directory: Path, errors: list[str]) -> Iterator[tuple[str, GameState]]:
+    for path in sorted(directory.glob("*.json")):
+        state = GameState()
+        try:
+            state.load_json_into_self(path)
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            errors.append(f"{path.name}: {exc}")
+            continue
+        yield path.stem, state
+
+
+def pack(directory: str | Path, archive: str | Path) -> tuple[int, list[str]]:
+    """Pack every JSON save in ``directory``; returns (packed, skipped files)."""
+    errors: list[str] = []
+    count = write_archive(archive, _read_saves(Path(directory), errors))
+    return count, errors
+
+
+def unpack(archive: str | Path, directory: str | Path) -> int:
+    out = Path(directory)
+    with SaveArchive(archive) as packed:
+        for key, state in packed.items():
+            state.save_json(out / f"{key}.json")
+    return len(packed)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="orison.tools.pack", description="Pack or unpack JSON saves."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("pack", help="pack DIR/*.json into ARCHIVE")
+    p.add_argument("directory")
+    p.add_argument("archive")
+    u = sub.add_parser("unpack", help="write ARCHIVE's sessions to DIR/<key>.json")
+    u.add_argument("archive")
+    u.add_argument("directory")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "pack":
+            count, errors = pack(args.directory, args.archive)
+            for err in errors:
+                print(f"skipped {err}", file=sys.stderr)
+            print(f"packed {count} saves into {args.archive}")
+        else:
+            count = unpack(args.archive, args.directory)
+            print(f"unpacked {count} saves into {args.directory}")
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
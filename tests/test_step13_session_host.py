@@ -0,0 +1,97 @@
+import asyncio
+import socket
+
+from orison.engine import Scene
+from orison.server import Session, SessionHost
+
+
+def test_session_feeds_lines_without_blocking():
+    session = Session("s1")
+    out = session.start()
+    assert "What is your name?" in out
+    assert session.prompt == "> "
+
+    out = session.feed("Tester")
+    assert "Hello, Tester." in out
+    assert "Welcome to Orison." not in out  # replay does not repeat lines
+    assert session.prompt == "Choose [1-6]: "
+
+    out = session.feed("1")
+    assert "Audit: Review Summary" in out
+    assert session.state.current_scene_id == "audit"
+
+    session.feed("2")  # conclude
+    assert session.closed
+
+
+def test_session_replays_blocking_scene():
+    class AskTwice(Scene):
+        def run(self, state, io_in, io_out):
+            io_out.write_line("first?")
+            state.flags["a"] = io_in.read_line("a: ")
+            io_out.write_line("second?")
+            state.flags["b"] = io_in.read_line("b: ")
+            state.stop()
+
+    session = Session("s1", scenes={"intro": AskTwice("intro")})
+    assert session.start() == ["first?"]
+    assert session.feed("x") == ["second?"]
+    # the partial frame is rolled back until the scene completes
+    assert "a" not in session.state.flags
+    session.feed("y")
+    assert session.state.flags == {"a": "x", "b": "y"}
+    assert session.closed
+
+
+def test_host_serves_concurrent_clients():
+    async def play(port: int, name: str) -> str:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"{name}\n3\n".encode())
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        return data.decode()
+
+    async def main() -> list[str]:
+        host = SessionHost()
+        await host.start()
+        try:
+            return await asyncio.gather(*(play(host.port, f"P{i}") for i in range(20)))
+        finally:
+            await host.close()
+
+    outputs = asyncio.run(main())
+    for i, out in enumerate(outputs):
+        assert f"Hello, P{i}." in out
+        assert "Goodbye" in out
+
+
+def test_host_stops_autosaving_detached_and_closed_sessions(tmp_path):
+    from orison.engine.autosave import AutosaveService
+
+    def watched(session):
+        handlers = session.state.events.handlers()
+        return [h for h in handlers if getattr(h, "service", None) is service]
+
+    async def main():
+        host = SessionHost(autosave=service)
+        ours, theirs = socket.socketpair()
+        session = host.attach(ours)
+        await asyncio.sleep(0.05)
+        assert watched(session)
+        session, sock, _ = await host.detach(session.session_id)
+        assert not watched(session)
+
+        session = host.attach(sock, session)
+        assert watched(session)
+        theirs.close()  # the client leaves
+        while host.clients:
+            await asyncio.sleep(0.01)
+        assert not watched(session)
+        await host.close()
+
+    service = AutosaveService(tmp_path)
+    try:
+        asyncio.run(asyncio.wait_for(main(), 5))
+    finally:
+        service.close()
@@ -0,0 +1,172 @@
+import asyncio
+
+from orison.server import HashRing, Session, Supervisor
+
+
+def test_ring_moves_only_removed_nodes_keys():
+    ring = HashRing(["w0", "w1", "w2"])
+    players = [f"player-{i}" for i in range(500)]
+    before = {p: ring.node_for(p) for p in players}
+    assert set(before.values()) == {"w0", "w1", "w2"}
+
+    ring.remove("w1")
+    after = {p: ring.node_for(p) for p in players}
+    moved = [p for p in players if before[p] != after[p]]
+    assert moved and all(before[p] == "w1" for p in moved)
+
+
+def test_session_roundtrips_mid_frame():
+    session = Session("alice")
+    session.start()
+    session.feed("Alice")  # intro frame still waiting on the menu choice
+
+    resumed = Session.from_dict(session.to_dict())
+    out = resumed.feed("1")
+    assert "Welcome to Orison." not in out
+    assert resumed.state.player_name == "Alice"
+    assert resumed.state.current_scene_id == "audit"
+
+
+async def _read_until(reader: asyncio.StreamReader, marker: bytes) -> str:
+    data = await asyncio.wait_for(reader.readuntil(marker), timeout=10)
+    return data.decode()
+
+
+def test_supervisor_hands_session_to_new_owner_on_drain():
+    async def main() -> tuple[str, str]:
+        supervisor = Supervisor(workers=2)
+        await supervisor.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", supervisor.port)
+            writer.write(b"alice\nAlice\n")
+            await _read_until(reader, b"Choose [1-6]: ")
+            owner = supervisor.placement["alice"]
+
+            await supervisor.drain(owner)
+            assert owner not in supervisor.workers
+
+            writer.write(b"1\n")
+            audit = await _read_until(reader, b"Choose [1-7]: ")
+            writer.write(b"2\n")
+            rest = (await asyncio.wait_for(reader.read(), timeout=10)).decode()
+            writer.close()
+            return audit, rest
+        finally:
+            await supervisor.close()
+
+    audit, rest = asyncio.run(main())
+    assert "Audit: Review Summary" in audit
+    assert "Welcome to Orison." not in audit
+    assert "Goodbye" in rest
+
+
+def test_add_worker_rebalances_live_sessions():
+    async def main() -> set[str]:
+        supervisor = Supervisor(workers=1)
+        await supervisor.start()
+        try:
+            conns = []
+            for i in range(12):
+                reader, writer = await asyncio.open_connection("127.0.0.1", supervisor.port)
+                writer.write(f"p{i}\nName{i}\n".encode())
+                conns.append((reader, writer))
+            for reader, _ in conns:
+                await _read_until(reader, b"Choose [1-6]: ")
+
+            await supervisor.add_worker()
+            for reader, writer in conns:
+                writer.write(b"1\n")
+                out = await _read_until(reader, b"Choose [1-7]: ")
+                assert "Welcome to Orison." not in out
+            # a prompt can come from the old owner before it processes the release
+            await asyncio.wait_for(supervisor.rebalanced(), 10)
+            placed = set(supervisor.placement.values())
+            for _, writer in conns:
+                writer.close()
+            return placed
+        finally:
+            await supervisor.close()
+
+    assert asyncio.run(main()) == {"w0", "w1"}
+
+
+def test_rebalance_settles_when_clients_leave_mid_move():
+    async def main() -> dict:
+        supervisor = Supervisor(workers=1)
+        await supervisor.start()
+        try:
+            conns = []
+            for i in range(12):
+                reader, writer = await asyncio.open_connection("127.0.0.1", supervisor.port)
+                writer.write(f"p{i}\nName{i}\n".encode())
+                conns.append((reader, writer))
+            for reader, _ in conns:
+                await _read_until(reader, b"Choose [1-6]: ")
+            await supervisor.add_worker()
+            for _, writer in conns:
+                writer.close()  # gone before (or while) their owner handles the release
+            await asyncio.wait_for(supervisor.rebalanced(), 10)
+            return dict(supervisor.placement)
+        finally:
+            await supervisor.close()
+
+    assert all(owner in ("w0", "w1") for owner in asyncio.run(main()).values())
+
+
+def test_max_sessions_applies_to_each_worker():
+    async def main() -> tuple[str, dict]:
+        supervisor = Supervisor(workers=1, max_sessions=1)
+        await supervisor.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", supervisor.port)
+            writer.write(b"p0\nName0\n")
+            await _read_until(reader, b"Choose [1-6]: ")
+            late_reader, late_writer = await asyncio.open_connection("127.0.0.1", supervisor.port)
+            late_writer.write(b"p1\n")
+            refused = (await asyncio.wait_for(late_reader.read(), timeout=10)).decode()
+            for _ in range(100):  # the worker reports the refusal asynchronously
+                if "p1" not in supervisor.placement:
+                    break
+                await asyncio.sleep(0.01)
+            writer.close()
+            late_writer.close()
+            return refused, dict(supervisor.placement)
+        finally:
+            await supervisor.close()
+
+    refused, placement = asyncio.run(main())
+    assert "Server full." in refused
+    assert placement == {"p0": "w0"}
+
+
+def test_handoff_to_a_dead_worker_drops_it_and_closes_the_client(monkeypatch):
+    from orison.server import supervisor as supervisor_module
+
+    ring = HashRing(["w0", "w1"])
+    mover = next(p for p in (f"p{i}" for i in range(1000)) if ring.node_for(p) == "w1")
+    send = supervisor_module._send
+
+    def failing_send(ctrl, message, fd=None):
+        if message["op"] == "attach" and message["session"] is not None:
+            raise BrokenPipeError("worker is gone")
+        send(ctrl, message, fd)
+
+    async def main() -> tuple[bytes, set, dict]:
+        supervisor = Supervisor(workers=1)
+        await supervisor.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", supervisor.port)
+            writer.write(f"{mover}\nMover\n".encode())
+            await _read_until(reader, b"Choose [1-6]: ")
+            monkeypatch.setattr(supervisor_module, "_send", failing_send)
+            await supervisor.add_worker()
+            await asyncio.wait_for(supervisor.rebalanced(), 10)
+            rest = await asyncio.wait_for(reader.read(), timeout=10)  # EOF, not a hang
+            writer.close()
+            return rest, set(supervisor.workers), dict(supervisor.placement)
+        finally:
+            monkeypatch.setattr(supervisor_module, "_send", send)
+            await supervisor.close()
+
+    rest, workers, placement = asyncio.run(main())
+    assert rest == b"" and workers == {"w0"} and placement == {}
@@ -0,0 +1,50 @@
+from orison.engine import GameState, SceneRunner
+from orison.io.terminal.app import SCENES
+
+
+class _Lines:
+    def __init__(self):
+        self.lines = []
+
+    def write_line(self, text: str) -> None:
+        self.lines.append(text)
+
+
+def test_audit_yields_menu_prompt_and_resumes():
+    state = GameState(player_name="P", current_scene_id="audit")
+    out = _Lines()
+    runner = SceneRunner(SCENES["audit"], state, out)
+
+    prompt = runner.start()
+    assert prompt.text == "Choose [1-7]: "
+    assert prompt.choices == frozenset("1234567") and prompt.default == "1"
+    assert "Audit: Review Summary" in out.lines
+
+    assert runner.resume("7") is None
+    assert runner.done
+    assert state.current_scene_id == "ritual"
+
+
+def test_ritual_steps_without_blocking():
+    state = GameState(player_name="P", current_scene_id="ritual")
+    out = _Lines()
+    runner = SceneRunner(SCENES["ritual"], state, out)
+
+    assert runner.start().text.startswith("Enter part A")
+    assert runner.resume("witness").text.startswith("Enter part B")
+    assert runner.resume("oath") is None
+    assert any(m.kind == "sigil" for m in state.inventory)
+    assert "Ritual succeeds. A Memory Sigil hums in your hands." in out.lines
+
+
+def test_many_paused_scenes_share_one_thread():
+    runners = []
+    for _ in range(200):
+        state = GameState(current_scene_id="intro")
+        runner = SceneRunner(SCENES["intro"], state, _Lines())
+        assert runner.start().text == "> "
+        runners.append((state, runner))
+    for i, (state, runner) in enumerate(runners):
+        assert runner.resume(f"P{i}").text == "Choose [1-6]: "
+        assert runner.resume("3") is None
+        assert state.player_name == f"P{i}" and state.current_scene_id == "end"
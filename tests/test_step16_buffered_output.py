@@ -0,0 +1,45 @@
+import io
+
+from orison.engine import GameState
+from orison.engine.output import BufferedOutput
+from orison.io.terminal.app import SCENES, BufferedConsoleIO
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def test_frame_and_prompt_go_out_in_one_write(monkeypatch):
+    answers = iter(["Tester", "1", "1"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    stream = _CountingStream()
+    console = BufferedConsoleIO(stream)
+    state = GameState()
+
+    SCENES["intro"].run(state, console, console)
+    console.flush()
+    # welcome + name prompt, then greeting + menu + choice prompt
+    assert stream.writes == 2
+    text = stream.getvalue()
+    assert "Main Menu\n" in text and text.index("Hello, Tester.") < text.index("Choose [1-6]: ")
+    assert state.current_scene_id == "audit"
+
+    SCENES["audit"].run(state, console, console)
+    assert stream.writes == 3  # a 15-line audit frame costs one write
+
+
+def test_high_water_mark_forces_flush():
+    chunks = []
+    out = BufferedOutput(chunks.append, high_water=10)
+    out.write_line("1234")
+    assert chunks == [] and out.pending == 5
+    out.write_line("56789")
+    assert chunks == ["1234\n56789\n"] and out.pending == 0
+    out.flush()
+    assert out.flushes == 1
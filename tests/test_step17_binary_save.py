@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from orison.engine import GameState, codec
+from orison.io.terminal.app import SCENES, ConsoleIO
+from orison.models import Mark
+
+
+def _sample_state() -> GameState:
+    state = GameState(player_name="Tester", current_scene_id="audit")
+    state.inventory = [
+        Mark(id=f"M-{i}", kind="witness" if i % 2 else "seal", is_witness=bool(i % 2))
+        for i in range(50)
+    ]
+    state.flags = {
+        "has_witness_mark": True,
+        "canals_black": False,
+        "policy": "secret",
+        "visits": 3,
+        "ratio": 0.5,
+        "nothing": None,
+        "notes": ["ledger", 2],
+    }
+    state.reputation = {"scribes": -1, "mariners": 2}
+    return state
+
+
+def test_binary_roundtrip_matches_json(tmp_path):
+    state = _sample_state()
+    state.save(tmp_path / "s.orsb")
+    state.save(tmp_path / "s.json")
+
+    data = (tmp_path / "s.orsb").read_bytes()
+    assert codec.is_binary(data)
+    assert len(data) < (tmp_path / "s.json").stat().st_size / 2
+
+    loaded = GameState()
+    loaded.load(tmp_path / "s.orsb")
+    assert loaded.to_dict() == state.to_dict()
+    # bools stay bools (True == 1 would hide it from ==)
+    assert {k: type(v) for k, v in loaded.flags.items()} == {
+        k: type(v) for k, v in state.flags.items()
+    }
+
+
+def test_format_parameter_overrides_extension(tmp_path):
+    state = _sample_state()
+    path = tmp_path / "slot.sav"
+    state.save(path, fmt="binary")
+    assert codec.is_binary(path.read_bytes())
+
+    loaded = GameState()
+    loaded.load(path, fmt="binary")
+    assert loaded.to_dict() == state.to_dict()
+    with pytest.raises(ValueError):
+        state.save(path, fmt="xml")
+
+
+def test_decode_interns_repeated_strings():
+    a, b = GameState(), GameState()
+    codec.decode_into(a, codec.encode_state(_sample_state()))
+    codec.decode_into(b, codec.encode_state(_sample_state()))
+    assert a.inventory[0].kind is b.inventory[0].kind
+    key_a = next(k for k in a.flags if k == "policy")
+    key_b = next(k for k in b.flags if k == "policy")
+    assert key_a is key_b
+
+
+def test_truncated_binary_save_raises_value_error(tmp_path):
+    path = tmp_path / "s.orsb"
+    _sample_state().save(path)
+    path.write_bytes(path.read_bytes()[:-7])
+    with pytest.raises(ValueError):
+        GameState().load(path)
+
+
+@pytest.mark.parametrize("value", [1 << 63, True])
+def test_unencodable_reputation_raises_value_error(tmp_path, value):
+    state = _sample_state()
+    state.reputation["scribes"] = value  # a bool would come back as 1
+    with pytest.raises(ValueError, match="scribes"):
+        state.save(tmp_path / "s.orsb")
+
+
+def test_save_menu_reports_a_refused_binary_save(tmp_path, monkeypatch):
+    state = _sample_state()
+    state.reputation["scribes"] = 1 << 63
+    answers = iter(["4", str(tmp_path / "s.orsb")])
+    lines = []
+    io = ConsoleIO()
+    io.read_line = lambda prompt="": next(answers)  # type: ignore[assignment]
+    io.write_line = lines.append  # type: ignore[assignment]
+    SCENES["intro"].run(state, io, io)
+    assert any(line.startswith("Could not save:") for line in lines)
+    assert state.current_scene_id == "intro" and not (tmp_path / "s.orsb").exists()
+
+
+def test_bad_document_leaves_state_untouched(tmp_path):
+    state = _sample_state()
+    before = state.to_dict()
+    bad = dict(before, player_name="Other", inventory=[{"id": "M-1"}, "not a mark"])
+    (tmp_path / "bad.json").write_text(json.dumps(bad), encoding="utf-8")
+    with pytest.raises(ValueError, match="malformed save"):
+        state.load_json_into_self(tmp_path / "bad.json")
+    assert state.to_dict() == before
@@ -0,0 +1,112 @@
+from orison.engine import GameState
+from orison.engine.journal import JournalStore
+from orison.models import Mark
+
+
+def _journaled(tmp_path, **kw):
+    state = GameState(player_name="Tester")
+    store = JournalStore(tmp_path / "slot", **kw)
+    store.attach(state)
+    store.save(state)  # first save writes the checkpoint
+    return state, store
+
+
+def test_save_appends_only_changes_and_replays(tmp_path):
+    state, store = _journaled(tmp_path)
+    ckpt_size = store.checkpoint_path.stat().st_size
+
+    state.goto("audit")
+    state.set_flag("secret_clause_active", True)
+    state.adjust_rep("scribes", 2)
+    state.add_mark(Mark(id="M-1", kind="witness", is_witness=True))
+    state.add_mark(Mark(id="M-2", kind="seal"))
+    state.remove_mark("M-2")
+    state.clear_flag("secret_clause_active")
+    written = store.save(state)
+
+    assert 0 < written < 300
+    assert store.checkpoint_path.stat().st_size == ckpt_size  # untouched
+    assert store.save(state) == 0  # nothing changed
+
+    loaded = GameState()
+    # set + clear of the same flag (or add + remove of M-2) coalesce into one
+    # record via the dirty sets
+    assert JournalStore(tmp_path / "slot").load_into(loaded) == 5
+    assert loaded.to_dict() == state.to_dict()
+
+
+def test_torn_final_record_is_dropped(tmp_path):
+    state, store = _journaled(tmp_path)
+    state.adjust_rep("scribes", 1)
+    store.save(state)
+    state.adjust_rep("mariners", 1)
+    store.save(state)
+
+    data = store.journal_path.read_bytes()
+    store.journal_path.write_bytes(data[:-3])  # crash mid-append
+
+    loaded = GameState()
+    assert JournalStore(tmp_path / "slot").load_into(loaded) == 1
+    assert loaded.reputation == {"scribes": 1}
+    assert store.journal_path.stat().st_size < len(data) - 3  # tail truncated
+
+
+def test_compaction_folds_journal_into_new_checkpoint(tmp_path):
+    state, store = _journaled(tmp_path, compact_bytes=512)
+    for _ in range(40):
+        state.adjust_rep("scribes", 1)
+        store.save(state)
+    assert store.generation > 1
+    assert store.journal_size <= 512
+
+    loaded = GameState()
+    JournalStore(tmp_path / "slot").load_into(loaded)
+    assert loaded.get_rep("scribes") == 40
+
+
+def test_stale_journal_after_crash_mid_compaction_is_ignored(tmp_path):
+    state, store = _journaled(tmp_path)
+    state.adjust_rep("scribes", 5)
+    store.save(state)
+    stale = store.journal_path.read_bytes()
+    store.checkpoint(state)
+    store.journal_path.write_bytes(stale)  # journal rename never happened
+
+    loaded = GameState()
+    JournalStore(tmp_path / "slot").load_into(loaded)
+    assert loaded.get_rep("scribes") == 5  # not 10
+
+
+def test_direct_reputation_writes_are_journaled(tmp_path):
+    state, store = _journaled(tmp_path)
+    state.adjust_rep("scribes", 2)
+    state.reputation["mariners"] = 4
+    state.reputation["scribes"] += 1
+    assert store.save(state) > 0
+    del state.reputation["mariners"]
+    assert store.save(state) > 0
+
+    loaded = GameState()
+    JournalStore(tmp_path / "slot").load_into(loaded)
+    assert loaded.reputation == {"scribes": 3}
+
+
+def test_direct_inventory_writes_are_journaled_in_order(tmp_path):
+    state, store = _journaled(tmp_path)
+    state.inventory.append(Mark.of("M-1", "seal"))
+    state.inventory.append(Mark.of("M-2", "witness", True))
+    store.save(state)
+    state.inventory.discard("M-1")
+    state.inventory.append(Mark.of("M-1", "sigil"))  # same id, new mark, now last
+    assert store.save(state) > 0
+
+    loaded = GameState()
+    JournalStore(tmp_path / "slot").load_into(loaded)
+    assert loaded.inventory == state.inventory
+    assert [m.kind for m in loaded.inventory] == ["witness", "sigil"]
+
+    state.inventory = [Mark.of("M-3", "seal")]  # a new container: checkpoint it
+    store.save(state)
+    reloaded = GameState()
+    assert JournalStore(tmp_path / "slot").load_into(reloaded) == 0
+    assert reloaded.inventory == state.inventory
@@ -0,0 +1,92 @@
+import json
+import threading
+
+from orison.engine import GameState
+from orison.engine.autosave import AutosaveService
+from orison.engine.manifest import SaveManifest
+from orison.io.terminal.app import run_terminal_app
+
+
+def test_goto_autosaves_in_background(tmp_path):
+    service = AutosaveService(tmp_path)
+    state = GameState(player_name="Tester")
+    service.watch(state, "p1")
+
+    state.set_flag("checked_ledger", True)
+    state.goto("audit")
+    assert service.flush(timeout=5)
+
+    saved = json.loads((tmp_path / "p1.json").read_text(encoding="utf-8"))
+    assert saved["current_scene_id"] == "audit"
+    assert saved["flags"] == {"checked_ledger": True}
+    assert not list(tmp_path.glob("*.tmp"))
+    stats = service.stats()
+    assert stats.written == 1 and stats.errors == 0 and stats.pending == 0
+    service.close()
+
+
+def test_bursts_coalesce_to_newest_snapshot(tmp_path, monkeypatch):
+    service = AutosaveService(tmp_path, fmt="binary")
+    gate = threading.Event()
+    real_write = service._write
+
+    def slow_write(target, snapshot):
+        gate.wait(5)
+        real_write(target, snapshot)
+
+    monkeypatch.setattr(service, "_write", slow_write)
+    state = GameState(player_name="Tester")
+    service.watch(state, "p1")
+
+    state.goto("audit")  # picked up by the writer, which now blocks
+    for scene in ("arbiter", "intro", "audit", "decision"):
+        state.goto(scene)  # these pile up behind it and coalesce
+    gate.set()
+    assert service.flush(timeout=5)
+
+    stats = service.stats()
+    assert stats.submitted == 5
+    assert stats.written + stats.coalesced == 5
+    assert stats.written <= 2
+    loaded = GameState()
+    loaded.load(tmp_path / "p1.orsb")
+    assert loaded.current_scene_id == "decision"
+    service.close()
+
+
+def test_autosaves_are_listed_in_the_manifest(tmp_path):
+    service = AutosaveService(tmp_path)
+    state = GameState(player_name="Tester")
+    state.save(tmp_path / "manual.json")
+    service.watch(state, "p1")
+    state.goto("audit")
+    assert service.flush(timeout=5)
+    service.close()
+
+    latest = SaveManifest(tmp_path).latest()
+    assert latest.slot == "p1.json" and latest.scene == "audit"
+    loaded = GameState()
+    loaded.load(SaveManifest(tmp_path).path_of(latest))
+    assert loaded.current_scene_id == "audit"
+
+
+def _play(monkeypatch, answers):
+    feed = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(feed))
+    run_terminal_app()
+    assert next(feed, None) is None  # every answer was asked for
+
+
+def test_quitting_is_not_autosaved_and_continue_resumes(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    _play(monkeypatch, ["Alice", "2", "3"])  # take a mark, then quit
+    assert SaveManifest(tmp_path / "save_game").latest().scene == "intro"
+    capsys.readouterr()
+
+    # an old save taken on the way out is skipped as well
+    GameState(player_name="Gone", current_scene_id="end").save(tmp_path / "save_game/old.json")
+    _play(monkeypatch, ["Bob", "6", "3"])  # continue, then quit from the menu again
+    out = capsys.readouterr().out
+    assert "Continuing from last save..." in out
+    assert out.count("Main Menu") == 2
+    assert "Reputation" in out.split("Continuing from last save...")[1]
@@ -0,0 +1,119 @@
+import threading
+from pathlib import Path
+
+from orison.engine import GameState
+from orison.engine.manifest import _TAIL_CHUNK, SaveManifest
+from orison.io.terminal.app import SCENES, ConsoleIO
+
+
+def _mk_io(inputs):
+    it = iter(inputs)
+    io = ConsoleIO()
+    io.read_line = lambda prompt="": next(it)  # type: ignore[assignment]
+    return io
+
+
+def test_save_records_manifest_entry(tmp_path):
+    state = GameState(player_name="Tester", current_scene_id="audit")
+    state.save_json(tmp_path / "a.json")
+    state.player_name = "Other"
+    state.save(tmp_path / "b.orsb")
+    state.save_json(tmp_path / "a.json")  # newest line for slot a wins
+
+    entries = SaveManifest(tmp_path).entries()
+    assert set(entries) == {"a.json", "b.orsb"}
+    assert [e.slot for e in SaveManifest(tmp_path).recent()] == ["a.json", "b.orsb"]
+    a = entries["a.json"]
+    assert a.player_name == "Other" and a.scene == "audit"
+    assert a.size == (tmp_path / "a.json").stat().st_size
+    assert SaveManifest(tmp_path).latest().slot == "a.json"
+
+
+def test_torn_manifest_line_is_skipped_and_compaction_keeps_latest(tmp_path):
+    state = GameState(player_name="Tester")
+    for _ in range(100):
+        state.save_json(tmp_path / "slot.json")
+    manifest = SaveManifest(tmp_path)
+    with manifest.path.open("a", encoding="utf-8") as f:
+        f.write('["half-written"')
+
+    assert list(manifest.entries()) == ["slot.json"]
+    assert len(manifest.path.read_text(encoding="utf-8").splitlines()) == 101  # reads never write
+    assert manifest.compact_if_stale() and not manifest.compact_if_stale()
+    assert len(manifest.path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_compaction_never_drops_concurrent_records(tmp_path):
+    state = GameState(player_name="Tester")
+    manifest = SaveManifest(tmp_path)
+    data = b"{}"
+
+    def record(n):
+        for i in range(200):
+            manifest.record(tmp_path / f"t{n}-{i}.json", state, data)
+
+    threads = [threading.Thread(target=record, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    while any(t.is_alive() for t in threads):
+        manifest.compact()
+    for t in threads:
+        t.join()
+    assert len(manifest.entries()) == 800
+
+
+class _CountingFile:
+    """Wraps an open file and counts the bytes read through it."""
+
+    def __init__(self, f):
+        self._f = f
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def seek(self, *args):
+        return self._f.seek(*args)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._f.close()
+
+
+def test_large_manifest_lists_recent_slots_from_the_tail(tmp_path, monkeypatch):
+    manifest = SaveManifest(tmp_path)
+    rows = "".join(f'["p{i}.json","P{i}","intro",{i}.0,100,"00000000"]\n' for i in range(100_000))
+    manifest.path.write_text(rows, encoding="utf-8")
+    opened = []
+    real_open = Path.open
+
+    def counting_open(self, *args, **kwargs):
+        opened.append(_CountingFile(real_open(self, *args, **kwargs)))
+        return opened[-1]
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Path, "open", counting_open)
+        recent = manifest.recent(9)
+    assert [e.slot for e in recent][:2] == ["p99999.json", "p99998.json"]
+    # one chunk from the end covers nine rows; the other ~5 MB are never read
+    assert len(opened) == 1 and opened[0].bytes_read <= _TAIL_CHUNK
+    assert len(manifest.entries()) == 100_000
+
+
+def test_continue_and_load_use_manifest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    state = GameState(player_name="Saver", current_scene_id="audit")
+    state.save_json(tmp_path / "save_game" / "slot1.json")
+
+    fresh = GameState()
+    SCENES["intro"].run(fresh, _mk_io(["P", "6"]), ConsoleIO())
+    assert fresh.player_name == "Saver"
+    assert fresh.current_scene_id == "audit"
+
+    other = GameState()
+    SCENES["intro"].run(other, _mk_io(["P", "5", "1"]), ConsoleIO())
+    assert other.player_name == "Saver"
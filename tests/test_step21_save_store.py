@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+
+from orison.engine import GameState
+from orison.engine.store import FileSaveStore, SQLiteSaveStore
+from orison.models import Mark
+
+
+def _state(name="Tester"):
+    state = GameState(player_name=name, current_scene_id="audit")
+    state.add_mark(Mark(id="m1", kind="ink", is_witness=True))
+    state.set_flag("canals_black")
+    state.adjust_rep("scribes", 2)
+    return state
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        s = FileSaveStore(tmp_path / "saves")
+    else:
+        s = SQLiteSaveStore(tmp_path / "saves.db")
+    yield s
+    s.close()
+
+
+def test_store_roundtrip_through_game_state(store):
+    _state().save_json("slot1", store=store)
+    loaded = GameState()
+    loaded.load_json_into_self("slot1", store=store)
+    assert loaded.to_dict() == _state().to_dict()
+    assert store.slots() == ["slot1"]
+
+    store.delete("slot1")
+    with pytest.raises(FileNotFoundError):
+        GameState().load_json_into_self("slot1", store=store)
+
+
+def test_sqlite_batches_writes_and_reads_pending(tmp_path):
+    store = SQLiteSaveStore(tmp_path / "saves.db", batch_size=3, max_delay=60)
+    _state("a").save_json("a", store=store)
+    _state("b").save_json("b", store=store)
+    assert store.pending == 2
+    assert store.get("a")["player_name"] == "a"  # visible before the commit
+
+    other = SQLiteSaveStore(tmp_path / "saves.db")
+    assert other.slots() == []
+    _state("c").save_json("c", store=store)  # third write fills the batch
+    assert store.pending == 0
+    assert other.slots() == ["a", "b", "c"]
+    other.close()
+    store.close()
+
+
+def test_sqlite_concurrent_sessions(tmp_path):
+    store = SQLiteSaveStore(tmp_path / "saves.db", pool_size=2, batch_size=16)
+
+    def session(i):
+        state = _state(f"p{i}")
+        for _ in range(20):
+            state.adjust_rep("scribes", 1)
+            state.save_json(f"p{i}", store=store)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.close()
+
+    reopened = SQLiteSaveStore(tmp_path / "saves.db")
+    assert reopened.slots() == [f"p{i}" for i in range(8)]
+    assert all(reopened.get(f"p{i}")["reputation"]["scribes"] == 22 for i in range(8))
+    reopened.close()
+
+
+def test_sqlite_in_memory_store_uses_one_database():
+    store = SQLiteSaveStore(":memory:", pool_size=4, batch_size=1)
+    _state("m").save_json("m", store=store)
+    assert store.get("m")["player_name"] == "m" and store.slots() == ["m"]
+    store.close()
+
+
+def test_sqlite_flushes_after_max_delay_without_another_put(tmp_path):
+    store = SQLiteSaveStore(tmp_path / "saves.db", batch_size=100, max_delay=0.05)
+    _state("lone").save_json("lone", store=store)
+    other = SQLiteSaveStore(tmp_path / "saves.db")
+    deadline = time.monotonic() + 5
+    while other.slots() != ["lone"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert other.slots() == ["lone"] and store.pending == 0
+    other.close()
+    store.close()
+
+
+def test_sqlite_batch_stays_readable_while_committing(tmp_path):
+    store = SQLiteSaveStore(tmp_path / "saves.db", batch_size=100, max_delay=60)
+    _state("old").save_json("s", store=store)
+    store.flush()
+    _state("new").save_json("s", store=store)
+    seen = []
+    with store._connection() as conn:  # hold a pooled connection; flush still gets one
+        conn.execute("BEGIN IMMEDIATE")  # block the commit so the batch is in flight
+        flusher = threading.Thread(target=store.flush)
+        flusher.start()
+        while not store._inflight:
+            time.sleep(0.001)
+        seen.append(store.get("s")["player_name"])
+        deleter = threading.Thread(target=store.delete, args=("s",))
+        deleter.start()
+        conn.execute("COMMIT")
+    flusher.join()
+    deleter.join()
+    assert seen == ["new"]
+    reopened = SQLiteSaveStore(tmp_path / "saves.db")
+    assert store.slots() == [] and reopened.slots() == []
+    with pytest.raises(FileNotFoundError):
+        store.get("s")
+    reopened.close()
+    store.close()
@@ -0,0 +1,53 @@
+import pytest
+
+from orison.engine import GameState
+from orison.engine.archive import SaveArchive, write_archive
+from orison.models import Mark
+from orison.tools import pack
+
+
+def _state(i):
+    state = GameState(player_name=f"p{i}", current_scene_id="audit" if i % 2 else "intro")
+    state.inventory = [Mark(id=f"M-{n}", kind="seal", is_witness=n == 0) for n in range(i % 5)]
+    state.flags = {"visits": i, "canals_black": bool(i % 3)}
+    state.reputation = {"scribes": i - 5}
+    return state
+
+
+def test_archive_roundtrip_and_lazy_lookup(tmp_path):
+    states = {f"player-{i}": _state(i) for i in range(200)}
+    assert write_archive(tmp_path / "s.orpk", states.items()) == 200
+
+    with SaveArchive(tmp_path / "s.orpk") as archive:
+        assert len(archive) == 200 and "player-7" in archive
+        assert archive.get("player-7").to_dict() == states["player-7"].to_dict()
+        assert archive.get("nobody") is None
+        into = GameState()
+        archive.load_into("player-199", into)
+        assert into.to_dict() == states["player-199"].to_dict()
+        expected = {k: s.to_dict() for k, s in states.items()}
+        assert {k: s.to_dict() for k, s in archive.items()} == expected
+
+
+def test_archive_rejects_foreign_files(tmp_path):
+    (tmp_path / "junk.orpk").write_bytes(b"not an archive at all, sorry")
+    with pytest.raises(ValueError):
+        SaveArchive(tmp_path / "junk.orpk")
+
+
+def test_pack_tool_roundtrip(tmp_path, capsys):
+    src = tmp_path / "save_game"
+    for i in range(5):
+        _state(i).save_json(src / f"slot{i}.json")
+    (src / "broken.json").write_text("{", encoding="utf-8")
+    (src / "listed.json").write_text("[1, 2]", encoding="utf-8")
+
+    assert pack.main(["pack", str(src), str(tmp_path / "all.orpk")]) == 0
+    err = capsys.readouterr().err
+    assert "skipped broken.json" in err and "skipped listed.json: save is not a JSON object" in err
+    assert pack.main(["unpack", str(tmp_path / "all.orpk"), str(tmp_path / "out")]) == 0
+
+    for i in range(5):
+        restored = GameState()
+        restored.load_json_into_self(tmp_path / "out" / f"slot{i}.json")
+        assert restored.to_dict() == _state(i).to_dict()
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from orison.engine import GameState
+from orison.engine.archive import SaveArchive, write_archive
+from orison.engine.lazy import SaveView
+from orison.engine.manifest import SaveManifest
+from orison.models import Mark
+
+
+def _state():
+    state = GameState(player_name="Tester", current_scene_id="audit")
+    state.inventory = [Mark(id=f"M-{i}", kind="seal", is_witness=i == 3) for i in range(100)]
+    state.flags = {"canals_black": True, "visits": 2}
+    state.reputation = {"scribes": -1}
+    return state
+
+
+@pytest.mark.parametrize("name", ["s.json", "s.orsb"])
+def test_view_reads_header_and_defers_body(tmp_path, name):
+    _state().save(tmp_path / name)
+    view = SaveView.open(tmp_path / name)
+    assert (view.player_name, view.current_scene_id, view.running) == ("Tester", "audit", True)
+    assert view._inventory is None and view._flags is None
+    if name.endswith(".json"):
+        assert view._doc is None  # only the first few KB were scanned
+
+    assert view.flags == {"canals_black": True, "visits": 2}
+    assert view._inventory is None  # flags alone do not build Marks
+    assert view.to_state().to_dict() == _state().to_dict()
+
+
+def test_view_falls_back_for_unusual_json():
+    doc = {"inventory": [], "player_name": "Late", "running": False}
+    view = SaveView(json.dumps(doc).encode())
+    assert (view.player_name, view.current_scene_id, view.running) == ("Late", "intro", False)
+    with pytest.raises(ValueError):
+        SaveView(b"[1, 2]")
+
+
+def test_view_apply_to_emits_reset_and_archive_peek(tmp_path):
+    write_archive(tmp_path / "a.orpk", [("p1", _state())])
+    with SaveArchive(tmp_path / "a.orpk") as archive:
+        view = archive.peek("p1")
+        assert view.current_scene_id == "audit"
+        seen = []
+        target = GameState()
+        target.events.subscribe(lambda e: seen.append(type(e).__name__))
+        view.apply_to(target)
+    assert seen == ["StateReset"] and target.to_dict() == _state().to_dict()
+
+
+def test_manifest_rebuild_from_save_files(tmp_path):
+    _state().save(tmp_path / "a.json", manifest=False)
+    other = _state()
+    other.player_name = "Other"
+    other.save(tmp_path / "b.orsb", manifest=False)
+    (tmp_path / "junk.json").write_text("nope", encoding="utf-8")
+
+    entries = SaveManifest(tmp_path).rebuild()
+    names = {e.slot: e.player_name for e in entries.values()}
+    assert names == {"a.json": "Tester", "b.orsb": "Other"}
+    assert set(SaveManifest(tmp_path).entries()) == {"a.json", "b.orsb"}
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+
+from orison.engine import GameState, codec, migrations
+from orison.engine.archive import SaveArchive, write_archive
+from orison.engine.lazy import SaveView
+from orison.engine.store import SQLiteSaveStore
+from orison.tools import migrate as migrate_tool
+from orison.tools import pack as pack_tool
+
+LEGACY = {
+    "player_name": "Old",
+    "inventory": [{"id": "M-1", "kind": "seal"}],
+    "flags": {"canals_black": True},
+}
+
+
+def test_saves_are_stamped_and_legacy_saves_migrate_on_load(tmp_path):
+    assert GameState().to_dict()["version"] == migrations.SCHEMA_VERSION
+
+    (tmp_path / "old.json").write_text(json.dumps(LEGACY), encoding="utf-8")
+    state = GameState()
+    state.load_json_into_self(tmp_path / "old.json")
+    assert state.player_name == "Old" and state.current_scene_id == "intro"
+    assert state.inventory[0].is_witness is False
+    assert SaveView.open(tmp_path / "old.json").reputation == {}
+
+    upgraded = migrations.migrate(dict(LEGACY))
+    assert upgraded["version"] == migrations.SCHEMA_VERSION and upgraded["running"] is True
+
+
+def test_newer_or_unknown_versions_are_rejected():
+    with pytest.raises(ValueError, match="newer"):
+        GameState.from_dict({"version": migrations.SCHEMA_VERSION + 1})
+    with pytest.raises(ValueError, match="no migration"):
+        migrations.migrate({"version": -1})
+
+
+MALFORMED = [{"inventory": [1]}, {"flags": [1, 2]}, {"version": None}, {"version": "1"}]
+
+
+@pytest.mark.parametrize("doc", MALFORMED)
+def test_malformed_legacy_saves_raise_value_error(doc, tmp_path):
+    with pytest.raises(ValueError, match="malformed save"):
+        migrations.migrate(doc)
+    state = GameState(player_name="kept")
+    with pytest.raises(ValueError, match="malformed save"):
+        state._load_dict(doc)
+    assert state.player_name == "kept"
+
+    (tmp_path / "bad.json").write_text(json.dumps(doc), encoding="utf-8")
+    GameState(player_name="good").save_json(tmp_path / "good.json")
+    assert pack_tool.pack(tmp_path, tmp_path / "all.orpk")[0] == 1
+    report = migrate_tool.migrate_directory(tmp_path, workers=1)
+    assert report.failed and report.failed[0].startswith("bad.json: malformed save")
+
+
+def test_bulk_migrate_directory(tmp_path, capsys):
+    for i in range(6):
+        doc = dict(LEGACY, player_name=f"p{i}")
+        (tmp_path / f"old{i}.json").write_text(json.dumps(doc), encoding="utf-8")
+    GameState(player_name="new").save_json(tmp_path / "new.json")
+    (tmp_path / "bad.json").write_text("{", encoding="utf-8")
+
+    ticks = []
+    report = migrate_tool.migrate_directory(
+        tmp_path, workers=2, progress=lambda d, t: ticks.append((d, t))
+    )
+    assert (report.migrated, report.current, len(report.failed)) == (6, 1, 1)
+    assert ticks[-1] == (8, 8)
+    doc = json.loads((tmp_path / "old3.json").read_text(encoding="utf-8"))
+    assert doc["version"] == migrations.SCHEMA_VERSION and doc["player_name"] == "p3"
+
+    # bad.json still fails
+    assert migrate_tool.main([str(tmp_path), "--workers", "1", "--quiet"]) == 1
+    assert "0 migrated, 7 already current, 1 failed" in capsys.readouterr().out
+
+
+def test_bulk_migrate_store(tmp_path):
+    store = SQLiteSaveStore(tmp_path / "saves.db")
+    for i in range(10):
+        store.put(f"p{i}", dict(LEGACY, player_name=f"p{i}"))
+    store.put("fresh", GameState().to_dict())
+    report = migrate_tool.migrate_store(store, workers=2, chunk=4)
+    assert (report.migrated, report.current) == (10, 1)
+    assert store.get("p7")["version"] == migrations.SCHEMA_VERSION
+
+    for i, doc in enumerate(MALFORMED):
+        store.put(f"bad{i}", doc)
+    store.put("late", dict(LEGACY, player_name="late"))
+    report = migrate_tool.migrate_store(store, workers=2, chunk=4)
+    assert (report.migrated, report.current, len(report.failed)) == (1, 11, len(MALFORMED))
+    assert store.get("late")["version"] == migrations.SCHEMA_VERSION
+    assert store.get("bad0") == MALFORMED[0]
+    store.close()
+
+
+def _stamped(data: bytes, version: int) -> bytes:
+    return data[:5] + version.to_bytes(2, "little") + data[7:]
+
+
+def test_binary_saves_carry_their_schema_and_migrate(tmp_path, monkeypatch):
+    state = GameState(player_name="Old", current_scene_id="audit")
+    state.adjust_rep("scribes", 2)
+    data = codec.encode_state(state)
+    assert codec.schema_version(data) == migrations.SCHEMA_VERSION
+
+    upgraded = []
+    step = migrations._STEPS[0]
+    monkeypatch.setitem(migrations._STEPS, 0, lambda doc: upgraded.append(doc) or step(doc))
+    old = _stamped(data, 0)
+    loaded = GameState()
+    codec.decode_into(loaded, old)
+    assert len(upgraded) == 1 and loaded.to_dict() == state.to_dict()
+    assert SaveView(old).reputation == {"scribes": 2} and len(upgraded) == 2
+    assert codec.schema_version(data[:4] + b"\x01" + data[7:]) == 1  # format 1: no schema field
+    with pytest.raises(ValueError, match="newer"):
+        codec.decode_into(GameState(), _stamped(data, migrations.SCHEMA_VERSION + 1))
+
+    (tmp_path / "old.orsb").write_bytes(old)
+    (tmp_path / "new.orsb").write_bytes(data)
+    write_archive(tmp_path / "all.orpk", [("a", state), ("b", state)])
+    packed = bytearray((tmp_path / "all.orpk").read_bytes())
+    # the first payload starts after the 20-byte header
+    packed[20:] = _stamped(bytes(packed[20:]), 0)
+    (tmp_path / "all.orpk").write_bytes(bytes(packed))
+
+    report = migrate_tool.migrate_directory(tmp_path, workers=1)
+    assert (report.migrated, report.current, report.failed) == (2, 1, [])
+    assert codec.schema_version((tmp_path / "old.orsb").read_bytes()) == migrations.SCHEMA_VERSION
+    with SaveArchive(tmp_path / "all.orpk") as archive:
+        versions = {codec.schema_version(archive.payload(k)) for k in archive}
+        assert versions == {migrations.SCHEMA_VERSION}
+        assert archive.get("a").to_dict() == state.to_dict()
@@ -0,0 +1,55 @@
+from orison.engine import GameState
+from orison.io.terminal.app import SCENES, ConsoleIO
+from orison.models import Inventory, Mark
+
+
+def test_inventory_indexes_and_dedups():
+    inv = Inventory([Mark("a", "seal"), Mark("w", "witness", True), Mark("a", "sigil")])
+    assert len(inv) == 2 and inv.get("a").kind == "seal"  # first mark per id wins
+    assert inv.count_kind("seal") == 1 and not inv.has_kind("sigil")
+    assert inv.witness_count == 1 and inv.has_witness
+    assert "w" in inv and Mark("w", "witness", True) in inv and Mark("w", "seal") not in inv
+
+    assert inv.add_many([Mark("s", "sigil"), Mark("t", "sigil")]) == 2
+    assert [m.id for m in inv.discard_many(["w", "t", "nope"])] == ["w", "t"]
+    assert not inv.has_witness and inv.kinds() == {"seal": 1, "sigil": 1}
+    assert inv == [Mark("a", "seal"), Mark("s", "sigil")] and inv[-1].id == "s"
+
+
+def test_game_state_keeps_inventory_indexed():
+    state = GameState()
+    assert state.add_mark(Mark("w", "witness", True)) is True
+    assert state.add_mark(Mark("w", "witness", True)) is False
+    state.inventory = [Mark("x", "sigil"), Mark("x", "sigil")]  # plain list assignment
+    assert isinstance(state.inventory, Inventory) and len(state.inventory) == 1
+    assert state.remove_mark("x").kind == "sigil" and state.remove_mark("x") is None
+
+    loaded = GameState.from_dict(
+        {
+            "inventory": [
+                {"id": "d", "kind": "seal"},
+                {"id": "d", "kind": "seal"},
+                {"id": "s", "kind": "sigil"},
+            ]
+        }
+    )
+    assert loaded.inventory.has_kind("sigil") and len(loaded.to_dict()["inventory"]) == 2
+
+
+def test_scene_checks_never_walk_the_inventory(monkeypatch):
+    state = GameState(current_scene_id="ritual")
+    state.inventory = [Mark(f"M-{i}", "seal") for i in range(20_000)]
+    state.add_mark(Mark("SIGIL-MEM-1", "sigil"))
+    io = ConsoleIO()
+    lines = []
+    io.write_line = lines.append  # type: ignore[assignment]
+
+    def walked(*args):
+        raise AssertionError("a scene check walked every mark")
+
+    # timing lives in benchmarks/bench_inventory.py
+    monkeypatch.setattr(Inventory, "__iter__", walked)
+    monkeypatch.setattr(Inventory, "__getitem__", walked)
+    for _ in range(10):
+        SCENES["ritual"].run(state, io, io)
+    assert "You already forged a Memory Sigil." in lines
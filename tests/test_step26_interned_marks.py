@@ -0,0 +1,29 @@
+import dataclasses
+
+import pytest
+
+from orison.engine import GameState
+from orison.models import Mark
+
+
+def test_marks_are_immutable_and_interned():
+    a = Mark.of("M-WIT-DEMO", "witness", True)
+    assert Mark.of("M-WIT-DEMO", "witness", 1) is a
+    assert Mark("M-WIT-DEMO", "witness", True) == a and a != Mark.of("M-WIT-DEMO", "witness")
+    assert hash(Mark("M-WIT-DEMO", "witness", True)) == hash(a)
+    assert not hasattr(a, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.kind = "seal"  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("name", ["s.json", "s.orsb"])
+def test_loading_shares_mark_instances_across_sessions(tmp_path, name):
+    state = GameState(player_name="Tester")
+    state.inventory = [Mark(f"M-{i}", "seal", i == 0) for i in range(10)]
+    state.save(tmp_path / name)
+
+    first, second = GameState(), GameState()
+    first.load(tmp_path / name)
+    second.load(tmp_path / name)
+    assert first.inventory == state.inventory
+    assert all(a is b for a, b in zip(first.inventory, second.inventory, strict=True))
@@ -0,0 +1,27 @@
+import sys
+
+from orison.engine import GameState
+from orison.engine.flags import declared_flags
+from orison.tools import footprint
+
+
+def test_game_state_is_slotted_with_interned_keys():
+    a, b = GameState(), GameState()
+    assert not hasattr(a, "__dict__")
+    a.set_flag("".join(["canals_", "black"]))
+    b.adjust_rep("".join(["scri", "bes"]), 1)
+    loaded = GameState.from_dict({"flags": {"".join(["canals_", "black"]): True}})
+    assert next(iter(a.flags)) is next(iter(loaded.flags)) is sys.intern("canals_black")
+    assert next(iter(b.reputation)) is sys.intern("scribes") and b.get_rep("scribes") == 1
+
+
+def test_footprint_report(capsys):
+    declared = declared_flags()
+    report = footprint.measure(200, marks=40, flags=30)
+    assert declared_flags() == declared  # the synthetic story flags are withdrawn again
+    assert set(report) >= {"total", "inventory", "flags", "reputation", "(object)"}
+    assert report["total"] == sum(v for k, v in report.items() if k != "total")
+    assert report["total"] < 4000  # regression guard for the synthetic shape above
+
+    assert footprint.main(["--sessions", "50"]) == 0
+    assert "B/session" in capsys.readouterr().out
@@ -0,0 +1,57 @@
+from types import MappingProxyType
+
+import pytest
+
+from orison.engine import GameState
+from orison.engine.flags import DELETED, FlagStore, declare_flags
+
+declare_flags("canals_black", "secret_clause_active", "visited_dock")
+
+
+def test_flag_store_is_dict_like_with_bitset_and_side_table():
+    flags = FlagStore({"canals_black": True, "policy": "secret", "visits": 3})
+    assert flags == {"canals_black": True, "policy": "secret", "visits": 3}
+    assert flags._other == {"policy": "secret", "visits": 3}  # only non-declared flags use the dict
+    assert flags.dirty == frozenset()
+
+    flags["visited_dock"] = False
+    assert "visited_dock" in flags and flags["visited_dock"] is False and flags.get("nope") is None
+    flags["canals_black"] = "unknown"  # a declared flag can still hold a typed value
+    assert flags["canals_black"] == "unknown" and len(flags) == 4
+    del flags["visits"]
+    assert flags.pop("visited_dock") is False
+    assert flags == {"canals_black": "unknown", "policy": "secret"}
+    assert flags.dirty == {"visited_dock", "canals_black", "visits"}
+
+    expected = {"visited_dock": DELETED, "canals_black": "unknown", "visits": DELETED}
+    assert flags.take_dirty() == expected
+    assert flags.take_dirty() == {}
+    assert FlagStore(MappingProxyType({"policy": "secret"})) == {"policy": "secret"}
+    assert FlagStore(flags) == flags  # any Mapping, not just dicts
+
+
+def test_game_state_uses_flag_store():
+    state = GameState()
+    state.flags = {"secret_clause_active": True}  # plain dicts are wrapped
+    assert isinstance(state.flags, FlagStore)
+    state.set_flag("policy", "public")
+    state.clear_flag("secret_clause_active")
+    assert state.flags.take_dirty() == {"policy": "public", "secret_clause_active": DELETED}
+
+    loaded = GameState.from_dict(state.to_dict())
+    assert loaded.flags == {"policy": "public"} and not loaded.flags.dirty
+
+
+def test_dirty_set_has_one_owner(tmp_path):
+    from orison.engine.journal import JournalStore
+
+    state = GameState()
+    store = JournalStore(tmp_path / "slot")
+    store.attach(state)
+    store.save(state)
+    state.set_flag("visited_dock", True)
+    with pytest.raises(RuntimeError, match="already consumed"):
+        state.flags.take_dirty()  # would steal the journal's change
+    assert store.save(state) > 0
+    store.detach(state)
+    assert state.flags.take_dirty("sync") == {} and state.flags.snapshot().take_dirty() == {}
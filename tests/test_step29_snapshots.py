@@ -0,0 +1,76 @@
+from orison.engine import GameState
+from orison.engine.journal import JournalStore
+from orison.engine.snapshot import CheckpointRing
+from orison.models import Mark
+
+
+def _state():
+    state = GameState(player_name="Tester", current_scene_id="decision")
+    state.add_mark(Mark.of("M-1", "witness", True))
+    state.set_flag("policy", "public")
+    state.set_flag("secret_clause_active", True)
+    state.adjust_rep("scribes", 1)
+    return state
+
+
+def test_snapshot_shares_until_written():
+    state = _state()
+    before = state.to_dict()
+    snap = state.snapshot()
+    assert snap.inventory._by_id is state.inventory._by_id
+    assert snap.reputation._data is state.reputation._data
+
+    state.adjust_rep("scribes", 5)
+    state.flags["policy"] = "secret"
+    assert snap.inventory._by_id is state.inventory._by_id  # untouched container still shared
+    state.add_mark(Mark.of("M-2", "seal"))
+    state.goto("end")
+    assert snap.to_dict() == before
+
+    state.restore(snap)
+    assert state.to_dict() == before
+    state.remove_mark("M-1")  # writing after restore must not leak into the snapshot
+    state.clear_flag("secret_clause_active")
+    assert snap.to_dict() == before and snap.to_state().to_dict() == before
+
+
+def test_checkpoint_ring_undo_and_branch():
+    state = _state()
+    ring = CheckpointRing(state, size=3)
+    for _ in range(5):
+        ring.push()
+        state.adjust_rep("mariners", 1)
+    assert len(ring) == 3 and state.get_rep("mariners") == 5
+
+    what_if = ring.peek(1).to_state()  # branch without touching the live state
+    what_if.adjust_rep("mariners", 100)
+    assert state.get_rep("mariners") == 5
+
+    seen = []
+    state.events.subscribe(lambda e: seen.append(type(e).__name__))
+    assert ring.undo() and state.get_rep("mariners") == 4
+    assert ring.undo() and ring.undo() and state.get_rep("mariners") == 2
+    assert not ring.undo() and seen == ["StateReset"] * 3
+
+
+def test_direct_reputation_writes_do_not_leak_into_snapshots(tmp_path):
+    state = _state()
+    snap = state.snapshot()
+    state.reputation["scribes"] = 99
+    del state.reputation["scribes"]
+    assert snap.reputation == {"scribes": 1}
+    state.restore(snap)
+    state.reputation["scribes"] = 99
+    state.restore(snap)
+    assert state.get_rep("scribes") == 1
+
+    journaled = GameState()
+    store = JournalStore(tmp_path / "slot")
+    store.attach(journaled)
+    store.save(journaled)
+    journaled.adjust_rep("scribes", 2)
+    store.save(journaled)
+    replayed = _state()
+    frame = replayed.snapshot()
+    JournalStore(tmp_path / "slot").load_into(replayed)  # replay writes reputation directly
+    assert replayed.get_rep("scribes") == 2 and frame.reputation == {"scribes": 1}
@@ -0,0 +1,73 @@
+import pytest
+
+from orison.engine import GameState
+from orison.engine.diff import apply_patch, decode_patch, diff, encode_patch
+from orison.models import Mark
+
+
+def _state():
+    state = GameState(player_name="Tester", current_scene_id="audit")
+    state.inventory = [Mark.of(f"M-{i}", "seal") for i in range(50)]
+    state.flags = {"canals_black": False, "policy": "public", "visits": 1}
+    state.reputation = {"scribes": 1, "mariners": -1}
+    return state
+
+
+def test_diff_roundtrip_over_the_wire_is_idempotent():
+    old = _state()
+    new = _state()
+    new.goto("decision")
+    new.set_flag("policy", "secret")
+    new.set_flag("visits", True)  # same == but different type still counts
+    new.clear_flag("canals_black")
+    new.adjust_rep("scribes", 2)
+    new.reputation = {k: v for k, v in new.reputation.items() if k != "mariners"}
+    new.remove_mark("M-3")
+    new.add_mark(Mark.of("M-WIT", "witness", True))
+    new.remove_mark("M-4")
+    new.add_mark(Mark.of("M-4", "sigil"))
+
+    patch = diff(old, new)
+    assert patch.scalars == {"current_scene_id": "decision"}
+    assert patch.flags_unset == ["canals_black"] and patch.rep_unset == ["mariners"]
+    assert sorted(patch.marks_removed) == ["M-3", "M-4"]
+
+    wire = encode_patch(patch)
+    assert len(wire) < len(str(new.to_dict())) / 4
+    replica = _state()
+    for _ in range(2):
+        apply_patch(replica, decode_patch(wire))
+        assert replica.to_dict() == new.to_dict()
+    assert not diff(replica, new)
+
+
+def test_diff_against_snapshot_skips_shared_containers():
+    state = _state()
+    snap = state.snapshot()
+    assert not diff(snap, state)
+    state.adjust_rep("scribes", 1)
+    patch = diff(snap, state)
+    assert patch.rep_set == {"scribes": 2} and not patch.marks_added and not patch.flags_set
+
+
+def test_decode_rejects_bad_payloads():
+    with pytest.raises(ValueError):
+        decode_patch(b"[2,{},{},[],{},[],[],[]]")
+    with pytest.raises(ValueError):
+        decode_patch(b"not json")
+
+
+def test_declared_flags_diff_by_bitmask():
+    from orison.engine.flags import declare_flags
+
+    declare_flags("canals_black", "visited_dock")
+    old = GameState()
+    old.flags = {"canals_black": True, "visited_dock": "maybe"}
+    new = GameState()
+    new.flags = {"canals_black": False, "visited_dock": True}
+    patch = diff(old, new)
+    assert patch.flags_set == {"canals_black": False, "visited_dock": True}
+    assert patch.flags_unset == []
+    apply_patch(old, patch)
+    assert old.flags == new.flags
+    assert sorted(diff(new, GameState()).flags_unset) == ["canals_black", "visited_dock"]
@@ -0,0 +1,58 @@
+from orison.engine import GameState
+from orison.engine.fingerprint import Projection, RenderCache
+from orison.io.terminal.app import SECRET_GATES, AuditScene, ConsoleIO
+from orison.models import Mark
+
+
+def _io(inputs):
+    it = iter(inputs)
+    io = ConsoleIO()
+    lines = []
+    io.write_line = lines.append  # type: ignore[assignment]
+    io.read_line = lambda prompt="": next(it)  # type: ignore[assignment]
+    return io, lines
+
+
+def test_fingerprint_is_stable_and_typed():
+    view = Projection(flags=("a", "b"), reputation=("scribes",), kinds=("sigil",), witness=True)
+    s1 = GameState(flags={"a": True, "b": 1, "other": 9})
+    s2 = GameState(flags={"b": 1, "a": True})
+    assert view.fingerprint(s1) == view.fingerprint(s2)  # order and unprojected flags ignored
+    s2.set_flag("b", True)
+    assert view.fingerprint(s1) != view.fingerprint(s2)  # True is not 1
+    s3 = GameState(flags={"a": True, "b": 1, "c": None})
+    s3.add_mark(Mark.of("S", "sigil"))
+    assert view.fingerprint(s1) != view.fingerprint(s3)
+    assert len(view.fingerprint(s1)) == 32
+
+
+def test_lru_eviction_and_counters():
+    cache = RenderCache(maxsize=2)
+    calls = []
+    for key in ["a", "b", "a", "c", "b"]:
+        cache.get_or_render("scene", key, lambda key=key: calls.append(key) or key)
+    assert calls == ["a", "b", "c", "b"]  # "b" was evicted when "c" arrived
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 4, 2, 2)
+
+
+def test_audit_scene_hits_cache_and_still_sets_canal_flag():
+    scene = AuditScene(render_cache=RenderCache())
+    rendered = []
+    original = scene.render
+    scene.render = lambda state: rendered.append(1) or original(state)  # type: ignore[method-assign]
+
+    first = GameState(current_scene_id="audit", flags={"secret_clause_active": True})
+    io, lines_a = _io(["1"])
+    scene.run(first, io, io)
+    second = GameState(current_scene_id="audit", flags={"secret_clause_active": True})
+    io, lines_b = _io(["1"])
+    scene.run(second, io, io)
+
+    assert len(rendered) == 1 and lines_a == lines_b
+    assert "Canal status: BLACK" in lines_b and second.flags["canals_black"] is True
+    assert scene.render_cache.stats().hits == 1
+
+
+def test_audit_view_projects_every_secret_gate():
+    assert set(SECRET_GATES.values()) <= set(AuditScene.AUDIT_VIEW.flags)
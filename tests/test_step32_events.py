@@ -0,0 +1,62 @@
+from orison.engine import GameState
+from orison.engine.events import (
+    RESET,
+    EventBatch,
+    EventBus,
+    FlagCleared,
+    FlagSet,
+    MarkAdded,
+    MarkRemoved,
+    RepAdjusted,
+    SceneChanged,
+)
+from orison.models import Mark
+
+
+def test_mutations_publish_typed_events():
+    state = GameState()
+    assert not state.events.active
+    seen = []
+    state.events.subscribe(seen.append)
+    mark = Mark.of("M-1", "seal")
+    state.goto("audit")
+    state.set_flag("canals_black")
+    state.clear_flag("canals_black")
+    state.clear_flag("canals_black")  # already gone: nothing to report
+    state.adjust_rep("scribes", 2)
+    state.add_mark(mark)
+    state.add_mark(mark)  # duplicate id: not added, not published
+    state.remove_mark("M-1")
+    state.restore(GameState().snapshot())
+    assert seen == [
+        SceneChanged("audit"),
+        FlagSet("canals_black", True),
+        FlagCleared("canals_black"),
+        RepAdjusted("scribes", 2),
+        MarkAdded(mark),
+        MarkRemoved("M-1"),
+        RESET,
+    ]
+
+
+def test_typed_subscribers_and_unsubscribe():
+    bus = EventBus()
+    scenes, everything = [], []
+    bus.subscribe(scenes.append, SceneChanged)
+    bus.subscribe(everything.append)
+    bus.publish(SceneChanged("intro"))
+    bus.publish(FlagSet("k", 1))
+    assert scenes == [SceneChanged("intro")] and len(everything) == 2
+    assert len(bus.handlers()) == 2 and bus.subscribed(scenes.append)
+    bus.unsubscribe(scenes.append)
+    bus.unsubscribe(everything.append)
+    assert not bus.active and bus.handlers() == []
+
+
+def test_batch_drains_and_drops_oldest():
+    state = GameState()
+    batch = state.events.subscribe(EventBatch(max_pending=2))
+    for scene in ("a", "b", "c"):
+        state.goto(scene)
+    assert len(batch) == 2 and batch.dropped == 1
+    assert batch.drain() == [SceneChanged("b"), SceneChanged("c")] and len(batch) == 0
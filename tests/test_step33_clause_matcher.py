@@ -0,0 +1,59 @@
+import itertools
+
+import pytest
+
+from orison.models import Contract
+from orison.models.matcher import PhraseMatcher
+
+
+def _legacy(x, y):
+    a, b = " ".join(x.clauses).lower(), " ".join(y.clauses).lower()
+    clear = lambda s: "keep canals clear" in s or "keep canal clear" in s  # noqa: E731
+    dump = lambda s: "dump" in s or "discharge" in s or "blackwater" in s  # noqa: E731
+    return (x.is_public and not y.is_public and clear(a) and dump(b)) or (
+        y.is_public and not x.is_public and clear(b) and dump(a)
+    )
+
+
+def test_matcher_finds_overlapping_and_nested_phrases():
+    m = PhraseMatcher({"he": ["he"], "she": ["she"], "hers": ["hers"], "x": ["his"]})
+    assert m.scan("ushers") == {"he", "she", "hers"}
+    assert m.scan("") == frozenset() and m.tags == {"he", "she", "hers", "x"}
+    with pytest.raises(ValueError):
+        PhraseMatcher({"bad": [""]})
+
+
+def test_conflicts_match_the_substring_rule():
+    texts = [
+        [],
+        ["Keep canals clear"],
+        ["keep canal", "clear"],  # phrases may span clauses, as in the joined text
+        ["KEEP CANAL CLEAR", "dumping ok"],
+        ["Discharge blackwater at night"],
+        ["no dumps"],
+        ["keep canals cleared"],
+    ]
+    variants = itertools.product(texts, (True, False))
+    contracts = [Contract(f"C-{i}", "t", list(c), pub) for i, (c, pub) in enumerate(variants)]
+    for x, y in itertools.product(contracts, repeat=2):
+        assert x.conflicts_with(y) == bool(_legacy(x, y)), (x, y)
+
+
+def test_tags_follow_reassigned_clauses():
+    secret = Contract("S", "waiver", ["Pay the lamplighters"], is_public=False)
+    public = Contract("P", "oath", ["Keep canals clear"])
+    assert public.tags == {"canals_clear"} and not public.conflicts_with(secret)
+    secret.clauses = ["Dump ballast"]
+    assert secret.tags == {"dumping"}
+    assert public.conflicts_with(secret) and secret.conflicts_with(public)
+    assert Contract("P", "oath", ["Keep canals clear"]) == public  # tags are not part of equality
+
+
+def test_clauses_cannot_go_stale_in_place():
+    public = Contract("P", "oath", ["Pay tithes"])
+    assert public.clauses == ("Pay tithes",)
+    with pytest.raises(AttributeError):
+        public.clauses.append("Keep canals clear")  # type: ignore[attr-defined]
+    public.clauses += ("Keep canals clear",)
+    assert public.tags == {"canals_clear"}
+    assert public.conflicts_with(Contract("S", "waiver", ["Dump ballast"], is_public=False))
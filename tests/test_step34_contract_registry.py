@@ -0,0 +1,82 @@
+import itertools
+import random
+
+import pytest
+
+from orison.engine import GameState
+from orison.engine.fingerprint import RenderCache
+from orison.io.terminal.app import AuditScene, ConsoleIO
+from orison.models import Contract, ContractRegistry
+
+
+def _oath(i):
+    return Contract(f"P-{i}", "oath", ["Keep canals clear"])
+
+
+def _waiver(i, clause="Dump ballast"):
+    return Contract(f"S-{i}", "waiver", [clause], is_public=False)
+
+
+def _ids(pairs):
+    return {(p.id, s.id) for p, s in pairs}
+
+
+def test_add_and_revoke_keep_conflicts_current():
+    ledger = ContractRegistry([_oath(1), _waiver(1), _waiver(2, "Pay the lamplighters")])
+    assert _ids(ledger.conflicts()) == {("P-1", "S-1")}
+    assert [c.id for c in ledger.add(_oath(2))] == ["S-1"]
+    assert [c.id for c in ledger.public()] == ["P-1", "P-2"] and len(ledger.secret()) == 2
+    assert {c.id for c in ledger.conflicts_for("S-1")} == {"P-1", "P-2"}
+
+    version = ledger.version
+    assert ledger.revoke("S-1").id == "S-1" and ledger.version > version
+    assert ledger.conflicts() == [] and ledger.conflicts_for("P-1") == []
+    assert "S-1" not in ledger and len(ledger) == 3
+    with pytest.raises(ValueError):
+        ledger.add(_oath(1))
+    with pytest.raises(KeyError):
+        ledger.revoke("S-1")
+
+
+def test_incremental_conflicts_match_all_pairs():
+    rng = random.Random(3)
+    clauses = [
+        "Keep canals clear",
+        "keep canal clear",
+        "Dump ballast",
+        "Discharge at dawn",
+        "Pay tithes",
+        "blackwater",
+    ]
+    ledger = ContractRegistry()
+    live = {}
+    for n in range(300):
+        if live and rng.random() < 0.3:
+            live.pop(ledger.revoke(rng.choice(sorted(live))).id)
+        else:
+            c = Contract(f"C-{n}", "t", rng.sample(clauses, 2), rng.random() < 0.5)
+            ledger.add(c)
+            live[c.id] = c
+        expected = {
+            (a.id, b.id)
+            for a, b in itertools.permutations(live.values(), 2)
+            if a.is_public and a.conflicts_with(b)
+        }
+        assert _ids(ledger.conflicts()) == expected and ledger.conflict_count() == len(expected)
+
+
+def test_audit_reads_ledger_and_rerenders_when_it_changes():
+    ledger = ContractRegistry([_oath(1)])
+    scene = AuditScene(render_cache=RenderCache(), ledger=ledger)
+    io = ConsoleIO()
+    out = []
+    io.write_line = out.append  # type: ignore[assignment]
+    io.read_line = lambda prompt="": "1"  # type: ignore[assignment]
+
+    state = GameState(current_scene_id="audit")
+    scene.run(state, io, io)
+    assert "Canal status: CLEAR" in out and state.flags["canals_black"] is False
+    ledger.add(_waiver(9))  # ungated secret: in force for every session
+    out.clear()
+    scene.run(state, io, io)
+    assert "Canal status: BLACK" in out and state.flags["canals_black"] is True
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from orison.models import Contract
+from orison.models.bulk_audit import bulk_audit
+
+_CLAUSES = (
+    "Keep canals clear",
+    "keep canal clear",
+    "Pay tithes",
+    "Dump ballast",
+    "blackwater casks",
+)
+
+
+def _ledger(n=60, seed=5):
+    rng = random.Random(seed)
+    return [Contract(f"C-{i}", "t", rng.sample(_CLAUSES, 2), rng.random() < 0.5) for i in range(n)]
+
+
+def _expected(contracts):
+    public = [c for c in contracts if c.is_public]
+    secret = [c for c in contracts if not c.is_public]
+    return [(p.id, s.id) for p in public for s in secret if p.conflicts_with(s)]
+
+
+def test_python_backend_matches_pairwise_checks():
+    contracts = _ledger()
+    result = bulk_audit(contracts, backend="python")
+    assert result.backend == "python" and result.pairs == _expected(contracts)
+    assert set(result.counts) == {c.id for c in contracts}
+    for c in contracts:
+        assert result.counts[c.id] == sum(c.id in pair for pair in result.pairs)
+    assert len(result.public) + len(result.secret) == len(contracts)
+
+
+def test_empty_and_bad_backend():
+    assert bulk_audit([], backend="python").pairs == []
+    with pytest.raises(ValueError):
+        bulk_audit([], backend="gpu")
+
+
+def test_numpy_backend_is_identical():
+    pytest.importorskip("numpy")
+    contracts = _ledger(400, seed=9)
+    fast = bulk_audit(contracts, backend="numpy", chunk=64)  # several chunks
+    slow = bulk_audit(contracts, backend="python")
+    assert fast.backend == "numpy"
+    assert (fast.pairs, fast.counts) == (slow.pairs, slow.counts)
+    assert (fast.public, fast.secret) == (slow.public, slow.secret)
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from orison.models.arbiter import CorpusArbiter, TerminalArbiter, load_hint_corpus
+
+MEMORIES = [
+    "",
+    "   ",
+    "I saw the CANAL",
+    "down at the dock",
+    "a dock by the canal",
+    "nothing at all",
+]
+
+
+def test_default_corpus_matches_terminal_arbiter():
+    corpus, terminal = CorpusArbiter(), TerminalArbiter()
+    for memory in MEMORIES:
+        assert corpus.trade_memory_for_hint(memory) == terminal.trade_memory_for_hint(memory)
+    expected = "The canals hide more than water. Check th ledger for missing report."
+    assert corpus.trade_memory_for_hint("canal") == expected
+
+
+def test_priority_wins_and_replies_are_cached(tmp_path):
+    path = tmp_path / "hints.json"
+    path.write_text(json.dumps({
+        "empty": "?", "default": "-",
+        "hints": [
+            {"id": "low", "keywords": ["bell"], "hint": "low", "priority": 1},
+            {"id": "high", "keywords": ["Lamp", "wick"], "hint": "high", "priority": 5},
+        ],
+    }))
+    arbiter = CorpusArbiter(load_hint_corpus(path), cache_size=2)
+    assert arbiter.trade_memory_for_hint("a bell and a WICK") == "high"
+    assert arbiter.trade_memory_for_hint("bell") == "low"
+    assert arbiter.trade_memory_for_hint("bell") == "low"
+    info = arbiter.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_malformed_corpus(tmp_path):
+    path = tmp_path / "hints.json"
+    path.write_text('{"hints": [{"id": "x"}]}')
+    with pytest.raises(ValueError):
+        load_hint_corpus(path)
+
+
+@pytest.mark.parametrize("keywords", ["canal", [], ["canal", ""], ["canal", 3]])
+def test_keywords_must_be_a_list_of_strings(tmp_path, keywords):
+    path = tmp_path / "hints.json"
+    hints = [{"id": "x", "keywords": keywords, "hint": "h"}]
+    path.write_text(json.dumps({"empty": "?", "default": "-", "hints": hints}))
+    with pytest.raises(ValueError, match="malformed hint corpus"):
+        load_hint_corpus(path)
@@ -0,0 +1,127 @@
+import asyncio
+
+from orison.engine import GameState, Lookup
+from orison.io.terminal.app import ArbiterScene
+from orison.models.arbiter import TerminalArbiter
+from orison.server import Session, SessionHost
+from orison.server.hints import AsyncArbiterClient, HintServer, SocketHintBackend
+
+CANAL = TerminalArbiter().trade_memory_for_hint("canal")
+
+
+def test_client_coalesces_and_falls_back_on_timeout():
+    calls = []
+
+    async def slow(memory):
+        calls.append(memory)
+        await asyncio.sleep(0.05)
+        return f"remote: {memory}"
+
+    async def main():
+        client = AsyncArbiterClient(slow, deadline=1.0)
+        memories = ["canal", "canal", "dock", "canal"]
+        replies = await asyncio.gather(*(client.hint(m) for m in memories))
+        hurried = AsyncArbiterClient(slow, deadline=0.01)
+        late = await hurried.hint("canal")
+        return replies, client.stats(), late, hurried.stats()
+
+    replies, stats, late, hurried = asyncio.run(main())
+    assert replies == ["remote: canal", "remote: canal", "remote: dock", "remote: canal"]
+    assert (stats.requests, stats.backend_calls, stats.coalesced) == (4, 2, 2)
+    assert late == CANAL and hurried.timeouts == 1  # TerminalArbiter's answer
+
+
+def test_client_falls_back_on_backend_error():
+    async def broken(memory):
+        raise ConnectionError("down")
+
+    async def aborted(memory):
+        raise asyncio.CancelledError  # the shared call dies, the caller does not
+
+    async def main():
+        client = AsyncArbiterClient(broken)
+        first = await client.hint("dock")
+        client.backend = aborted
+        return first, await client.hint("dock"), client.stats()
+
+    first, second, stats = asyncio.run(main())
+    assert first == second == TerminalArbiter().trade_memory_for_hint("dock") and stats.errors == 2
+
+
+def test_socket_backend_against_stand_in_server():
+    async def main():
+        server = HintServer(delay=0.01)
+        await server.start()
+        backend = SocketHintBackend("127.0.0.1", server.port)
+        try:
+            replies = await asyncio.gather(*(backend(m) for m in ["canal", "dock", "rain"] * 5))
+        finally:
+            await backend.close()
+            await server.close()
+        return replies, server.served
+
+    replies, served = asyncio.run(main())
+    local = TerminalArbiter()
+    assert replies[:3] == [local.trade_memory_for_hint(m) for m in ["canal", "dock", "rain"]]
+    assert served == 15
+
+
+def test_session_defers_hint_lookup():
+    session = Session("s1", state=GameState(current_scene_id="arbiter"), defer_lookups=True)
+    session.start()
+    out = session.feed("I saw the canal")
+    assert isinstance(session.lookup, Lookup) and session.lookup.arg == "I saw the canal"
+    assert session.prompt == "" and not any("hint" in line for line in out)
+    out = session.resolve("remote hint")
+    assert "Arbiter's hint: remote hint" in out and session.prompt == "Choose [1]: "
+
+    inline = Session(
+        "s2", state=GameState(current_scene_id="arbiter"), scenes={"arbiter": ArbiterScene()}
+    )
+    inline.start()
+    assert f"Arbiter's hint: {CANAL}" in inline.feed("canal") and inline.lookup is None
+
+
+def test_host_resolves_lookups_asynchronously():
+    async def backend(memory):
+        await asyncio.sleep(0.01)
+        return f"remote: {memory}"
+
+    async def main():
+        client = AsyncArbiterClient(backend, deadline=1.0)
+        host = SessionHost(lookups={"hint": client.hint})
+        await host.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", host.port)
+            # name, intro -> audit, audit -> arbiter, memory, back to intro, quit
+            writer.write(b"Tester\n1\n4\nthe canal\n1\n3\n")
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+        finally:
+            await host.close()
+        return data.decode(), client.stats()
+
+    out, stats = asyncio.run(main())
+    assert "Arbiter's hint: remote: the canal" in out and stats.backend_calls == 1
+
+
+def test_request_after_abandoned_call_gets_a_fresh_call():
+    calls = []
+
+    async def slow(memory):
+        calls.append(memory)
+        await asyncio.sleep(0.05)
+        return "remote"
+
+    async def main():
+        client = AsyncArbiterClient(slow, deadline=0.01)
+        first = await client.hint("canal")  # times out; the shared call is cancelled
+        second = await client.hint("canal")  # must not join the cancelled call
+        client.deadline = 1.0
+        third = await client.hint("canal")
+        return first, second, third, client.stats()
+
+    first, second, third, stats = asyncio.run(main())
+    assert first == second == CANAL and third == "remote"
+    assert stats.backend_calls == 3 and stats.timeouts == 2 and stats.errors == 0